@@ -5,17 +5,24 @@ Agent Loader voor Baarn Raadsinformatie Server.
 Laadt agent definities uit YAML bestanden.
 """
 
+import os
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 
 from shared.logging_config import get_logger
 
+# LibYAML parser indien beschikbaar (veel sneller), anders pure-Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = get_logger('agents')
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentArgument:
     """Argument voor een agent prompt."""
     name: str
@@ -23,14 +30,14 @@ class AgentArgument:
     required: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentPrompt:
     """MCP Prompt configuratie."""
     description: str
     arguments: List[AgentArgument] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDefinition:
     """Volledige agent definitie."""
     name: str
@@ -42,6 +49,16 @@ class AgentDefinition:
     metadata: Dict[str, Any] = field(default_factory=dict)
     examples: List[Dict[str, str]] = field(default_factory=list)
     related_agents: List[str] = field(default_factory=list)
+    # Afgeleid bij het laden: system prompt plus scheiding, en welke context nodig is
+    prompt_prefix: str = field(init=False, repr=False, compare=False)
+    context_fields: frozenset = field(init=False, repr=False, compare=False)
+    include_stats: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.prompt_prefix = f'{self.system_prompt}\n\n'
+        self.context_fields = frozenset(arg.name for arg in self.prompt.arguments)
+        # Opt-out via metadata: include_stats: false
+        self.include_stats = bool(self.metadata.get('include_stats', True))
 
     @classmethod
     def from_yaml(cls, data: Dict) -> 'AgentDefinition':
@@ -111,37 +128,66 @@ class AgentLoader:
         self.agents_dir = Path(agents_dir)
         self._agents: Dict[str, AgentDefinition] = {}
         self._loaded = False
+        self._signature: Optional[Dict[str, Tuple[int, int]]] = None
+        # path -> ((mtime_ns, size), parsed agent) so unchanged files are not parsed again
+        self._file_cache: Dict[str, Tuple[Tuple[int, int], Optional[AgentDefinition]]] = {}
+
+    def _scan_files(self) -> Optional[Dict[str, Tuple[int, int]]]:
+        """(mtime_ns, size) per YAML file, or None if the directory is missing."""
+        try:
+            files = {}
+            for entry in os.scandir(self.agents_dir):
+                if entry.name.endswith('.yaml'):
+                    stat = entry.stat()
+                    files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            return files
+        except OSError:
+            return None
 
     def load_agents(self) -> Dict[str, AgentDefinition]:
-        """Load all agent definitions from YAML files."""
-        if self._loaded:
+        """Load all agent definitions from YAML files (only changed files are re-parsed)."""
+        files = self._scan_files()
+        if self._loaded and files == self._signature:
             return self._agents
 
         self._agents = {}
+        self._signature = files
 
-        if not self.agents_dir.exists():
+        if files is None:
             logger.warning(f'Agents directory not found: {self.agents_dir}')
             return self._agents
 
         # Load all YAML files
-        for yaml_file in self.agents_dir.glob('*.yaml'):
-            try:
-                agent = self._load_agent_file(yaml_file)
-                if agent:
-                    self._agents[agent.name] = agent
-                    logger.debug(f'Loaded agent: {agent.name}')
-            except Exception as e:
-                logger.error(f'Failed to load agent from {yaml_file}: {e}')
+        parsed = 0
+        for path in sorted(files):
+            cached = self._file_cache.get(path)
+            if cached is not None and cached[0] == files[path]:
+                agent = cached[1]
+            else:
+                try:
+                    agent = self._load_agent_file(Path(path))
+                    parsed += 1
+                except Exception as e:
+                    logger.error(f'Failed to load agent from {path}: {e}')
+                    agent = None
+                self._file_cache[path] = (files[path], agent)
+            if agent:
+                self._agents[agent.name] = agent
+                logger.debug(f'Loaded agent: {agent.name}')
+
+        # Forget removed files
+        for path in set(self._file_cache) - set(files):
+            del self._file_cache[path]
 
         self._loaded = True
-        logger.info(f'Loaded {len(self._agents)} agents')
+        logger.info(f'Loaded {len(self._agents)} agents ({parsed} files parsed)')
         return self._agents
 
     def _load_agent_file(self, file_path: Path) -> Optional[AgentDefinition]:
         """Load a single agent definition file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
 
             if not data:
                 return None
@@ -154,14 +200,12 @@ class AgentLoader:
 
     def get_agent(self, name: str) -> Optional[AgentDefinition]:
         """Get agent by name."""
-        if not self._loaded:
-            self.load_agents()
+        self.load_agents()
         return self._agents.get(name)
 
     def get_agents(self, category: str = None) -> List[AgentDefinition]:
         """Get all agents, optionally filtered by category."""
-        if not self._loaded:
-            self.load_agents()
+        self.load_agents()
 
         agents = list(self._agents.values())
 
@@ -172,15 +216,13 @@ class AgentLoader:
 
     def get_mcp_prompts(self) -> List[Dict]:
         """Get all agents as MCP prompts."""
-        if not self._loaded:
-            self.load_agents()
+        self.load_agents()
 
         return [agent.to_mcp_prompt() for agent in self._agents.values()]
 
     def get_categories(self) -> List[str]:
         """Get all unique categories."""
-        if not self._loaded:
-            self.load_agents()
+        self.load_agents()
 
         return list(set(a.category for a in self._agents.values()))
 
@@ -188,6 +230,7 @@ class AgentLoader:
         """Reload all agent definitions."""
         self._loaded = False
         self._agents = {}
+        self._file_cache = {}
         self.load_agents()
 
 
@@ -9,7 +9,6 @@ maar via REST endpoints. Geschikt voor ChatGPT Actions en andere integraties.
 Authenticatie via X-API-Key header.
 """
 
-import base64
 import os
 from contextlib import asynccontextmanager
 from datetime import date, timedelta
@@ -297,7 +296,6 @@ async def upload_file(
     if len(file_bytes) > max_size:
         raise HTTPException(status_code=413, detail="File too large for DB storage")
 
-    file_base64 = base64.b64encode(file_bytes).decode('ascii')
     filename = file.filename or 'upload.bin'
     mime_type = file.content_type or 'application/octet-stream'
 
@@ -305,7 +303,8 @@ async def upload_file(
         provider = get_visit_report_provider()
         report_id = provider.add_manual_visit_report(
             title=title,
-            file_base64=file_base64,
+            file_base64=None,
+            file_bytes=file_bytes,
             filename=filename,
             mime_type=mime_type,
             date=date,
@@ -321,11 +320,11 @@ async def upload_file(
         return {"success": True, "visit_report_id": report_id}
 
     doc_provider = get_document_provider()
-    document_id = doc_provider.create_document_from_base64(
+    document_id = doc_provider.create_document_from_bytes(
         title=title,
         filename=filename,
         mime_type=mime_type,
-        file_base64=file_base64,
+        file_bytes=file_bytes,
         source_url=source_url
     )
     return {"success": True, "document_id": document_id}
@@ -848,19 +847,11 @@ async def search_documents(
     Inclusief download URLs naar de originele documenten.
     """
     provider = get_document_provider()
-    results = provider.search_documents(query, limit)
+    results = provider.search_document_matches(query, limit)
     return {
         "query": query,
         "count": len(results),
-        "results": [
-            {
-                "id": d['id'],
-                "title": d['title'],
-                "url": d.get('url') or (f"https://api.notubiz.nl/document/{d['notubiz_id']}/1" if d.get('notubiz_id') else None),
-                "match_type": d.get('match_type', [])
-            }
-            for d in results
-        ]
+        "results": results
     }
 
 
@@ -22,6 +22,8 @@ class Config:
     DATA_DIR = BASE_DIR / 'data'
     DOCUMENTS_DIR = DATA_DIR / 'documents'
     CACHE_DIR = DATA_DIR / 'cache'
+    # Alleen bestanden in deze map mogen als file_path worden aangeleverd
+    UPLOAD_DIR = Path(os.getenv('UPLOAD_DIR', str(DATA_DIR / 'uploads')))
     CONFIGS_DIR = BASE_DIR / 'configs'
 
     # Ensure directories exist
@@ -29,6 +31,7 @@ class Config:
     DATA_DIR.mkdir(exist_ok=True)
     DOCUMENTS_DIR.mkdir(exist_ok=True)
     CACHE_DIR.mkdir(exist_ok=True)
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
     # ===== Database =====
     DB_PATH = DATA_DIR / os.getenv('DB_PATH', 'baarn.db').replace('data/', '')
@@ -57,6 +60,8 @@ class Config:
 
     # ===== Logging =====
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    # Ingesprongen JSON in MCP responses (alleen voor debuggen; standaard compact)
+    DEBUG_PRETTY_JSON = os.getenv('DEBUG_PRETTY_JSON', 'false').lower() == 'true'
 
     # ===== Cache =====
     CACHE_TTL_HOURS = int(os.getenv('CACHE_TTL_HOURS', '24'))
@@ -67,6 +72,35 @@ class Config:
         'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'
     )
     # Embeddings zijn VERPLICHT voor semantic search - geen optionele configuratie meer
+    # Inference backend: torch (default), onnx of openvino (sentence-transformers >= 3.2)
+    EMBEDDINGS_BACKEND = os.getenv('EMBEDDINGS_BACKEND', 'torch').lower()
+    # Device voor torch backend: auto (cuda met fp16 indien beschikbaar), cpu of cuda
+    EMBEDDINGS_DEVICE = os.getenv('EMBEDDINGS_DEVICE', 'auto').lower()
+    # Optioneel: specifiek (gequantiseerd) ONNX/OpenVINO bestand, bijv. onnx/model_qint8_avx512_vnni.onnx
+    EMBEDDINGS_MODEL_FILE = os.getenv('EMBEDDINGS_MODEL_FILE', None)
+    # Geexporteerde ONNX/OpenVINO modellen worden hier bewaard zodat export maar 1x nodig is
+    MODELS_DIR = DATA_DIR / 'models'
+    # Vanaf dit aantal chunks een HNSW index gebruiken (indien hnswlib geinstalleerd)
+    ANN_MIN_CHUNKS = int(os.getenv('ANN_MIN_CHUNKS', '50000'))
+    # HNSW zoekbreedte: hoger = betere recall, trager
+    ANN_EF_SEARCH = int(os.getenv('ANN_EF_SEARCH', '100'))
+    # HNSW graaf: verbindingen per knoop (hoger = betere recall, meer geheugen)
+    ANN_M = int(os.getenv('ANN_M', '16'))
+    # Vanaf dit aantal chunks eerst voorselectie op binaire (sign-bit) codes, daarna fp32 rerank
+    BINARY_SEARCH_MIN_CHUNKS = int(os.getenv('BINARY_SEARCH_MIN_CHUNKS', '200000'))
+    # Aantal kandidaten voor de rerank = limit * factor
+    BINARY_RERANK_FACTOR = int(os.getenv('BINARY_RERANK_FACTOR', '4'))
+    # Vanaf dit aantal chunks eerst voorselectie op int8 embeddings (4x kleiner, vereist numba), daarna fp32 rerank
+    INT8_SEARCH_MIN_CHUNKS = int(os.getenv('INT8_SEARCH_MIN_CHUNKS', '20000'))
+    # Aantal kandidaten voor de int8 rerank = limit * factor
+    INT8_RERANK_FACTOR = int(os.getenv('INT8_RERANK_FACTOR', '2'))
+    # Vanaf dit aantal chunks de Numba kernel gebruiken voor de similarity scan (indien numba geinstalleerd)
+    NUMBA_MIN_CHUNKS = int(os.getenv('NUMBA_MIN_CHUNKS', '10000'))
+    # Cache voor zoekresultaten: dezelfde zoekvraag (zelfde tekst en limit) direct beantwoorden
+    SEARCH_CACHE_SIZE = int(os.getenv('SEARCH_CACHE_SIZE', '256'))  # 0 = uit
+    SEARCH_CACHE_TTL = int(os.getenv('SEARCH_CACHE_TTL', '300'))  # seconden
+    # Aantal query embeddings in het geheugen (herhaalde zoekvragen zonder model aanroep)
+    QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv('QUERY_EMBEDDING_CACHE_SIZE', '512'))  # 0 = uit
 
     # ===== Transcriptie (Whisper) =====
     WHISPER_MODEL = os.getenv('WHISPER_MODEL', 'small')  # tiny, base, small, medium, large-v3
@@ -78,12 +112,18 @@ class Config:
     MCP_PROTOCOL_VERSION = '2024-11-05'
     SERVER_NAME = 'baarn-raadsinformatie'
     SERVER_VERSION = '2.0.0'
+    # Aantal threads voor tool calls (blokkerende DB/API/model calls buiten de event loop)
+    MCP_TOOL_WORKERS = int(os.getenv('MCP_TOOL_WORKERS', '4'))
 
     # ===== Auto Sync =====
     AUTO_SYNC_ENABLED = os.getenv('AUTO_SYNC_ENABLED', 'true').lower() == 'true'
     AUTO_SYNC_DAYS = int(os.getenv('AUTO_SYNC_DAYS', '365'))  # Hoeveel dagen terug bij eerste sync
     AUTO_DOWNLOAD_DOCS = os.getenv('AUTO_DOWNLOAD_DOCS', 'true').lower() == 'true'
+    # Aantal documenten dat tegelijk gedownload (en verwerkt) wordt
+    DOWNLOAD_WORKERS = int(os.getenv('DOWNLOAD_WORKERS', '4'))
     AUTO_INDEX_DOCS = os.getenv('AUTO_INDEX_DOCS', 'true').lower() == 'true'  # Embeddings indexeren (default: aan)
+    # Aantal processen voor indexeren (1 = serieel; elk proces laadt een eigen model in geheugen)
+    INDEX_WORKERS = int(os.getenv('INDEX_WORKERS', '1'))
 
     # Full history sync - haalt ALLE beschikbare data op (kan lang duren!)
     # Standaard aan voor volledige historische zoekfunctionaliteit
@@ -135,7 +175,8 @@ class Config:
             },
             'features': {
                 'embeddings_enabled': True,  # Altijd aan (verplicht)
-                'embeddings_model': cls.EMBEDDINGS_MODEL
+                'embeddings_model': cls.EMBEDDINGS_MODEL,
+                'embeddings_backend': cls.EMBEDDINGS_BACKEND
             }
         }
 
@@ -5,11 +5,15 @@ Database module voor Baarn Politiek MCP Server.
 SQLite database voor meetings, documents, en annotations.
 """
 
+import os
+import re
 import sqlite3
 import json
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from contextlib import contextmanager
 
 from .config import Config
@@ -17,6 +21,16 @@ from shared.logging_config import get_logger
 
 logger = get_logger('database')
 
+# Maximaal aantal gecachte gremium lookups
+GREMIUM_CACHE_SIZE = 256
+
+# Maximaal aantal meeting ids per IN (...) query in get_meeting_bundles
+MEETING_BUNDLE_BATCH_SIZE = 500
+
+
+class _Connection(sqlite3.Connection):
+    """sqlite3 connection that supports weak references (for the connection registry)."""
+
 
 class Database:
     """SQLite database manager voor politieke documenten."""
@@ -24,6 +38,15 @@ class Database:
     def __init__(self, db_path: Path = None):
         """Initialize database connection."""
         self.db_path = db_path or Config.DB_PATH
+        # Gremia wijzigen zelden: losse lookups cachen, geleegd bij upsert_gremium
+        self._gremium_cache: Dict[Tuple[int, bool], Dict] = {}
+        # Eén verbinding per thread, hergebruikt tussen queries
+        self._local = threading.local()
+        # Alle open verbindingen (alle threads), zodat close() ze allemaal kan sluiten
+        self._connections: weakref.WeakSet = weakref.WeakSet()
+        self._connections_lock = threading.Lock()
+        # Opgehoogd door close(); verbindingen van een oudere generatie worden heropend
+        self.generation = 0
         self._ensure_db_dir()
         self._init_schema()
         logger.info(f'Database initialized: {self.db_path}')
@@ -32,11 +55,14 @@ class Database:
         """Ensure database directory exists."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    @contextmanager
-    def _get_connection(self):
-        """Context manager for database connections."""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with the standard pragmas applied."""
+        # check_same_thread=False: each connection is still used by one thread,
+        # but close() must be able to close it from another
+        conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False, factory=_Connection)
         conn.row_factory = sqlite3.Row
+        with self._connections_lock:
+            self._connections.add(conn)
         # Enable WAL mode for better crash recovery and concurrent access
         conn.execute('PRAGMA journal_mode=WAL')
         # FULL sync: wait for data to be written to disk before continuing
@@ -45,15 +71,57 @@ class Database:
         conn.execute('PRAGMA wal_autocheckpoint=100')  # Checkpoint more frequently
         conn.execute('PRAGMA busy_timeout=60000')  # 60 second timeout for locks
         conn.execute('PRAGMA foreign_keys=ON')
+        conn.execute('PRAGMA temp_store=MEMORY')  # Sorts/temp tables in memory
+        conn.execute('PRAGMA mmap_size=268435456')  # Read pages via mmap (256 MB)
+        return conn
+
+    @contextmanager
+    def _get_connection(self):
+        """Context manager for database connections.
+
+        Each thread keeps one open connection, so queries skip the
+        connect-and-pragma setup. Only the outermost block commits or
+        rolls back.
+        """
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid() or local.generation != self.generation:
+            # New thread, a forked child that must not share the parent's
+            # connection, or a connection closed by close()
+            local.conn = self._connect()
+            local.pid = os.getpid()
+            local.generation = self.generation
+            local.depth = 0
+        conn = local.conn
+        local.depth += 1
         try:
             yield conn
-            conn.commit()
+            if local.depth == 1:
+                conn.commit()
         except Exception as e:
-            conn.rollback()
-            logger.error(f'Database error: {e}')
+            if local.depth == 1:
+                conn.rollback()
+                logger.error(f'Database error: {e}')
             raise
         finally:
-            conn.close()
+            local.depth -= 1
+
+    def close(self):
+        """
+        Close every connection opened by this Database, in all threads.
+
+        Threads (and DocumentIndex) open a new connection on next use, e.g.
+        to the file that restore_from_schema_backup moved into place.
+        """
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections = weakref.WeakSet()
+            self.generation += 1
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f'Could not close database connection: {e}')
+        self._local.__dict__.clear()
 
     def execute_sql(self, sql: str, params: tuple = ()) -> int:
         """Execute raw SQL and return rows affected."""
@@ -283,6 +351,12 @@ class Database:
                 )
             ''')
 
+            # Content hash per chunk, used to skip re-encoding unchanged chunks
+            cursor.execute('PRAGMA table_info(embeddings)')
+            embedding_columns = {row['name'] for row in cursor.fetchall()}
+            if 'chunk_hash' not in embedding_columns:
+                cursor.execute('ALTER TABLE embeddings ADD COLUMN chunk_hash BLOB')
+
             # Sync status table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS sync_status (
@@ -584,6 +658,9 @@ class Database:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_unique_images_hash ON unique_images(image_hash)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_agenda_items_meeting ON agenda_items(meeting_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_annotations_document ON annotations(document_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_annotations_meeting ON annotations(meeting_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_embeddings_document ON embeddings(document_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_embeddings_chunk_hash ON embeddings(chunk_hash)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_visit_reports_date ON visit_reports(date)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_visit_reports_status ON visit_reports(status)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_visit_report_meetings_meeting ON visit_report_meetings(meeting_id)')
@@ -595,6 +672,7 @@ class Database:
             # Standpunten indexes
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_raadsleden_party ON raadsleden(party_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_raadsleden_active ON raadsleden(active)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_raadsleden_party_active ON raadsleden(party_id, active)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_standpunten_party ON standpunten(party_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_standpunten_raadslid ON standpunten(raadslid_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_standpunten_topic ON standpunten(topic)')
@@ -617,8 +695,101 @@ class Database:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_dossier_items_dossier ON dossier_items(dossier_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_dossier_items_type ON dossier_items(item_type, item_id)')
 
+            # Full-text index for keyword search on documents
+            self._fts_enabled = self._init_fts(cursor)
+
+            # Change counter for cached embedding matrices
+            self._init_embeddings_version(cursor)
+
             logger.info('Database schema initialized')
 
+    def _init_fts(self, cursor) -> bool:
+        """
+        Create the FTS5 index over document titles and texts.
+
+        The trigram tokenizer matches any substring of 3+ characters, like the
+        LIKE '%...%' search it replaces, but from an index. Triggers keep it
+        in sync with the documents table; a new index is filled once with
+        'rebuild'. Returns False when this SQLite build has no FTS5 trigram
+        tokenizer (SQLite < 3.34); search then falls back to LIKE.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'documents_fts'")
+        exists = cursor.fetchone() is not None
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                    title, text_content,
+                    content='documents', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            logger.warning(f'FTS5 trigram index unavailable, keyword search uses LIKE: {e}')
+            return False
+
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS documents_fts_insert AFTER INSERT ON documents BEGIN
+                INSERT INTO documents_fts(rowid, title, text_content)
+                VALUES (new.id, new.title, new.text_content);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS documents_fts_delete AFTER DELETE ON documents BEGIN
+                INSERT INTO documents_fts(documents_fts, rowid, title, text_content)
+                VALUES ('delete', old.id, old.title, old.text_content);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS documents_fts_update
+            AFTER UPDATE OF title, text_content ON documents BEGIN
+                INSERT INTO documents_fts(documents_fts, rowid, title, text_content)
+                VALUES ('delete', old.id, old.title, old.text_content);
+                INSERT INTO documents_fts(rowid, title, text_content)
+                VALUES (new.id, new.title, new.text_content);
+            END
+        ''')
+
+        if not exists:
+            logger.info('Building full-text index for documents')
+            cursor.execute("INSERT INTO documents_fts(documents_fts) VALUES ('rebuild')")
+        return True
+
+    def _init_embeddings_version(self, cursor, new_epoch: bool = False):
+        """
+        Create the embeddings change counter.
+
+        Triggers bump 'version' on every insert, update and delete in
+        embeddings, also from other processes, so a cached matrix can tell
+        whether it is stale. 'epoch' identifies the database file; a new
+        one after a restore keeps caches of the old file from matching.
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS embeddings_version (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                epoch TEXT NOT NULL,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        cursor.execute(
+            'INSERT OR IGNORE INTO embeddings_version (id, epoch, version) VALUES (1, ?, 0)',
+            (os.urandom(8).hex(),)
+        )
+        if new_epoch:
+            cursor.execute('UPDATE embeddings_version SET epoch = ?', (os.urandom(8).hex(),))
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS embeddings_version_{event.lower()}
+                AFTER {event} ON embeddings BEGIN
+                    UPDATE embeddings_version SET version = version + 1 WHERE id = 1;
+                END
+            ''')
+
+    def get_embeddings_version(self, conn: sqlite3.Connection = None) -> list:
+        """[epoch, version] of the embeddings table; changes with every write to it."""
+        if conn is not None:
+            return list(conn.execute('SELECT epoch, version FROM embeddings_version WHERE id = 1').fetchone())
+        with self._get_connection() as conn:
+            return self.get_embeddings_version(conn)
+
     # ==================== Gremia ====================
 
     def upsert_gremium(self, notubiz_id: str, name: str, **kwargs) -> int:
@@ -634,6 +805,7 @@ class Database:
                     type = excluded.type,
                     updated_at = CURRENT_TIMESTAMP
             ''', (notubiz_id, name, kwargs.get('description'), kwargs.get('type')))
+            self._gremium_cache.clear()
             return cursor.lastrowid
 
     def get_gremia(self, active_only: bool = True) -> List[Dict]:
@@ -646,6 +818,26 @@ class Database:
             cursor.execute(query)
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_gremium(self, gremium_id: int, active_only: bool = True) -> Optional[Dict]:
+        """Get a single gremium by ID (cached until the next upsert_gremium)."""
+        key = (gremium_id, active_only)
+        cached = self._gremium_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            query = 'SELECT * FROM gremia WHERE id = ?'
+            if active_only:
+                query += ' AND active = 1'
+            cursor.execute(query + ' LIMIT 1', (gremium_id,))
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        if len(self._gremium_cache) >= GREMIUM_CACHE_SIZE:
+            self._gremium_cache.clear()
+        self._gremium_cache[key] = dict(row)
+        return dict(row)
+
     # ==================== Meetings ====================
 
     def upsert_meeting(self, notubiz_id: str, title: str, date: str, **kwargs) -> int:
@@ -734,6 +926,71 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def get_meeting_bundle(self, meeting_id: int, document_limit: int = 50) -> Optional[Dict]:
+        """
+        Get a meeting with its agenda items and documents on one connection.
+
+        Agenda items only carry id and title. Documents carry id, title, url,
+        notubiz_id and 'has_content' instead of their text and file blob.
+        """
+        bundles = self.get_meeting_bundles([meeting_id], document_limit=document_limit)
+        return bundles[0] if bundles else None
+
+    def get_meeting_bundles(self, meeting_ids: List[int], document_limit: int = 50) -> List[Dict]:
+        """
+        Get several meetings like get_meeting_bundle, with three queries per
+        batch of MEETING_BUNDLE_BATCH_SIZE ids (SQLite caps bound parameters).
+
+        Returns the meetings that exist, in the order of meeting_ids; each
+        has at most document_limit documents (newest first).
+        """
+        meeting_ids = list(dict.fromkeys(meeting_ids))
+        meetings = {}
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(meeting_ids), MEETING_BUNDLE_BATCH_SIZE):
+                batch = meeting_ids[start:start + MEETING_BUNDLE_BATCH_SIZE]
+                placeholders = ','.join('?' * len(batch))
+
+                cursor.execute(f'SELECT * FROM meetings WHERE id IN ({placeholders})', batch)
+                found = 0
+                for row in cursor.fetchall():
+                    meeting = dict(row)
+                    meeting['agenda_items'] = []
+                    meeting['documents'] = []
+                    meetings[meeting['id']] = meeting
+                    found += 1
+                if not found:
+                    continue
+
+                cursor.execute(f'''
+                    SELECT meeting_id, id, title FROM agenda_items
+                    WHERE meeting_id IN ({placeholders})
+                    ORDER BY order_number, id
+                ''', batch)
+                for row in cursor.fetchall():
+                    meetings[row['meeting_id']]['agenda_items'].append({'id': row['id'], 'title': row['title']})
+
+                cursor.execute(f'''
+                    SELECT meeting_id, id, title, url, notubiz_id, has_content FROM (
+                        SELECT meeting_id, id, title, url, notubiz_id,
+                               COALESCE(text_content, '') != '' AS has_content,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY meeting_id ORDER BY created_at DESC
+                               ) AS position
+                        FROM documents
+                        WHERE meeting_id IN ({placeholders})
+                    )
+                    WHERE position <= ?
+                    ORDER BY meeting_id, position
+                ''', [*batch, document_limit])
+                for row in cursor.fetchall():
+                    document = dict(row)
+                    meetings[document.pop('meeting_id')]['documents'].append(document)
+
+        return [meetings[i] for i in meeting_ids if i in meetings]
+
     # ==================== Agenda Items ====================
 
     def upsert_agenda_item(self, notubiz_id: str, meeting_id: int, title: str, **kwargs) -> int:
@@ -1101,8 +1358,9 @@ class Database:
                 query += ' AND agenda_item_id = ?'
                 params.append(agenda_item_id)
             if search:
-                query += ' AND (title LIKE ? OR text_content LIKE ?)'
-                params.extend([f'%{search}%', f'%{search}%'])
+                clause, search_params = self._document_search_clause(search)
+                query += ' AND ' + clause
+                params.extend(search_params)
 
             query += ' ORDER BY created_at DESC LIMIT ? OFFSET ?'
             params.extend([limit, offset])
@@ -1110,6 +1368,87 @@ class Database:
             cursor.execute(query, params)
             return [dict(row) for row in cursor.fetchall()]
 
+    def search_documents_ranked(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        Documents containing words of the query, best match first.
+
+        Ranked by bm25 on the trigram index (words of 3+ characters, any
+        word may match); without the index a LIKE match on the whole query,
+        newest first. Rows carry id, title and the first 300 characters of
+        the text as 'excerpt'.
+        """
+        words = [w for w in re.findall(r'\w+', query) if len(w) >= 3]
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            if self._fts_enabled and words:
+                cursor.execute('''
+                    SELECT d.id, d.title, SUBSTR(d.text_content, 1, 300) AS excerpt
+                    FROM documents_fts
+                    JOIN documents d ON d.id = documents_fts.rowid
+                    WHERE documents_fts MATCH ?
+                    ORDER BY bm25(documents_fts)
+                    LIMIT ?
+                ''', (' OR '.join(f'"{w}"' for w in words), limit))
+            else:
+                cursor.execute('''
+                    SELECT id, title, SUBSTR(text_content, 1, 300) AS excerpt
+                    FROM documents
+                    WHERE title LIKE ? OR text_content LIKE ?
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                ''', (f'%{query}%', f'%{query}%', limit))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def _uses_fts(self, search: str) -> bool:
+        """Whether a keyword search for search goes through the trigram index."""
+        return self._fts_enabled and len(search) >= 3
+
+    @staticmethod
+    def _fts_phrase(search: str) -> str:
+        """search as a quoted FTS5 phrase (a substring match with the trigram tokenizer)."""
+        return '"' + search.replace('"', '""') + '"'
+
+    def _document_search_clause(self, search: str) -> Tuple[str, List[str]]:
+        """WHERE clause (and params) for documents whose title or text contains search."""
+        if self._uses_fts(search):
+            # Substring match on title or text via the trigram index
+            return (
+                'id IN (SELECT rowid FROM documents_fts WHERE documents_fts MATCH ?)',
+                [self._fts_phrase(search)]
+            )
+        return '(title LIKE ? OR text_content LIKE ?)', [f'%{search}%', f'%{search}%']
+
+    def search_document_matches(self, search: str, limit: int = 20) -> List[Dict]:
+        """
+        Documents whose title or text contains search, newest first, without
+        loading their text or file blob.
+
+        Rows carry id, title, url (falling back to the Notubiz download URL)
+        and 'content_match' (search occurs in the text). With the trigram
+        index the text check is the index match on the text column, which
+        folds case for all of Unicode like str.lower(); the LIKE fallback
+        folds ASCII only, the same as its WHERE clause.
+        """
+        clause, params = self._document_search_clause(search)
+        if self._uses_fts(search):
+            content_match = 'id IN (SELECT rowid FROM documents_fts WHERE documents_fts MATCH ?)'
+            content_param = 'text_content : ' + self._fts_phrase(search)
+        else:
+            content_match = "INSTR(LOWER(COALESCE(text_content, '')), LOWER(?)) > 0"
+            content_param = search
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT id, title,
+                       COALESCE(NULLIF(url, ''), 'https://api.notubiz.nl/document/' || NULLIF(notubiz_id, '') || '/1') AS url,
+                       {content_match} AS content_match
+                FROM documents
+                WHERE {clause}
+                ORDER BY created_at DESC
+                LIMIT ?
+            ''', [content_param, *params, limit])
+            return [dict(row) for row in cursor.fetchall()]
+
     def get_document(self, document_id: int) -> Optional[Dict]:
         """Get a single document by ID."""
         with self._get_connection() as conn:
@@ -1118,6 +1457,28 @@ class Database:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def get_document_excerpt(self, document_id: int, text_limit: int, text_offset: int = 0) -> Optional[Dict]:
+        """
+        Get a document with at most text_limit characters of its text,
+        starting at character text_offset.
+
+        The full text and the file blob are never loaded; 'text_length'
+        holds the length of the complete text.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, notubiz_id, meeting_id, agenda_item_id, title, filename, url,
+                       local_path, mime_type, file_size,
+                       SUBSTR(text_content, ? + 1, ?) AS text_content,
+                       LENGTH(text_content) AS text_length,
+                       text_extracted, download_status, file_storage_mode,
+                       created_at, updated_at
+                FROM documents WHERE id = ?
+            ''', (text_offset, text_limit, document_id))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
     def get_documents_pending_download(self) -> List[Dict]:
         """Get documents that need to be downloaded."""
         with self._get_connection() as conn:
@@ -1488,6 +1849,13 @@ class Database:
 
     # ==================== Statistics ====================
 
+    def has_meetings(self) -> bool:
+        """Check whether any meeting has been synced."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT EXISTS(SELECT 1 FROM meetings)')
+            return bool(cursor.fetchone()[0])
+
     def get_statistics(self) -> Dict:
         """Get database statistics."""
         with self._get_connection() as conn:
@@ -2594,7 +2962,8 @@ class Database:
                     for table in src.execute(
                         "SELECT name, sql FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
                     ).fetchall():
-                        if table['sql']:
+                        # The FTS index and its shadow tables are recreated on restore
+                        if table['sql'] and not table['name'].startswith('documents_fts'):
                             dst.execute(table['sql'])
 
                     # Copy full tables
@@ -2675,6 +3044,10 @@ class Database:
                     temp_path.unlink()
                     return False
 
+            # Close the connections of all threads before the files move,
+            # so no stale handle (or its -wal/-shm) outlives the swap
+            self.close()
+
             # Replace current database
             if self.db_path.exists():
                 corrupt_path = self.db_path.with_suffix('.corrupt')
@@ -2686,6 +3059,8 @@ class Database:
 
             # Mark all documents for re-download
             with self._get_connection() as conn:
+                self._fts_enabled = self._init_fts(conn.cursor())
+                self._init_embeddings_version(conn.cursor(), new_epoch=True)
                 conn.execute('''
                     UPDATE documents
                     SET download_status = 'pending', file_blob = NULL
@@ -5,11 +5,21 @@ Document Index voor Baarn Politiek MCP Server.
 Semantisch zoeken met embeddings (sentence-transformers).
 """
 
+import re
 import json
+import time
+import hashlib
+import threading
+import importlib.util
+import multiprocessing
 import numpy as np
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from .config import Config
 from .database import Database, get_database
@@ -18,20 +28,180 @@ from shared.cli_progress import progress_context, is_interactive
 
 logger = get_logger('document-index')
 
-# Embeddings support (optional)
-model = None
-EMBEDDINGS_AVAILABLE = False
+# Sentence boundaries: '.', '?' or '!' followed by a space or newline
+_SENTENCE_END_RE = re.compile(r'[.?!][ \n]')
 
-try:
-    from sentence_transformers import SentenceTransformer
-    EMBEDDINGS_AVAILABLE = True
+# Bump when the on-disk matrix cache format changes
+MATRIX_CACHE_VERSION = 4
+
+# Suffix on embeddings.model for L2-normalized vectors; rows without it
+# are from an older index and get re-indexed
+NORMALIZED_SUFFIX = ':normed'
+
+# Documents per task when indexing with multiple worker processes
+INDEX_SHARD_SIZE = 20
+
+# Reciprocal rank fusion constant: score = sum of 1 / (RRF_K + rank)
+RRF_K = 60
+
+# Number of set bits per byte value, for Hamming distance on packed bits
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Embeddings support (optional). Only checked for here: importing torch and
+# sentence-transformers takes seconds, so that happens when the model is loaded.
+model = None
+model_batch_size = 32
+torch = None
+EMBEDDINGS_AVAILABLE = (
+    importlib.util.find_spec('sentence_transformers') is not None
+    and importlib.util.find_spec('torch') is not None
+)
+
+if EMBEDDINGS_AVAILABLE:
     logger.info('Sentence transformers available - semantic search enabled')
-except ImportError:
+else:
     logger.warning(
         'sentence-transformers not installed - semantic search disabled. '
         'Install with: pip install sentence-transformers torch'
     )
 
+# Numba JIT kernels for the similarity scan (optional, compiled on first use)
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+_numba_dot_scores = None
+_numba_int8_scores = None
+
+if not NUMBA_AVAILABLE:
+    logger.debug('numba not installed - using numpy for similarity scan')
+
+
+def _get_numba_kernel(kind: str = 'float32'):
+    """Import numba and define the similarity kernels on first use ('float32' or 'int8')."""
+    global _numba_dot_scores, _numba_int8_scores
+
+    if _numba_dot_scores is None:
+        from numba import njit, prange
+
+        @njit(parallel=True, fastmath=True, cache=True)
+        def dot_scores(embeddings, query):
+            """Dot product of every row with the query, parallel over rows."""
+            n, d = embeddings.shape
+            scores = np.empty(n, dtype=np.float32)
+            for i in prange(n):
+                # float32 accumulator: a float64 one halves the SIMD width
+                s = np.float32(0.0)
+                for j in range(d):
+                    s += embeddings[i, j] * query[j]
+                scores[i] = s
+            return scores
+
+        @njit(parallel=True, fastmath=True, cache=True)
+        def int8_scores(codes, scales, query_codes):
+            """Approximate dot products on int8 rows (int32 accumulator, per-row scale)."""
+            n, d = codes.shape
+            scores = np.empty(n, dtype=np.float32)
+            for i in prange(n):
+                s = np.int32(0)
+                for j in range(d):
+                    s += np.int32(codes[i, j]) * np.int32(query_codes[j])
+                scores[i] = s * scales[i]
+            return scores
+
+        _numba_dot_scores = dot_scores
+        _numba_int8_scores = int8_scores
+    return _numba_int8_scores if kind == 'int8' else _numba_dot_scores
+
+
+def _quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization: row ~= codes * scale."""
+    vectors = np.atleast_2d(vectors)
+    max_abs = np.abs(vectors).max(axis=1)
+    max_abs[max_abs == 0] = 1.0
+    scales = (max_abs / 127.0).astype(np.float32)
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales
+
+# Approximate nearest neighbour index (optional)
+HNSWLIB_AVAILABLE = False
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    logger.debug('hnswlib not installed - using exact similarity scan')
+
+
+def _chunk_hash(chunk: str) -> bytes:
+    """128-bit content hash of a chunk."""
+    return hashlib.blake2b(chunk.encode('utf-8'), digest_size=16).digest()
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first (O(N + k log k) instead of a full sort)."""
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if k >= len(scores):
+        return np.argsort(-scores)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+class QueryBatcher:
+    """
+    Combine query embeddings requested by concurrent threads into one model call.
+
+    A caller that finds the model idle encodes its query right away. Queries
+    that arrive while a model call runs wait; when it returns, the first of
+    them encodes all waiting queries in one call, and so on.
+    """
+
+    def __init__(self, encode: Callable[[List[str]], np.ndarray]):
+        self._encode = encode
+        self._lock = threading.Lock()
+        # Per request: [text, wake-up event, embedding or exception, runs the model]
+        self._pending: List[list] = []
+        self._busy = False
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embedding of one text, encoded together with concurrent requests."""
+        request = [text, threading.Event(), None, False]
+        with self._lock:
+            self._pending.append(request)
+            if not self._busy:
+                self._busy = True
+                request[3] = True
+
+        if not request[3]:
+            # Woken with a result, or to run the next batch
+            request[1].wait()
+
+        if request[3]:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            self._run(batch)
+            with self._lock:
+                if self._pending:
+                    # Hand the model to the next waiting caller
+                    self._pending[0][3] = True
+                    self._pending[0][1].set()
+                else:
+                    self._busy = False
+
+        if isinstance(request[2], Exception):
+            raise request[2]
+        return request[2]
+
+    def _run(self, batch: List[list]):
+        try:
+            embeddings = self._encode([r[0] for r in batch])
+            for r, embedding in zip(batch, embeddings):
+                r[2] = embedding
+        except Exception as e:
+            for r in batch:
+                r[2] = e
+        finally:
+            for r in batch:
+                r[1].set()
+
 
 @dataclass
 class SearchResult:
@@ -42,6 +212,60 @@ class SearchResult:
     similarity: float
     document_title: str = ''
     meeting_date: str = ''
+    # Fused rank score, only set by hybrid_search
+    score: Optional[float] = None
+
+
+def _normalize_query(query: str) -> str:
+    """Query text with whitespace collapsed; spacing does not change the tokens."""
+    return ' '.join(query.split())
+
+
+class SemanticResultCache:
+    """
+    Recent search results keyed by (normalized query text, limit).
+
+    Only an identical query hits: near-identical embeddings are not good
+    enough, since "begroting 2023" and "begroting 2024" embed almost the
+    same but should not share results. Entries are only valid for the
+    index state (fingerprint) they were computed on.
+    """
+
+    def __init__(self, capacity: int, ttl: float):
+        self.capacity = capacity
+        self.ttl = ttl
+        # (query, limit) -> (fingerprint, created, results), least recently used first
+        self._entries: OrderedDict[Tuple[str, int], tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query: str, limit: int, fingerprint) -> Optional[List[SearchResult]]:
+        """Cached results of the same query, or None."""
+        key = (query, limit)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != fingerprint or time.monotonic() - entry[1] > self.ttl:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return list(entry[2])
+
+    def put(self, query: str, limit: int, fingerprint, results: List[SearchResult]):
+        """Store results, evicting the least recently used entry when full."""
+        if self.capacity <= 0:
+            return
+        key = (query, limit)
+        with self._lock:
+            self._entries[key] = (fingerprint, time.monotonic(), list(results))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
 
 
 class DocumentIndex:
@@ -57,26 +281,126 @@ class DocumentIndex:
         self.db = db or get_database()
         self.model = None
         self.model_name = Config.EMBEDDINGS_MODEL
+        self.model_tag = f'{self.model_name}{NORMALIZED_SUFFIX}'
         self.chunk_size = 500  # characters per chunk
         self.chunk_overlap = 50  # overlap between chunks
 
+        # One long-lived connection for all index queries (sqlite3 caches the
+        # compiled statements per connection)
+        self._conn = None
+        self._conn_generation = 0
+        self._conn_lock = threading.RLock()
+
+        # In-memory embedding matrix, persisted as .npy (mmap) in the cache dir
+        self._matrix: Optional[Dict] = None
+        cache_name = f'embeddings_{Path(self.db.db_path).stem}'
+        self.matrix_cache_path = Config.CACHE_DIR / f'{cache_name}.npy'
+        self.matrix_meta_path = Config.CACHE_DIR / f'{cache_name}.json'
+        self.ann_cache_path = Config.CACHE_DIR / f'{cache_name}.hnsw'
+
+        # IDs of documents with current-model embeddings, loaded on first use
+        # and kept up to date by this instance's own writes
+        self._indexed_ids: Optional[set] = None
+
+        # Results of recent (near-identical) queries
+        self._result_cache = SemanticResultCache(
+            capacity=Config.SEARCH_CACHE_SIZE,
+            ttl=Config.SEARCH_CACHE_TTL
+        )
+
+        # Embeddings of recent query strings (LRU), so repeated queries skip the model
+        self._query_embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
+        # Query embeddings of concurrent searches share one model call
+        self._query_batcher = QueryBatcher(self._get_embeddings)
+
         logger.info(f'DocumentIndex initialized (embeddings: {EMBEDDINGS_AVAILABLE})')
 
+    @contextmanager
+    def _connection(self):
+        """
+        Use the index's persistent connection (serialized by a lock).
+
+        Commits on success and rolls back on error, like Database._get_connection.
+        """
+        with self._conn_lock:
+            if self._conn is not None and self._conn_generation != self.db.generation:
+                # Database.close() (e.g. a restore) closed it; reopen on the current file
+                self._conn = None
+            if self._conn is None:
+                self._conn = self.db._connect()
+                self._conn_generation = self.db.generation
+                # Read-heavy search path: WAL makes NORMAL sync safe against corruption
+                self._conn.execute('PRAGMA synchronous=NORMAL')
+                self._conn.execute('PRAGMA temp_store=MEMORY')
+                self._conn.execute('PRAGMA mmap_size=268435456')
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def close(self):
+        """Close the persistent database connection."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def _load_model(self):
         """Lazy load the embedding model."""
-        global model
+        global model, model_batch_size, torch
 
         if not EMBEDDINGS_AVAILABLE:
             raise RuntimeError('Embeddings not available - install sentence-transformers')
 
         if model is None:
-            logger.info(f'Loading embedding model: {self.model_name}')
+            backend = Config.EMBEDDINGS_BACKEND
+            logger.info(f'Loading embedding model: {self.model_name} (backend: {backend})')
+            import torch
             from sentence_transformers import SentenceTransformer
-            model = SentenceTransformer(self.model_name)
+
+            if backend == 'torch':
+                device = Config.EMBEDDINGS_DEVICE
+                if device == 'auto':
+                    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+                model = SentenceTransformer(self.model_name, device=device)
+                if device.startswith('cuda'):
+                    # fp16 halves memory traffic; larger batches keep the GPU busy
+                    model.half()
+                    model_batch_size = 128
+                logger.info(f'Embedding model device: {device}')
+            else:
+                model = self._load_exported_model(SentenceTransformer, backend)
             logger.info('Model loaded successfully')
 
         self.model = model
 
+    def _load_exported_model(self, model_cls, backend: str):
+        """
+        Load the model with an ONNX/OpenVINO backend.
+
+        The first load exports the model; the exported copy is saved under
+        Config.MODELS_DIR so later startups skip the export step.
+        """
+        model_kwargs = {}
+        if Config.EMBEDDINGS_MODEL_FILE:
+            model_kwargs['file_name'] = Config.EMBEDDINGS_MODEL_FILE
+
+        export_dir = Config.MODELS_DIR / f"{self.model_name.replace('/', '__')}-{backend}"
+        if export_dir.exists():
+            return model_cls(str(export_dir), backend=backend, model_kwargs=model_kwargs or None)
+
+        loaded = model_cls(self.model_name, backend=backend, model_kwargs=model_kwargs or None)
+        try:
+            export_dir.parent.mkdir(parents=True, exist_ok=True)
+            loaded.save_pretrained(str(export_dir))
+            logger.info(f'Exported {backend} model saved to {export_dir}')
+        except Exception as e:
+            logger.warning(f'Could not save exported {backend} model: {e}')
+        return loaded
+
     def _chunk_text(self, text: str) -> List[str]:
         """Split text into overlapping chunks."""
         if not text:
@@ -85,6 +409,10 @@ class DocumentIndex:
         chunks = []
         text = text.strip()
 
+        # Offsets directly after each sentence-ending punctuation mark,
+        # computed in a single scan instead of rfind() per chunk
+        boundaries = [m.start() + 1 for m in _SENTENCE_END_RE.finditer(text)]
+
         # Simple chunking by character count with overlap
         start = 0
         while start < len(text):
@@ -92,13 +420,11 @@ class DocumentIndex:
 
             # Try to break at sentence boundary
             if end < len(text):
-                # Look for sentence end in last 100 chars
+                # Look for the last sentence end in the last 100 chars
                 search_start = max(start + self.chunk_size - 100, start)
-                for sep in ['. ', '.\n', '? ', '?\n', '! ', '!\n']:
-                    pos = text.rfind(sep, search_start, end + 50)
-                    if pos > search_start:
-                        end = pos + 1
-                        break
+                pos = bisect_right(boundaries, end + 49)
+                if pos and boundaries[pos - 1] > search_start + 1:
+                    end = boundaries[pos - 1]
 
             chunk = text[start:end].strip()
             if chunk:
@@ -109,9 +435,45 @@ class DocumentIndex:
         return chunks
 
     def _get_embedding(self, text: str) -> np.ndarray:
-        """Get embedding vector for text."""
+        """Get L2-normalized embedding vector for text."""
+        return self._encode(text)
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embedding of a search query, cached per query string."""
+        # Spacing does not change the tokens: "a  b " and "a b" share an entry
+        query = _normalize_query(query)
+        with self._query_embeddings_lock:
+            cached = self._query_embeddings.get(query)
+            if cached is not None:
+                self._query_embeddings.move_to_end(query)
+                return cached
+
+        embedding = self._query_batcher.embed(query).astype(np.float32, copy=False)
+        embedding.setflags(write=False)
+
+        if Config.QUERY_EMBEDDING_CACHE_SIZE > 0:
+            with self._query_embeddings_lock:
+                self._query_embeddings[query] = embedding
+                if len(self._query_embeddings) > Config.QUERY_EMBEDDING_CACHE_SIZE:
+                    self._query_embeddings.popitem(last=False)
+        return embedding
+
+    def _get_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Get L2-normalized embedding vectors for a batch of texts (one row per text)."""
+        return self._encode(texts)
+
+    def _encode(self, texts):
+        """Run the model on a text or list of texts (no autograd bookkeeping)."""
         self._load_model()
-        return self.model.encode(text, convert_to_numpy=True)
+        with torch.inference_mode() if torch is not None else nullcontext():
+            embeddings = self.model.encode(
+                texts,
+                batch_size=model_batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True
+            )
+        # fp16 models return float16 vectors; storage and search use float32
+        return embeddings.astype(np.float32, copy=False)
 
     def _embedding_to_bytes(self, embedding: np.ndarray) -> bytes:
         """Convert embedding to bytes for storage."""
@@ -121,10 +483,6 @@ class DocumentIndex:
         """Convert bytes back to embedding."""
         return np.frombuffer(data, dtype=np.float32)
 
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
-        return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
-
     def index_document(self, document_id: int) -> int:
         """
         Index a document's text content including OCR text from images.
@@ -160,53 +518,107 @@ class DocumentIndex:
             return 0
 
         with LogContext(logger, 'index_document', document_id=document_id):
-            # Remove existing embeddings
-            self._delete_document_embeddings(document_id)
-
             # Chunk text
             chunks = self._chunk_text(text)
             if not chunks:
+                self._delete_document_embeddings(document_id)
                 return 0
 
-            # Generate and store embeddings
-            for i, chunk in enumerate(chunks):
-                embedding = self._get_embedding(chunk)
-                self._store_embedding(document_id, i, chunk, embedding)
-
-            logger.info(f'Indexed document {document_id}: {len(chunks)} chunks')
+            # Reuse stored embeddings of chunks whose text did not change
+            hashes = [_chunk_hash(chunk) for chunk in chunks]
+            stored = self._get_stored_chunk_embeddings(document_id)
+            if [h for h, _ in stored] == hashes:
+                logger.debug(f'Document {document_id} unchanged, keeping {len(chunks)} chunks')
+                return len(chunks)
+
+            reusable = dict(stored)
+            # Identical text elsewhere in the index (boilerplate, re-published attachments)
+            unknown = {h for h in hashes if h not in reusable}
+            if unknown:
+                reusable.update(self._get_embeddings_by_hash(unknown))
+            blobs = [reusable.get(h) for h in hashes]
+            missing = [i for i, blob in enumerate(blobs) if blob is None]
+
+            # Generate embeddings for new/changed chunks in one batch
+            if missing:
+                embeddings = self._get_embeddings([chunks[i] for i in missing])
+                for i, embedding in zip(missing, embeddings):
+                    blobs[i] = self._embedding_to_bytes(embedding)
+
+            # Replace the stored embeddings in a single transaction
+            self._replace_document_embeddings(document_id, chunks, hashes, blobs)
+
+            logger.info(
+                f'Indexed document {document_id}: {len(chunks)} chunks '
+                f'({len(missing)} encoded, {len(chunks) - len(missing)} reused)'
+            )
             return len(chunks)
 
+    def _get_stored_chunk_embeddings(self, document_id: int) -> List[Tuple[bytes, bytes]]:
+        """Get (chunk_hash, embedding) of a document's current-model chunks, in chunk order."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT chunk_hash, embedding FROM embeddings
+                WHERE document_id = ? AND model = ? AND chunk_hash IS NOT NULL
+                ORDER BY chunk_index
+            ''', (document_id, self.model_tag))
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    def _get_embeddings_by_hash(self, hashes: set) -> Dict[bytes, bytes]:
+        """Get stored current-model embeddings for the given chunk hashes, from any document."""
+        found = {}
+        hashes = list(hashes)
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            # Stay below SQLite's bound-parameter limit
+            for start in range(0, len(hashes), 500):
+                batch = hashes[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                cursor.execute(f'''
+                    SELECT chunk_hash, embedding FROM embeddings
+                    WHERE model = ? AND chunk_hash IN ({placeholders})
+                ''', [self.model_tag, *batch])
+                found.update((row[0], row[1]) for row in cursor.fetchall())
+        return found
+
     def _delete_document_embeddings(self, document_id: int):
         """Delete all embeddings for a document."""
-        with self.db._get_connection() as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM embeddings WHERE document_id = ?', (document_id,))
+        if self._indexed_ids is not None:
+            self._indexed_ids.discard(document_id)
+        self._invalidate_matrix_cache()
 
-    def _store_embedding(
+    def _replace_document_embeddings(
         self,
         document_id: int,
-        chunk_index: int,
-        chunk_text: str,
-        embedding: np.ndarray
+        chunks: List[str],
+        hashes: List[bytes],
+        embeddings: List[bytes]
     ):
-        """Store embedding in database."""
-        with self.db._get_connection() as conn:
+        """Replace all embeddings of a document atomically."""
+        rows = [
+            (document_id, i, chunk, embeddings[i], self.model_tag, hashes[i])
+            for i, chunk in enumerate(chunks)
+        ]
+        with self._connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO embeddings (document_id, chunk_index, chunk_text, embedding, model)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                document_id,
-                chunk_index,
-                chunk_text,
-                self._embedding_to_bytes(embedding),
-                self.model_name
-            ))
+            cursor.execute('DELETE FROM embeddings WHERE document_id = ?', (document_id,))
+            cursor.executemany('''
+                INSERT INTO embeddings (document_id, chunk_index, chunk_text, embedding, model, chunk_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', rows)
+        if self._indexed_ids is not None:
+            self._indexed_ids.add(document_id)
+        self._invalidate_matrix_cache()
 
     def index_all_documents(
         self,
         reindex: bool = False,
-        stop_callback: Callable[[], bool] = None
+        stop_callback: Callable[[], bool] = None,
+        workers: int = None
     ) -> Tuple[int, int]:
         """
         Index all documents with text content.
@@ -214,6 +626,7 @@ class DocumentIndex:
         Args:
             reindex: Re-index documents that already have embeddings
             stop_callback: Optional callback that returns True if indexing should stop
+            workers: Number of indexing processes (default: Config.INDEX_WORKERS)
 
         Returns:
             Tuple of (documents_indexed, chunks_created)
@@ -227,6 +640,10 @@ class DocumentIndex:
             indexed_ids = self._get_indexed_document_ids()
             docs_with_text = [d for d in docs_with_text if d['id'] not in indexed_ids]
 
+        workers = workers or Config.INDEX_WORKERS
+        if workers > 1 and len(docs_with_text) > INDEX_SHARD_SIZE:
+            return self._index_documents_parallel(docs_with_text, workers, stop_callback)
+
         with LogContext(logger, 'index_all_documents', count=len(docs_with_text)):
             total_docs = 0
             total_chunks = 0
@@ -252,12 +669,73 @@ class DocumentIndex:
             logger.info(f'Indexed {total_docs} documents, {total_chunks} chunks')
             return total_docs, total_chunks
 
+    def _index_documents_parallel(
+        self,
+        docs: List[Dict],
+        workers: int,
+        stop_callback: Callable[[], bool] = None
+    ) -> Tuple[int, int]:
+        """
+        Index documents in a pool of worker processes.
+
+        Each worker loads the model once and indexes shards of
+        INDEX_SHARD_SIZE documents through its own database connection.
+        """
+        doc_ids = [d['id'] for d in docs]
+        shards = [doc_ids[i:i + INDEX_SHARD_SIZE] for i in range(0, len(doc_ids), INDEX_SHARD_SIZE)]
+
+        with LogContext(logger, 'index_all_documents', count=len(doc_ids), workers=workers):
+            total_docs = 0
+            total_chunks = 0
+
+            # spawn: torch is not fork-safe once the parent has loaded a model
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            try:
+                with progress_context("Indexeren...", total=len(doc_ids)) as tracker:
+                    futures = {
+                        executor.submit(_index_documents_worker, shard, str(self.db.db_path)): len(shard)
+                        for shard in shards
+                    }
+                    for future in as_completed(futures):
+                        shard_docs, shard_chunks = future.result()
+                        total_docs += shard_docs
+                        total_chunks += shard_chunks
+                        tracker.advance(futures[future])
+
+                        if stop_callback and stop_callback():
+                            logger.info('Stop requested during indexing')
+                            break
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+                # Workers wrote through their own connections
+                self._indexed_ids = None
+                self._invalidate_matrix_cache()
+
+            logger.info(f'Indexed {total_docs} documents, {total_chunks} chunks')
+            return total_docs, total_chunks
+
     def _get_indexed_document_ids(self) -> set:
-        """Get IDs of documents that have embeddings."""
-        with self.db._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT DISTINCT document_id FROM embeddings')
-            return {row[0] for row in cursor.fetchall()}
+        """Get IDs of documents that have up-to-date embeddings (current model, normalized)."""
+        if self._indexed_ids is None:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT DISTINCT document_id FROM embeddings WHERE model = ?', (self.model_tag,))
+                self._indexed_ids = {row[0] for row in cursor.fetchall()}
+        return self._indexed_ids
+
+    def invalidate_cache(self):
+        """
+        Forget cached index state.
+
+        Call after the embeddings table was modified outside this instance
+        (other processes, scripts) so the next call re-reads it.
+        """
+        self._indexed_ids = None
+        self._matrix = None
+        self._result_cache.clear()
 
     def search(self, query: str, limit: int = 10) -> List[SearchResult]:
         """
@@ -271,69 +749,360 @@ class DocumentIndex:
             List of SearchResult ordered by similarity
         """
         with LogContext(logger, 'semantic_search', query=query[:50]):
-            # Get query embedding
-            query_embedding = self._get_embedding(query)
-
-            # Get all embeddings
-            embeddings = self._get_all_embeddings()
-            if not embeddings:
+            # Get the (cached) embedding matrix
+            matrix = self._load_matrix()
+            if not len(matrix['doc_ids']):
                 return []
 
-            # Calculate similarities
-            results = []
-            for emb_data in embeddings:
-                doc_embedding = self._bytes_to_embedding(emb_data['embedding'])
-                similarity = self._cosine_similarity(query_embedding, doc_embedding)
-
-                results.append(SearchResult(
-                    document_id=emb_data['document_id'],
-                    chunk_index=emb_data['chunk_index'],
-                    chunk_text=emb_data['chunk_text'],
-                    similarity=similarity
-                ))
+            # Served from cache when the same query was answered recently
+            query_key = _normalize_query(query)
+            cached = self._result_cache.get(query_key, limit, matrix['fingerprint'])
+            if cached is not None:
+                logger.debug(f'Semantic cache hit for "{query[:50]}"')
+                return cached
 
-            # Sort by similarity (descending)
-            results.sort(key=lambda x: x.similarity, reverse=True)
+            # Get query embedding
+            query_embedding = self.embed_query(query)
+
+            top_rows, similarities = self._rank(matrix, query_embedding, limit)
+            doc_ids, chunk_idx, texts = matrix['doc_ids'], matrix['chunk_idx'], matrix['texts']
+            top_results = [
+                SearchResult(
+                    document_id=int(doc_ids[i]),
+                    chunk_index=int(chunk_idx[i]),
+                    chunk_text=texts[i],
+                    similarity=float(similarity)
+                )
+                for i, similarity in zip(top_rows, similarities)
+            ]
 
-            # Limit and enrich results
-            top_results = results[:limit]
+            # Enrich results
             self._enrich_results(top_results)
 
+            self._result_cache.put(query_key, limit, matrix['fingerprint'], top_results)
             return top_results
 
-    def _get_all_embeddings(self) -> List[Dict]:
-        """Get all embeddings from database."""
-        with self.db._get_connection() as conn:
+    def hybrid_search(self, query: str, limit: int = 10) -> List[SearchResult]:
+        """
+        Semantic search fused with full-text matches (reciprocal rank fusion).
+
+        One result per document. Documents found both ways rank highest;
+        documents that only contain the query words still show up (with
+        similarity 0.0), also when no embeddings are available.
+
+        Returns:
+            List of SearchResult ordered by fused score
+        """
+        semantic = self.search(query, limit * 2) if EMBEDDINGS_AVAILABLE else []
+        keyword = self.db.search_documents_ranked(query, limit * 2)
+
+        scores: Dict[int, float] = {}
+        best: Dict[int, SearchResult] = {}
+        for result in semantic:
+            # Best chunk per document; its rank among documents counts
+            if result.document_id not in best:
+                best[result.document_id] = result
+                scores[result.document_id] = 1.0 / (RRF_K + len(best))
+        keyword_only = []
+        for rank, doc in enumerate(keyword, 1):
+            scores[doc['id']] = scores.get(doc['id'], 0.0) + 1.0 / (RRF_K + rank)
+            if doc['id'] not in best:
+                best[doc['id']] = SearchResult(
+                    document_id=doc['id'],
+                    chunk_index=0,
+                    chunk_text=doc['excerpt'] or '',
+                    similarity=0.0,
+                    document_title=doc['title'] or ''
+                )
+                keyword_only.append(best[doc['id']])
+        self._enrich_results(keyword_only)
+
+        ranked = sorted(scores, key=scores.get, reverse=True)[:limit]
+        # Copies: semantic results may be shared with the result cache
+        return [replace(best[doc_id], score=scores[doc_id]) for doc_id in ranked]
+
+    def _rank(
+        self,
+        matrix: Dict,
+        query_embedding: np.ndarray,
+        limit: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the rows most similar to the query.
+
+        Uses the HNSW index when available, otherwise an exact scan (with a
+        binary-code or int8 prefilter for large indexes).
+
+        Returns:
+            Tuple of (row indices, similarities), best match first
+        """
+        ann = matrix.get('ann')
+        if ann is not None:
+            k = min(limit, ann.get_current_count())
+            if k > ann.ef:
+                ann.set_ef(k)
+            labels, distances = ann.knn_query(query_embedding, k=k)
+            return labels[0].astype(np.int64), 1.0 - distances[0]
+
+        # Large index: shortlist candidates on binary codes, rerank in fp32
+        candidates = None
+        if matrix.get('binary') is not None:
+            candidates = self._binary_candidates(
+                matrix['binary'], query_embedding, limit * Config.BINARY_RERANK_FACTOR
+            )
+        elif matrix.get('int8') is not None:
+            candidates = self._int8_candidates(
+                matrix['int8'], query_embedding, limit * Config.INT8_RERANK_FACTOR
+            )
+
+        embeddings = matrix['embeddings']
+        if candidates is not None:
+            embeddings = embeddings[candidates]
+
+        similarities = self._similarities(embeddings, query_embedding)
+
+        order = _top_k(similarities, limit)
+        top_rows = order if candidates is None else candidates[order]
+        return top_rows, similarities[order]
+
+    def _similarities(self, embeddings: np.ndarray, query_embedding: np.ndarray) -> np.ndarray:
+        """Cosine similarity of the query against every row (all rows unit length)."""
+        if NUMBA_AVAILABLE and len(embeddings) >= Config.NUMBA_MIN_CHUNKS:
+            kernel = _get_numba_kernel()
+            # One compiled specialization: C-contiguous float32 rows and query
+            return kernel(
+                np.ascontiguousarray(embeddings, dtype=np.float32),
+                np.ascontiguousarray(query_embedding, dtype=np.float32)
+            )
+        # One matrix-vector product (BLAS)
+        return embeddings @ query_embedding
+
+    def _binary_candidates(
+        self,
+        binary: np.ndarray,
+        query_embedding: np.ndarray,
+        count: int
+    ) -> np.ndarray:
+        """Row indices of the `count` nearest rows by Hamming distance on sign bits."""
+        query_bits = np.packbits(query_embedding > 0)
+        distances = _POPCOUNT_TABLE[np.bitwise_xor(binary, query_bits)].sum(axis=1, dtype=np.uint16)
+        return _top_k(-distances.astype(np.int32), count)
+
+    def _int8_candidates(
+        self,
+        int8: Tuple[np.ndarray, np.ndarray],
+        query_embedding: np.ndarray,
+        count: int
+    ) -> np.ndarray:
+        """Row indices of the `count` best rows by int8 dot product (4x less memory traffic)."""
+        codes, scales = int8
+        query_codes, _ = _quantize_int8(query_embedding)
+        kernel = _get_numba_kernel('int8')
+        return _top_k(kernel(codes, scales, query_codes[0]), count)
+
+    def _embeddings_fingerprint(self) -> list:
+        """
+        Fingerprint of the embeddings table: [epoch, version] of its change counter.
+
+        Triggers bump the version on every write, also by other processes
+        (sync service, scripts), and a restored database gets a new epoch.
+        One primary-key lookup instead of a table scan.
+        """
+        with self._connection() as conn:
+            return self.db.get_embeddings_version(conn)
+
+    def _load_matrix(self) -> Dict:
+        """
+        Get the embedding matrix, building or loading the cache when stale.
+
+        Returns:
+            Dict with parallel per-row arrays: 'embeddings' (float32 [N, D],
+            unit-length rows), 'doc_ids' (int32 [N]), 'chunk_idx' (int32 [N])
+            and 'texts' (list of N chunk texts)
+        """
+        fingerprint = self._embeddings_fingerprint()
+        if self._matrix is not None and self._matrix['fingerprint'] == fingerprint:
+            return self._matrix
+
+        matrix = self._read_matrix_cache(fingerprint)
+        if matrix is None:
+            matrix = self._build_matrix(fingerprint)
+
+        embeddings = matrix['embeddings']
+
+        # Approximate nearest neighbour index for large matrices
+        matrix['ann'] = None
+        if HNSWLIB_AVAILABLE and len(embeddings) >= Config.ANN_MIN_CHUNKS:
+            matrix['ann'] = self._load_ann_index(embeddings, reuse=matrix['from_cache'])
+
+        # Sign bits packed into uint8 (D/8 bytes per row) for the binary prefilter
+        matrix['binary'] = None
+        if matrix['ann'] is None and len(embeddings) >= Config.BINARY_SEARCH_MIN_CHUNKS:
+            matrix['binary'] = np.packbits(embeddings > 0, axis=1)
+
+        # int8 codes + per-row scale for the int8 prefilter (needs the numba kernel)
+        matrix['int8'] = None
+        if (
+            matrix['ann'] is None and matrix['binary'] is None and NUMBA_AVAILABLE
+            and len(embeddings) >= Config.INT8_SEARCH_MIN_CHUNKS
+        ):
+            matrix['int8'] = _quantize_int8(embeddings)
+
+        self._matrix = matrix
+        return matrix
+
+    def _read_matrix_cache(self, fingerprint: list) -> Optional[Dict]:
+        """Load the persisted matrix (memory-mapped) if it matches the fingerprint."""
+        if not self.matrix_cache_path.exists() or not self.matrix_meta_path.exists():
+            return None
+        try:
+            with open(self.matrix_meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != MATRIX_CACHE_VERSION or meta.get('fingerprint') != fingerprint:
+                return None
+            embeddings = np.load(self.matrix_cache_path, mmap_mode='r')
+            logger.debug(f'Loaded embedding matrix cache: {len(meta["texts"])} chunks')
+            return {
+                'fingerprint': fingerprint,
+                'embeddings': embeddings,
+                'doc_ids': np.asarray(meta['doc_ids'], dtype=np.int32),
+                'chunk_idx': np.asarray(meta['chunk_idx'], dtype=np.int32),
+                'texts': meta['texts'],
+                'from_cache': True
+            }
+        except Exception as e:
+            logger.warning(f'Could not read embedding matrix cache: {e}')
+            return None
+
+    def _build_matrix(self, fingerprint: list) -> Dict:
+        """Build the embedding matrix from the database and persist it."""
+        rows = self._get_all_embeddings()
+        count = len(rows)
+        doc_ids = np.fromiter((r[0] for r in rows), dtype=np.int32, count=count)
+        chunk_idx = np.fromiter((r[1] for r in rows), dtype=np.int32, count=count)
+        texts = [r[2] for r in rows]
+        if rows:
+            # One contiguous buffer instead of N small arrays
+            embeddings = np.frombuffer(
+                bytearray(b''.join(r[3] for r in rows)), dtype=np.float32
+            ).reshape(count, -1)
+            # Rows from an older index were stored unnormalized
+            legacy = np.fromiter((r[4] != self.model_tag for r in rows), dtype=bool, count=count)
+            if legacy.any():
+                norms = np.linalg.norm(embeddings[legacy], axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                embeddings[legacy] /= norms
+        else:
+            embeddings = np.zeros((0, 0), dtype=np.float32)
+
+        try:
+            # An HNSW index built for the previous matrix is stale now
+            if self.ann_cache_path.exists():
+                self.ann_cache_path.unlink()
+            tmp_path = self.matrix_cache_path.with_suffix('.npy.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.save(f, embeddings)
+            tmp_path.replace(self.matrix_cache_path)
+            with open(self.matrix_meta_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': MATRIX_CACHE_VERSION,
+                    'fingerprint': fingerprint,
+                    'doc_ids': doc_ids.tolist(),
+                    'chunk_idx': chunk_idx.tolist(),
+                    'texts': texts
+                }, f, ensure_ascii=False)
+        except Exception as e:
+            logger.warning(f'Could not write embedding matrix cache: {e}')
+
+        logger.info(f'Built embedding matrix: {count} chunks')
+        return {
+            'fingerprint': fingerprint,
+            'embeddings': embeddings,
+            'doc_ids': doc_ids,
+            'chunk_idx': chunk_idx,
+            'texts': texts,
+            'from_cache': False
+        }
+
+    def _load_ann_index(self, embeddings: np.ndarray, reuse: bool):
+        """
+        Get an HNSW index over the matrix rows (label = row index).
+
+        Loads the persisted index when the matrix itself came from the cache,
+        otherwise builds it and saves it next to the matrix cache.
+        """
+        count, dim = embeddings.shape
+        if reuse and self.ann_cache_path.exists():
+            try:
+                ann = hnswlib.Index(space='cosine', dim=dim)
+                ann.load_index(str(self.ann_cache_path), max_elements=count)
+                if ann.get_current_count() == count:
+                    ann.set_ef(Config.ANN_EF_SEARCH)
+                    logger.debug(f'Loaded HNSW index: {count} chunks')
+                    return ann
+            except Exception as e:
+                logger.warning(f'Could not load HNSW index: {e}')
+
+        with LogContext(logger, 'build_ann_index', count=count):
+            ann = hnswlib.Index(space='cosine', dim=dim)
+            ann.init_index(max_elements=count, ef_construction=200, M=Config.ANN_M)
+            ann.add_items(np.asarray(embeddings, dtype=np.float32), np.arange(count))
+            ann.set_ef(Config.ANN_EF_SEARCH)
+
+        try:
+            ann.save_index(str(self.ann_cache_path))
+        except Exception as e:
+            logger.warning(f'Could not save HNSW index: {e}')
+        return ann
+
+    def _invalidate_matrix_cache(self):
+        """Drop the in-memory and persisted embedding matrix."""
+        self._matrix = None
+        for path in (self.matrix_cache_path, self.matrix_meta_path, self.ann_cache_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f'Could not remove {path}: {e}')
+
+    def _get_all_embeddings(self) -> List[Tuple]:
+        """Get all embedding rows as (document_id, chunk_index, chunk_text, embedding, model)."""
+        with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
-                SELECT document_id, chunk_index, chunk_text, embedding
+                SELECT document_id, chunk_index, chunk_text, embedding, model
                 FROM embeddings
             ''')
-            return [
-                {
-                    'document_id': row[0],
-                    'chunk_index': row[1],
-                    'chunk_text': row[2],
-                    'embedding': row[3]
-                }
-                for row in cursor.fetchall()
-            ]
+            return cursor.fetchall()
 
     def _enrich_results(self, results: List[SearchResult]):
         """Add document metadata to results."""
+        doc_ids = list({r.document_id for r in results})
+        if not doc_ids:
+            return
+
+        # Fetch title + meeting date for all result documents in one query
+        placeholders = ','.join('?' * len(doc_ids))
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT d.id, d.title, m.date
+                FROM documents d
+                LEFT JOIN meetings m ON d.meeting_id = m.id
+                WHERE d.id IN ({placeholders})
+            ''', doc_ids)
+            metadata = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
         for result in results:
-            doc = self.db.get_document(result.document_id)
-            if doc:
-                result.document_title = doc.get('title', '')
-                # Get meeting date
-                if doc.get('meeting_id'):
-                    meeting = self.db.get_meeting(meeting_id=doc['meeting_id'])
-                    if meeting:
-                        result.meeting_date = meeting.get('date', '')
+            if result.document_id in metadata:
+                title, meeting_date = metadata[result.document_id]
+                result.document_title = title or ''
+                result.meeting_date = meeting_date or ''
 
     def get_index_stats(self) -> Dict:
         """Get indexing statistics."""
-        with self.db._get_connection() as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute('SELECT COUNT(*) FROM embeddings')
@@ -355,6 +1124,19 @@ class DocumentIndex:
         }
 
 
+def _index_documents_worker(document_ids: List[int], db_path: str) -> Tuple[int, int]:
+    """Index a shard of documents in a worker process (own connection and model)."""
+    index = DocumentIndex(Database(Path(db_path)))
+    total_docs = 0
+    total_chunks = 0
+    for document_id in document_ids:
+        chunks = index.index_document(document_id)
+        if chunks > 0:
+            total_docs += 1
+            total_chunks += chunks
+    return total_docs, total_chunks
+
+
 # Singleton instance
 _index_instance = None
 
@@ -15,9 +15,19 @@ Zie agents/*.yaml voor beschikbare agents.
 """
 
 import asyncio
+import contextvars
+import functools
+import itertools
 import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Any
+from typing import Any, Callable
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -32,33 +42,275 @@ from mcp.types import (
 )
 
 from core.config import Config
-from core.database import get_database
-from core.document_index import get_document_index
-from core.coalitie_tracker import get_coalitie_tracker
-from providers.meeting_provider import get_meeting_provider
-from providers.document_provider import get_document_provider
-from providers.notubiz_client import get_notubiz_client
-from providers.search_sync_provider import get_search_sync_provider
-from providers.document_generator import get_document_generator
-from providers.election_program_provider import get_election_program_provider
-from providers.standpunt_provider import get_standpunt_provider
-from providers.visit_report_provider import get_visit_report_provider
-from agents import get_agent_loader, get_agent
+from core.database import Database, get_database
+from core.document_index import DocumentIndex, get_document_index
+from core.coalitie_tracker import CoalitieTracker, get_coalitie_tracker
+from providers.meeting_provider import MeetingProvider, get_meeting_provider
+from providers.document_provider import DocumentProvider, get_document_provider
+from providers.notubiz_client import NotubizClient, get_notubiz_client
+from providers.search_sync_provider import SearchSyncProvider, get_search_sync_provider
+from providers.document_generator import DocumentGenerator, get_document_generator
+from providers.election_program_provider import ElectionProgramProvider, get_election_program_provider
+from providers.standpunt_provider import StandpuntProvider, get_standpunt_provider
+from providers.visit_report_provider import VisitReportProvider, get_visit_report_provider
+from providers.summary_provider import SummaryProvider, get_summary_provider
+from providers.dossier_provider import DossierProvider, get_dossier_provider
+from agents import AgentLoader, get_agent_loader
 from shared.logging_config import get_mcp_logger
 
+# Snelle JSON encoder (optioneel)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_mcp_logger()
 
 # Initialize MCP server
 server = Server(Config.SERVER_NAME)
 
+
+@dataclass(slots=True, frozen=True)
+class Services:
+    """The long-lived singletons used by the handlers, resolved once."""
+    db: Database
+    doc_index: DocumentIndex
+    coalitie: CoalitieTracker
+    meeting_provider: MeetingProvider
+    doc_provider: DocumentProvider
+    notubiz: NotubizClient
+    search_sync: SearchSyncProvider
+    doc_gen: DocumentGenerator
+    election: ElectionProgramProvider
+    standpunt: StandpuntProvider
+    visit: VisitReportProvider
+    summary: SummaryProvider
+    dossier: DossierProvider
+    agents: AgentLoader
+
+    @classmethod
+    def resolve(cls) -> 'Services':
+        """Collect the instances from the get_*() singleton factories."""
+        return cls(
+            db=get_database(),
+            doc_index=get_document_index(),
+            coalitie=get_coalitie_tracker(),
+            meeting_provider=get_meeting_provider(),
+            doc_provider=get_document_provider(),
+            notubiz=get_notubiz_client(),
+            search_sync=get_search_sync_provider(),
+            doc_gen=get_document_generator(),
+            election=get_election_program_provider(),
+            standpunt=get_standpunt_provider(),
+            visit=get_visit_report_provider(),
+            summary=get_summary_provider(),
+            dossier=get_dossier_provider(),
+            agents=get_agent_loader(),
+        )
+
+
+# Vervang voor tests met een eigen Services instantie
+SERVICES = Services.resolve()
+
 # Track if initial sync is done
 _initial_sync_done = False
+_initial_sync_lock = asyncio.Lock()
+
+# Agent naam -> (AgentDefinition, Prompt) voor list_prompts
+_prompt_cache: dict[str, tuple[Any, Prompt]] = {}
+
+# Handlers doen blokkerende DB/HTTP/model calls: uitvoeren buiten de event loop
+_tool_executor = ThreadPoolExecutor(max_workers=Config.MCP_TOOL_WORKERS, thread_name_prefix='tool')
+
+
+async def _run_blocking(func, *args, **kwargs) -> Any:
+    """Run a blocking call on the handler thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    # Copy the context so the call sees request state such as _progress
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _tool_executor, context.run, functools.partial(func, *args, **kwargs)
+    )
+
+
+# Voortgangscallback van de lopende tool call (None als de client geen progressToken meestuurt)
+_progress: contextvars.ContextVar[Callable[[str], None] | None] = contextvars.ContextVar(
+    '_progress', default=None
+)
+
+
+def _progress_reporter() -> Callable[[str], None] | None:
+    """Progress callback for the current request, if the client asked for progress."""
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return None
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    counter = itertools.count(1)
+
+    def report(message: str):
+        # Called from a handler thread: the notification is sent by the event loop
+        logger.debug(f'Progress: {message}')
+        progress = next(counter)
+        try:
+            coro = ctx.session.send_progress_notification(token, progress, message=message)
+        except TypeError:
+            # Older mcp versions have no message field
+            coro = ctx.session.send_progress_notification(token, progress)
+        asyncio.run_coroutine_threadsafe(coro, loop)
+
+    return report
+
+
+# Database statistieken voor prompt context mogen even oud zijn
+STATS_CACHE_TTL = 30.0
+_stats_cache: tuple[float, dict] | None = None
+# Opgemaakt statistiekenblok voor de agent context, per statistieken-dict
+_stats_context: tuple[dict, str] | None = None
+
+
+def _get_statistics_cached() -> dict:
+    """Database statistics, cached for STATS_CACHE_TTL seconds."""
+    global _stats_cache
+
+    now = time.monotonic()
+    if _stats_cache is not None and now - _stats_cache[0] < STATS_CACHE_TTL:
+        return _stats_cache[1]
+
+    stats = SERVICES.db.get_statistics()
+    _stats_cache = (now, stats)
+    return stats
+
+
+def _stats_context_block() -> str:
+    """'Database status' block for agent prompts, formatted once per statistics snapshot."""
+    global _stats_context
+
+    stats = _get_statistics_cached()
+    cached = _stats_context
+    if cached is not None and cached[0] is stats:
+        return cached[1]
+
+    block = f"""Database status:
+- {stats.get('meetings', 0)} vergaderingen
+- {stats.get('documents', 0)} documenten
+- {stats.get('agenda_items', 0)} agendapunten"""
+    _stats_context = (stats, block)
+    return block
+
+
+def _invalidate_statistics():
+    """Drop cached statistics and tool responses after a sync changed the database."""
+    global _stats_cache
+    _stats_cache = None
+    _tool_cache_clear()
+
+
+# Opgemaakte antwoorden van tools die alleen de lokale database lezen, per (naam, argumenten)
+TOOL_CACHE_TTL = 60.0
+TOOL_CACHE_SIZE = 512
+_READ_ONLY_TOOLS = frozenset({
+    "get_meetings", "get_meeting_details", "get_meetings_bulk", "get_agenda_items", "get_document",
+    "search_documents", "get_annotations", "get_gremia", "get_coalitie_akkoord",
+    "search_election_programs", "compare_party_positions", "get_party_history",
+    "search_standpunten", "compare_standpunten", "get_standpunt_history",
+    "get_party_context", "list_raadsleden", "get_standpunt_topics",
+    "list_visit_reports", "get_visit_report", "search_visit_reports",
+    "search_transcriptions", "get_dossier", "list_dossiers", "get_dossier_timeline",
+    # Aggregaten (COUNT over meerdere tabellen) die dashboards vaak opvragen
+    "get_statistics",
+    # Niet get_transcription_status / get_party_sync_status: die volgen achtergrondtaken
+})
+_tool_cache: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+# Handlers clear the cache from worker threads while the event loop reads it
+_tool_cache_lock = threading.Lock()
+# Bumped by every clear; a response computed across a clear is not stored
+_tool_cache_generation = 0
+
+
+def _tool_cache_key(name: str, arguments: dict | None) -> tuple[str, str] | None:
+    """Cache key for a read-only tool call, None for tools that are not cached."""
+    if name not in _READ_ONLY_TOOLS:
+        return None
+    return name, json.dumps(arguments or {}, sort_keys=True, default=str)
+
+
+def _tool_cache_get(key: tuple[str, str]) -> tuple[str | None, int]:
+    """
+    Cached response text (None if absent or older than TOOL_CACHE_TTL) and
+    the current generation, to pass to _tool_cache_put after a miss.
+    """
+    with _tool_cache_lock:
+        entry = _tool_cache.get(key)
+        if entry is None:
+            return None, _tool_cache_generation
+        if time.monotonic() - entry[0] >= TOOL_CACHE_TTL:
+            _tool_cache.pop(key, None)
+            return None, _tool_cache_generation
+        _tool_cache.move_to_end(key)
+        return entry[1], _tool_cache_generation
+
+
+def _tool_cache_put(key: tuple[str, str], text: str, generation: int):
+    """
+    Store a response text, evicting the least recently used entry when full.
+
+    Dropped when the cache was cleared since `generation`: the handler may
+    have read data from before that write.
+    """
+    with _tool_cache_lock:
+        if generation != _tool_cache_generation:
+            return
+        _tool_cache[key] = (time.monotonic(), text)
+        _tool_cache.move_to_end(key)
+        if len(_tool_cache) > TOOL_CACHE_SIZE:
+            _tool_cache.popitem(last=False)
+
+
+def _tool_cache_clear():
+    """Forget all cached responses (after anything may have written to the database)."""
+    global _tool_cache_generation
+    with _tool_cache_lock:
+        _tool_cache_generation += 1
+        _tool_cache.clear()
+
+
+def _as_int(value: Any, field: str) -> int:
+    """Convert a (string) argument to int, with a clear error for bad input."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid {field}: {value!r}") from None
+
+
+# Download URL van een document bij Notubiz (voor documenten zonder eigen url)
+_NOTUBIZ_DOC_URL = 'https://api.notubiz.nl/document/{}/1'.format
+
+
+# Compact JSON op de wire; ingesprongen alleen met DEBUG_PRETTY_JSON
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if Config.DEBUG_PRETTY_JSON:
+        _ORJSON_OPTIONS |= orjson.OPT_INDENT_2
+_JSON_KWARGS = (
+    {'indent': 2} if Config.DEBUG_PRETTY_JSON else {'separators': (',', ':')}
+)
 
 
 def format_response(data: Any, success: bool = True) -> str:
     """Format response data as JSON string."""
     if isinstance(data, (dict, list)):
-        return json.dumps(data, ensure_ascii=False, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode('utf-8')
+            except TypeError:
+                pass  # e.g. integers beyond 64 bit: fall back to the stdlib encoder
+        return json.dumps(data, ensure_ascii=False, default=str, **_JSON_KWARGS)
     return str(data)
 
 
@@ -68,136 +320,183 @@ async def perform_initial_sync():
     """Perform initial data sync if database is empty."""
     global _initial_sync_done
 
-    if _initial_sync_done or not Config.AUTO_SYNC_ENABLED:
+    if _initial_sync_done:
+        return
+    if not Config.AUTO_SYNC_ENABLED:
+        _initial_sync_done = True
         return
 
-    db = get_database()
-    stats = db.get_statistics()
+    # Sync stages run in threads; other handlers wait here instead of starting a second sync
+    async with _initial_sync_lock:
+        if _initial_sync_done:
+            return
 
-    # Check if we need to sync
-    if stats.get('meetings', 0) == 0:
-        logger.info('Database empty - performing initial sync...')
+        # Check if we need to sync (one EXISTS probe instead of all statistics)
+        db = SERVICES.db
+        if not db.has_meetings():
+            logger.info('Database empty - performing initial sync...')
 
-        meeting_provider = get_meeting_provider()
-        doc_provider = get_document_provider()
+            # Loading the embedding model does not depend on the sync: do it meanwhile
+            stages = [asyncio.to_thread(_initial_sync_pipeline)]
+            if Config.AUTO_INDEX_DOCS:
+                stages.append(asyncio.to_thread(_warm_up_embeddings))
+            await asyncio.gather(*stages)
 
-        # Sync gremia first
-        meeting_provider.sync_gremia()
+            # Index documents if enabled
+            if Config.AUTO_INDEX_DOCS:
+                logger.info('Indexing documents for semantic search...')
+                index = SERVICES.doc_index
+                indexed, chunks = await asyncio.to_thread(index.index_all_documents)
+                logger.info(f'Indexed {indexed} documents, {chunks} chunks')
 
-        # Sync meetings
-        date_from = (date.today() - timedelta(days=Config.AUTO_SYNC_DAYS)).isoformat()
-        meetings, docs = meeting_provider.sync_meetings(
-            date_from=date_from,
-            full_details=True
-        )
-        logger.info(f'Initial sync: {meetings} meetings, {docs} documents')
+            _invalidate_statistics()
+
+        _initial_sync_done = True
+
+
+async def _background_initial_sync():
+    """Run the initial sync as a background task; handlers that need data await it via the lock."""
+    try:
+        await perform_initial_sync()
+    except Exception as e:
+        # Not marked done: the next handler that needs data retries
+        logger.error(f'Initial sync failed: {e}')
+
+
+def _initial_sync_pipeline():
+    """Gremia -> meetings -> documents; each stage needs the previous one's data."""
+    meeting_provider = SERVICES.meeting_provider
+    doc_provider = SERVICES.doc_provider
+
+    # Sync gremia first
+    meeting_provider.sync_gremia()
+
+    # Sync meetings
+    date_from = (date.today() - timedelta(days=Config.AUTO_SYNC_DAYS)).isoformat()
+    meetings, docs = meeting_provider.sync_meetings(
+        date_from=date_from,
+        full_details=True
+    )
+    logger.info(f'Initial sync: {meetings} meetings, {docs} documents')
 
-        # Download documents if enabled
-        if Config.AUTO_DOWNLOAD_DOCS:
-            logger.info('Downloading documents...')
-            success, failed = doc_provider.download_pending_documents()
-            logger.info(f'Downloaded {success} documents, {failed} failed')
+    # Download documents if enabled
+    if Config.AUTO_DOWNLOAD_DOCS:
+        logger.info('Downloading documents...')
+        success, failed = doc_provider.download_pending_documents()
+        logger.info(f'Downloaded {success} documents, {failed} failed')
 
-            # Extract text
-            doc_provider.extract_all_text()
+        # Extract text
+        doc_provider.extract_all_text()
 
-        # Index documents if enabled
-        if Config.AUTO_INDEX_DOCS:
-            logger.info('Indexing documents for semantic search...')
-            index = get_document_index()
-            indexed, chunks = index.index_all_documents()
-            logger.info(f'Indexed {indexed} documents, {chunks} chunks')
 
-    _initial_sync_done = True
+def _warm_up_embeddings():
+    """Load the embedding model ahead of indexing."""
+    try:
+        SERVICES.doc_index._load_model()
+    except Exception as e:
+        logger.warning(f'Could not preload embedding model: {e}')
 
 
 # ==================== MCP Resources ====================
 
 @server.list_resources()
 async def list_resources() -> list[Resource]:
-    """List available resources."""
-    await perform_initial_sync()
+    """List available resources (what is in the database now; the initial sync runs in the background)."""
+    db = SERVICES.db
 
-    db = get_database()
-    resources = []
+    # Two independent SQLite queries: run them side by side, off the event loop
+    meetings, gremia = await asyncio.gather(
+        _run_blocking(db.get_meetings, limit=20),
+        _run_blocking(db.get_gremia),
+    )
 
-    # Add recent meetings as resources
-    meetings = db.get_meetings(limit=20)
-    for m in meetings:
-        resources.append(Resource(
+    # Recent meetings and gremia as resources
+    return [
+        Resource(
             uri=f"baarn://meeting/{m['id']}",
             name=f"Vergadering: {m['title']}",
             description=f"Vergadering van {m['date']}",
             mimeType="application/json"
-        ))
-
-    # Add gremia as resources
-    gremia = db.get_gremia()
-    for g in gremia:
-        resources.append(Resource(
+        )
+        for m in meetings
+    ] + [
+        Resource(
             uri=f"baarn://gremium/{g['id']}",
             name=f"Commissie: {g['name']}",
             description=g.get('description', ''),
             mimeType="application/json"
-        ))
+        )
+        for g in gremia
+    ]
 
-    return resources
+
+# Resource templates zijn statisch
+_RESOURCE_TEMPLATES: list[ResourceTemplate] = [
+    ResourceTemplate(
+        uriTemplate="baarn://meeting/{meeting_id}",
+        name="Vergadering details",
+        description="Haal details op van een specifieke vergadering",
+        mimeType="application/json"
+    ),
+    ResourceTemplate(
+        uriTemplate="baarn://document/{document_id}",
+        name="Document inhoud",
+        description="Haal inhoud op van een specifiek document",
+        mimeType="application/json"
+    ),
+    ResourceTemplate(
+        uriTemplate="baarn://gremium/{gremium_id}/meetings",
+        name="Vergaderingen per commissie",
+        description="Alle vergaderingen van een specifieke commissie",
+        mimeType="application/json"
+    ),
+]
 
 
 @server.list_resource_templates()
 async def list_resource_templates() -> list[ResourceTemplate]:
     """List resource templates."""
-    return [
-        ResourceTemplate(
-            uriTemplate="baarn://meeting/{meeting_id}",
-            name="Vergadering details",
-            description="Haal details op van een specifieke vergadering",
-            mimeType="application/json"
-        ),
-        ResourceTemplate(
-            uriTemplate="baarn://document/{document_id}",
-            name="Document inhoud",
-            description="Haal inhoud op van een specifiek document",
-            mimeType="application/json"
-        ),
-        ResourceTemplate(
-            uriTemplate="baarn://gremium/{gremium_id}/meetings",
-            name="Vergaderingen per commissie",
-            description="Alle vergaderingen van een specifieke commissie",
-            mimeType="application/json"
-        ),
-    ]
+    return _RESOURCE_TEMPLATES
+
+
+# baarn://<soort>/<id>[/meetings]
+_RESOURCE_URI_RE = re.compile(r'^baarn://(meeting|document|gremium)/(\d+)(?:/(meetings))?/?$')
 
 
 @server.read_resource()
 async def read_resource(uri: str) -> str:
     """Read a specific resource."""
-    await perform_initial_sync()
-
-    parts = uri.replace("baarn://", "").split("/")
-
-    if parts[0] == "meeting" and len(parts) >= 2:
-        meeting_id = int(parts[1])
-        provider = get_meeting_provider()
-        meeting = provider.get_meeting(meeting_id=meeting_id)
+    if not _initial_sync_done:
+        await perform_initial_sync()
+
+    match = _RESOURCE_URI_RE.match(str(uri))
+    if not match:
+        return '{"error": "Unknown resource"}'
+    kind, id_str, sub = match.groups()
+    # The regex only accepts digits, so int() cannot fail here
+    return await _run_blocking(_read_resource, kind, int(id_str), sub)
+
+
+def _read_resource(kind: str, resource_id: int, sub: str | None) -> str:
+    """Fetch a parsed resource URI; blocking, runs on the handler thread pool."""
+    if kind == "meeting":
+        provider = SERVICES.meeting_provider
+        meeting = provider.get_meeting(meeting_id=resource_id)
         return format_response(meeting) if meeting else '{"error": "Meeting not found"}'
 
-    elif parts[0] == "document" and len(parts) >= 2:
-        doc_id = int(parts[1])
-        provider = get_document_provider()
-        doc = provider.get_document(doc_id)
+    elif kind == "document":
+        provider = SERVICES.doc_provider
+        doc = provider.get_document(resource_id)
         return format_response(doc) if doc else '{"error": "Document not found"}'
 
-    elif parts[0] == "gremium" and len(parts) >= 2:
-        gremium_id = int(parts[1])
-        db = get_database()
+    elif kind == "gremium":
+        db = SERVICES.db
 
-        if len(parts) >= 3 and parts[2] == "meetings":
-            meetings = db.get_meetings(gremium_id=gremium_id, limit=100)
-            return format_response({"gremium_id": gremium_id, "meetings": meetings})
+        if sub == "meetings":
+            meetings = db.get_meetings(gremium_id=resource_id, limit=100)
+            return format_response({"gremium_id": resource_id, "meetings": meetings})
         else:
-            gremia = db.get_gremia()
-            gremium = next((g for g in gremia if g['id'] == gremium_id), None)
+            gremium = db.get_gremium(resource_id)
             return format_response(gremium) if gremium else '{"error": "Gremium not found"}'
 
     return '{"error": "Unknown resource"}'
@@ -208,9 +507,13 @@ async def read_resource(uri: str) -> str:
 @server.list_prompts()
 async def list_prompts() -> list[Prompt]:
     """List available prompts/agents - dynamically loaded from YAML files."""
-    loader = get_agent_loader()
+    loader = SERVICES.agents
     agents = loader.load_agents()
 
+    # Forget cached prompts of agents whose YAML file was removed
+    for stale in _prompt_cache.keys() - agents.keys():
+        del _prompt_cache[stale]
+
     if Config.FORCE_ORCHESTRATOR:
         orchestrator = agents.get(Config.ORCHESTRATOR_AGENT_NAME)
         if not orchestrator:
@@ -218,92 +521,87 @@ async def list_prompts() -> list[Prompt]:
             return []
         agents = {orchestrator.name: orchestrator}
 
-    prompts = []
-    for agent in agents.values():
-        prompts.append(Prompt(
-            name=agent.name,
-            description=agent.prompt.description.strip(),
-            arguments=[
-                PromptArgument(
-                    name=arg.name,
-                    description=arg.description,
-                    required=arg.required
-                )
-                for arg in agent.prompt.arguments
-            ]
-        ))
+    prompts = [_agent_prompt(agent) for agent in agents.values()]
 
-    logger.info(f'Loaded {len(prompts)} agents from YAML files')
+    logger.debug(f'Listed {len(prompts)} agent prompts')
     return prompts
 
 
+def _agent_prompt(agent) -> Prompt:
+    """MCP Prompt for an agent, built once per loaded agent definition."""
+    cached = _prompt_cache.get(agent.name)
+    # The loader creates new definitions when the YAML changes
+    if cached is not None and cached[0] is agent:
+        return cached[1]
+
+    prompt = Prompt(
+        name=agent.name,
+        description=agent.prompt.description.strip(),
+        arguments=[
+            PromptArgument(
+                name=arg.name,
+                description=arg.description,
+                required=arg.required
+            )
+            for arg in agent.prompt.arguments
+        ]
+    )
+    _prompt_cache[agent.name] = (agent, prompt)
+    return prompt
+
+
+_AGENT_PROMPT_SUFFIX = "\n\nBegin nu met je taak. Gebruik de beschikbare MCP tools om informatie op te halen."
+
+
 @server.get_prompt()
 async def get_prompt(name: str, arguments: dict | None = None) -> list[PromptMessage]:
     """Get a specific prompt/agent - loads system prompt from YAML."""
-    await perform_initial_sync()
+    if not _initial_sync_done:
+        await perform_initial_sync()
 
-    if Config.FORCE_ORCHESTRATOR and name != Config.ORCHESTRATOR_AGENT_NAME:
+    routed = Config.FORCE_ORCHESTRATOR and name != Config.ORCHESTRATOR_AGENT_NAME
+    if routed:
         logger.info(f"Routing prompt '{name}' to orchestrator")
         name = Config.ORCHESTRATOR_AGENT_NAME
 
     args = arguments or {}
 
     # Try to get agent from YAML files
-    agent = get_agent(name)
+    agent = SERVICES.agents.get_agent(name)
 
     if agent:
         # Build context based on arguments
-        context = await _build_agent_context(name, args)
+        # Routed calls carry the original agent's arguments: keep them all
+        context = await _run_blocking(_build_agent_context, agent, args, declared_only=not routed)
 
         # Combine system prompt with context
-        full_prompt = f"""{agent.system_prompt}
-
-{context}
-
-Begin nu met je taak. Gebruik de beschikbare MCP tools om informatie op te halen."""
-
-        return [
-            PromptMessage(
-                role="user",
-                content=TextContent(
-                    type="text",
-                    text=full_prompt
-                )
-            )
-        ]
+        return _user_prompt(''.join((agent.prompt_prefix, context, _AGENT_PROMPT_SUFFIX)))
 
     # Fallback to hardcoded prompts for backwards compatibility
-    if name == "vergadering-analist":
-        return await _prompt_vergadering_analist(args)
-    elif name == "document-zoeker":
-        return await _prompt_document_zoeker(args)
-    elif name == "besluit-tracker":
-        return await _prompt_besluit_tracker(args)
-    elif name == "raadslid-assistent":
-        return await _prompt_raadslid_assistent(args)
-    elif name == "vergadering-voorbereiding":
-        return await _prompt_vergadering_voorbereiding(args)
-    else:
+    builder = _FALLBACK_PROMPTS.get(name)
+    if builder is None:
         raise ValueError(f"Unknown prompt: {name}")
+    return await _run_blocking(builder, args)
 
 
-async def _build_agent_context(name: str, args: dict) -> str:
-    """Build context string based on agent name and arguments."""
+def _build_agent_context(agent, args: dict, declared_only: bool = True) -> str:
+    """Build context string based on the agent definition and arguments."""
     context_parts = []
 
+    if declared_only:
+        # Only arguments the agent declares; skips e.g. a meeting fetch it never asked for
+        fields = agent.context_fields
+        args = {key: value for key, value in args.items() if key in fields}
+
     # Add database stats
-    db = get_database()
-    stats = db.get_statistics()
-    context_parts.append(f"""Database status:
-- {stats.get('meetings', 0)} vergaderingen
-- {stats.get('documents', 0)} documenten
-- {stats.get('agenda_items', 0)} agendapunten""")
+    if agent.include_stats:
+        context_parts.append(_stats_context_block())
 
     # Add meeting context if meeting_id provided
     if args.get('meeting_id') or args.get('vergadering_id'):
         meeting_id = args.get('meeting_id') or args.get('vergadering_id')
-        provider = get_meeting_provider()
-        meeting = provider.get_meeting(meeting_id=int(meeting_id))
+        provider = SERVICES.meeting_provider
+        meeting = provider.get_meeting(meeting_id=_as_int(meeting_id, 'meeting_id'))
         if meeting:
             context_parts.append(f"""Geselecteerde vergadering:
 - Titel: {meeting['title']}
@@ -333,25 +631,15 @@ async def _build_agent_context(name: str, args: dict) -> str:
     return "\n\n".join(context_parts)
 
 
-async def _prompt_vergadering_analist(args: dict) -> list[PromptMessage]:
-    """Generate vergadering-analist prompt."""
-    meeting_data = ""
-    provider = get_meeting_provider()
-
-    if args.get('meeting_id'):
-        meeting = provider.get_meeting(meeting_id=int(args['meeting_id']))
-        if meeting:
-            meeting_data = f"\n\nVergadering data:\n{format_response(meeting)}"
+def _user_prompt(text: str) -> list[PromptMessage]:
+    """Wrap prompt text as a single user message."""
+    # Our own trusted values: model_construct skips pydantic validation
+    content = TextContent.model_construct(type="text", text=text)
+    return [PromptMessage.model_construct(role="user", content=content)]
 
-    focus = args.get('focus', '')
-    focus_instruction = f"\nFocus specifiek op: {focus}" if focus else ""
 
-    return [
-        PromptMessage(
-            role="user",
-            content=TextContent(
-                type="text",
-                text=f"""Je bent een vergadering-analist voor de gemeente Baarn.
+# Vaste tekst van de hardcoded prompts; alleen de {velden} verschillen per aanroep
+_PROMPT_VERGADERING_ANALIST = """Je bent een vergadering-analist voor de gemeente Baarn.
 Je taak is om vergaderingen te analyseren en heldere samenvattingen te maken.
 
 Gebruik de beschikbare tools om:
@@ -369,24 +657,8 @@ Maak een analyse met:
 {focus_instruction}{meeting_data}
 
 Begin met het ophalen van de benodigde informatie."""
-            )
-        )
-    ]
-
-
-async def _prompt_document_zoeker(args: dict) -> list[PromptMessage]:
-    """Generate document-zoeker prompt."""
-    onderwerp = args.get('onderwerp', 'algemeen')
-    periode = args.get('periode', '')
 
-    periode_instruction = f"\nZoek binnen periode: {periode}" if periode else ""
-
-    return [
-        PromptMessage(
-            role="user",
-            content=TextContent(
-                type="text",
-                text=f"""Je bent een document-zoeker voor de gemeente Baarn.
+_PROMPT_DOCUMENT_ZOEKER = """Je bent een document-zoeker voor de gemeente Baarn.
 Je helpt bij het vinden van relevante documenten over specifieke onderwerpen.
 
 Onderwerp: {onderwerp}
@@ -405,24 +677,8 @@ Geef voor elk gevonden document:
 - Link naar de vergadering
 
 Begin met een brede zoektocht en verfijn dan de resultaten."""
-            )
-        )
-    ]
-
-
-async def _prompt_besluit_tracker(args: dict) -> list[PromptMessage]:
-    """Generate besluit-tracker prompt."""
-    onderwerp = args.get('onderwerp', 'algemeen')
-    status = args.get('status', '')
-
-    status_instruction = f"\nFilter op status: {status}" if status else ""
 
-    return [
-        PromptMessage(
-            role="user",
-            content=TextContent(
-                type="text",
-                text=f"""Je bent een besluit-tracker voor de gemeente Baarn.
+_PROMPT_BESLUIT_TRACKER = """Je bent een besluit-tracker voor de gemeente Baarn.
 Je volgt besluiten, moties en amendementen over specifieke onderwerpen.
 
 Onderwerp: {onderwerp}
@@ -441,31 +697,14 @@ Maak een overzicht van:
 - Tijdlijn van de besluitvorming
 
 Sorteer chronologisch en geef context bij elk besluit."""
-            )
-        )
-    ]
-
-
-async def _prompt_raadslid_assistent(args: dict) -> list[PromptMessage]:
-    """Generate raadslid-assistent prompt."""
-    vraag = args.get('vraag', 'Hoe kan ik je helpen?')
-
-    # Get some context
-    db = get_database()
-    stats = db.get_statistics()
 
-    return [
-        PromptMessage(
-            role="user",
-            content=TextContent(
-                type="text",
-                text=f"""Je bent een assistent voor raadsleden van de gemeente Baarn.
+_PROMPT_RAADSLID_ASSISTENT = """Je bent een assistent voor raadsleden van de gemeente Baarn.
 Je hebt toegang tot alle vergaderingen, documenten en besluiten.
 
 Database status:
-- {stats.get('meetings', 0)} vergaderingen
-- {stats.get('documents', 0)} documenten
-- {stats.get('agenda_items', 0)} agendapunten
+- {meetings} vergaderingen
+- {documents} documenten
+- {agenda_items} agendapunten
 
 Vraag van het raadslid: {vraag}
 
@@ -478,29 +717,8 @@ Gebruik de beschikbare tools om de vraag te beantwoorden:
 - get_statistics: Database statistieken
 
 Geef een helder en volledig antwoord met bronverwijzingen."""
-            )
-        )
-    ]
-
-
-async def _prompt_vergadering_voorbereiding(args: dict) -> list[PromptMessage]:
-    """Generate vergadering-voorbereiding prompt."""
-    meeting_id = args.get('meeting_id')
-    datum = args.get('datum')
-
-    context = ""
-    if meeting_id:
-        provider = get_meeting_provider()
-        meeting = provider.get_meeting(meeting_id=int(meeting_id))
-        if meeting:
-            context = f"\n\nVergadering:\n{meeting['title']} op {meeting['date']}"
 
-    return [
-        PromptMessage(
-            role="user",
-            content=TextContent(
-                type="text",
-                text=f"""Je bent een assistent voor vergadervoorbereiding voor de gemeente Baarn.
+_PROMPT_VERGADERING_VOORBEREIDING = """Je bent een assistent voor vergadervoorbereiding voor de gemeente Baarn.
 Je helpt raadsleden bij het voorbereiden op vergaderingen.
 {context}
 
@@ -518,807 +736,944 @@ Maak een voorbereidingsdocument met:
 - Suggesties voor vragen
 
 Begin met het ophalen van de vergaderdetails."""
-            )
-        )
-    ]
 
 
-# ==================== Tool Definitions ====================
+def _prompt_vergadering_analist(args: dict) -> list[PromptMessage]:
+    """Generate vergadering-analist prompt."""
+    meeting_data = ""
+    provider = SERVICES.meeting_provider
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available tools."""
-    await perform_initial_sync()
+    if args.get('meeting_id'):
+        meeting = provider.get_meeting(meeting_id=_as_int(args['meeting_id'], 'meeting_id'))
+        if meeting:
+            meeting_data = f"\n\nVergadering data:\n{format_response(meeting)}"
 
-    return [
-        Tool(
-            name="get_meetings",
-            description="Haal een lijst van vergaderingen op met optionele filters.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {"type": "integer", "description": "Maximum aantal resultaten", "default": 20},
-                    "date_from": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
-                    "date_to": {"type": "string", "description": "Eind datum (YYYY-MM-DD)"},
-                    "search": {"type": "string", "description": "Zoekterm"}
-                }
-            }
-        ),
-        Tool(
-            name="get_meeting_details",
-            description="Haal gedetailleerde informatie op over een specifieke vergadering.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "meeting_id": {"type": "integer", "description": "Database ID van de vergadering"}
-                },
-                "required": ["meeting_id"]
-            }
-        ),
-        Tool(
-            name="get_agenda_items",
-            description="Haal agendapunten op voor een specifieke vergadering.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "meeting_id": {"type": "integer", "description": "Database ID van de vergadering"}
-                },
-                "required": ["meeting_id"]
-            }
-        ),
-        Tool(
-            name="get_document",
-            description="Haal een specifiek document op met metadata en geëxtraheerde tekst.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_id": {"type": "integer", "description": "Database ID van het document"}
-                },
-                "required": ["document_id"]
-            }
-        ),
-        Tool(
-            name="search_documents",
-            description="Zoek in documenten op titel en inhoud (keyword search).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Zoekterm"},
-                    "limit": {"type": "integer", "description": "Maximum resultaten", "default": 20}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="semantic_search",
-            description="Semantisch zoeken met AI embeddings - vindt documenten op basis van betekenis.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Zoekvraag in natuurlijke taal"},
-                    "limit": {"type": "integer", "description": "Maximum resultaten", "default": 10}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="sync_data",
-            description="Synchroniseer data van Notubiz naar de lokale database.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "date_from": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
-                    "date_to": {"type": "string", "description": "Eind datum (YYYY-MM-DD)"},
-                    "download_documents": {"type": "boolean", "description": "Download documenten", "default": False},
-                    "index_documents": {"type": "boolean", "description": "Indexeer voor semantic search", "default": False}
-                }
-            }
-        ),
-        Tool(
-            name="add_annotation",
-            description="Voeg een annotatie/notitie toe.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "Inhoud van de annotatie"},
-                    "document_id": {"type": "integer", "description": "Document ID (optioneel)"},
-                    "meeting_id": {"type": "integer", "description": "Vergadering ID (optioneel)"},
-                    "title": {"type": "string", "description": "Titel (optioneel)"},
-                    "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags"}
-                },
-                "required": ["content"]
-            }
-        ),
-        Tool(
-            name="get_annotations",
-            description="Haal annotaties op.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_id": {"type": "integer", "description": "Filter op document"},
-                    "meeting_id": {"type": "integer", "description": "Filter op vergadering"},
-                    "search": {"type": "string", "description": "Zoekterm"}
-                }
-            }
-        ),
-        Tool(
-            name="get_gremia",
-            description="Haal de lijst van gremia (commissies) op.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="get_statistics",
-            description="Haal statistieken op over de database.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="get_notubiz_status",
-            description="Bekijk de Notubiz API configuratie en auth status. "
-            "Toont of historische data toegankelijk is.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="get_coalitie_akkoord",
-            description="Haal coalitieakkoord informatie op met afspraken en voortgang.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "thema": {"type": "string", "description": "Filter op thema (bijv: 'wonen', 'duurzaamheid')"},
-                    "status": {"type": "string", "description": "Filter op status (niet_gestart, in_voorbereiding, in_uitvoering, gerealiseerd)"}
-                }
-            }
-        ),
-        Tool(
-            name="update_coalitie_afspraak",
-            description="Update de status van een coalitie-afspraak of koppel een besluit.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "afspraak_id": {"type": "string", "description": "ID van de afspraak (bijv: 'wonen-001')"},
-                    "new_status": {"type": "string", "description": "Nieuwe status"},
-                    "link_meeting_id": {"type": "integer", "description": "Meeting ID om te koppelen"}
-                },
-                "required": ["afspraak_id"]
-            }
-        ),
-        Tool(
-            name="search_and_sync",
-            description="Zoek naar een specifiek onderwerp in historische data en synchroniseer alleen relevante vergaderingen en documenten. Efficiënter dan volledige sync voor dossiers zoals 'Paleis Soestdijk' of 'De Speeldoos'.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Zoekterm (bijv: 'Paleis Soestdijk', 'De Speeldoos')"},
-                    "start_date": {"type": "string", "description": "Start datum (YYYY-MM-DD)", "default": "2010-01-01"},
-                    "end_date": {"type": "string", "description": "Eind datum (YYYY-MM-DD), default vandaag"},
-                    "download_documents": {"type": "boolean", "description": "Download documenten en extraheer tekst", "default": True},
-                    "index_documents": {"type": "boolean", "description": "Indexeer voor semantic search", "default": True},
-                    "limit": {"type": "integer", "description": "Maximum aantal vergaderingen", "default": 100}
-                },
-                "required": ["query"]
+    focus = args.get('focus', '')
+    focus_instruction = f"\nFocus specifiek op: {focus}" if focus else ""
+
+    return _user_prompt(_PROMPT_VERGADERING_ANALIST.format(
+        focus_instruction=focus_instruction,
+        meeting_data=meeting_data
+    ))
+
+
+def _prompt_document_zoeker(args: dict) -> list[PromptMessage]:
+    """Generate document-zoeker prompt."""
+    onderwerp = args.get('onderwerp', 'algemeen')
+    periode = args.get('periode', '')
+
+    periode_instruction = f"\nZoek binnen periode: {periode}" if periode else ""
+
+    return _user_prompt(_PROMPT_DOCUMENT_ZOEKER.format(
+        onderwerp=onderwerp,
+        periode_instruction=periode_instruction
+    ))
+
+
+def _prompt_besluit_tracker(args: dict) -> list[PromptMessage]:
+    """Generate besluit-tracker prompt."""
+    onderwerp = args.get('onderwerp', 'algemeen')
+    status = args.get('status', '')
+
+    status_instruction = f"\nFilter op status: {status}" if status else ""
+
+    return _user_prompt(_PROMPT_BESLUIT_TRACKER.format(
+        onderwerp=onderwerp,
+        status_instruction=status_instruction
+    ))
+
+
+def _prompt_raadslid_assistent(args: dict) -> list[PromptMessage]:
+    """Generate raadslid-assistent prompt."""
+    vraag = args.get('vraag', 'Hoe kan ik je helpen?')
+
+    # Get some context
+    stats = _get_statistics_cached()
+
+    return _user_prompt(_PROMPT_RAADSLID_ASSISTENT.format(
+        meetings=stats.get('meetings', 0),
+        documents=stats.get('documents', 0),
+        agenda_items=stats.get('agenda_items', 0),
+        vraag=vraag
+    ))
+
+
+def _prompt_vergadering_voorbereiding(args: dict) -> list[PromptMessage]:
+    """Generate vergadering-voorbereiding prompt."""
+    meeting_id = args.get('meeting_id')
+
+    context = ""
+    if meeting_id:
+        provider = SERVICES.meeting_provider
+        meeting = provider.get_meeting(meeting_id=_as_int(meeting_id, 'meeting_id'))
+        if meeting:
+            context = f"\n\nVergadering:\n{meeting['title']} op {meeting['date']}"
+
+    return _user_prompt(_PROMPT_VERGADERING_VOORBEREIDING.format(context=context))
+
+
+# Hardcoded prompts voor agents zonder YAML definitie
+_FALLBACK_PROMPTS = {
+    "vergadering-analist": _prompt_vergadering_analist,
+    "document-zoeker": _prompt_document_zoeker,
+    "besluit-tracker": _prompt_besluit_tracker,
+    "raadslid-assistent": _prompt_raadslid_assistent,
+    "vergadering-voorbereiding": _prompt_vergadering_voorbereiding,
+}
+
+
+# ==================== Tool Definitions ====================
+
+# Maximum aantal calls in één batch tool call
+BATCH_MAX_CALLS = 20
+
+# Tool definities zijn statisch: eenmalig opbouwen bij import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_meetings",
+        description="Haal een lijst van vergaderingen op met optionele filters.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {"type": "integer", "description": "Maximum aantal resultaten", "default": 20},
+                "date_from": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
+                "date_to": {"type": "string", "description": "Eind datum (YYYY-MM-DD)"},
+                "search": {"type": "string", "description": "Zoekterm"}
             }
-        ),
-        Tool(
-            name="get_upcoming_meetings",
-            description="Haal aankomende vergaderingen op (vandaag, morgen, deze week, volgende week). Handig voor vragen als 'wat staat er morgen op de agenda?'",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "period": {
-                        "type": "string",
-                        "description": "Periode: 'today' (vandaag), 'tomorrow' (morgen), 'this_week' (deze week), 'next_week' (volgende week), 'this_month' (deze maand)",
-                        "enum": ["today", "tomorrow", "this_week", "next_week", "this_month"],
-                        "default": "this_week"
-                    },
-                    "include_agenda": {"type": "boolean", "description": "Inclusief agendapunten", "default": True},
-                    "include_documents": {"type": "boolean", "description": "Inclusief documenten", "default": False}
+        }
+    ),
+    Tool(
+        name="get_meeting_details",
+        description="Haal gedetailleerde informatie op over een specifieke vergadering.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "meeting_id": {"type": "integer", "description": "Database ID van de vergadering"}
+            },
+            "required": ["meeting_id"]
+        }
+    ),
+    Tool(
+        name="get_meetings_bulk",
+        description="Haal details van meerdere vergaderingen in één keer op "
+        "(zelfde velden als get_meeting_details, als lijst).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "meeting_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "maxItems": 100,
+                    "description": "Database IDs van de vergaderingen"
                 }
+            },
+            "required": ["meeting_ids"]
+        }
+    ),
+    Tool(
+        name="get_agenda_items",
+        description="Haal agendapunten op voor een specifieke vergadering.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "meeting_id": {"type": "integer", "description": "Database ID van de vergadering"}
+            },
+            "required": ["meeting_id"]
+        }
+    ),
+    Tool(
+        name="get_document",
+        description="Haal een specifiek document op met metadata en geëxtraheerde tekst.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_id": {"type": "integer", "description": "Database ID van het document"}
+            },
+            "required": ["document_id"]
+        }
+    ),
+    Tool(
+        name="search_documents",
+        description="Zoek in documenten op titel en inhoud (keyword search).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Zoekterm"},
+                "limit": {"type": "integer", "description": "Maximum resultaten", "default": 20}
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="semantic_search",
+        description="Semantisch zoeken met AI embeddings - vindt documenten op basis van betekenis.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Zoekvraag in natuurlijke taal"},
+                "limit": {"type": "integer", "description": "Maximum resultaten", "default": 10},
+                "hybrid": {"type": "boolean", "description": "Combineer met zoeken op trefwoorden (reciprocal rank fusion)", "default": False}
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="sync_data",
+        description="Synchroniseer data van Notubiz naar de lokale database.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date_from": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
+                "date_to": {"type": "string", "description": "Eind datum (YYYY-MM-DD)"},
+                "download_documents": {"type": "boolean", "description": "Download documenten", "default": False},
+                "index_documents": {"type": "boolean", "description": "Indexeer voor semantic search", "default": False}
             }
-        ),
-        # ==================== Media/Broadcast Tools ====================
-        Tool(
-            name="get_upcoming_broadcasts",
-            description="Haal aankomende live uitzendingen op. Toont vergaderingen met geplande livestreams.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {"type": "integer", "description": "Maximum aantal resultaten", "default": 10}
-                }
+        }
+    ),
+    Tool(
+        name="add_annotation",
+        description="Voeg een annotatie/notitie toe.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "Inhoud van de annotatie"},
+                "document_id": {"type": "integer", "description": "Document ID (optioneel)"},
+                "meeting_id": {"type": "integer", "description": "Vergadering ID (optioneel)"},
+                "title": {"type": "string", "description": "Titel (optioneel)"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags"}
+            },
+            "required": ["content"]
+        }
+    ),
+    Tool(
+        name="get_annotations",
+        description="Haal annotaties op.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_id": {"type": "integer", "description": "Filter op document"},
+                "meeting_id": {"type": "integer", "description": "Filter op vergadering"},
+                "search": {"type": "string", "description": "Zoekterm"}
             }
-        ),
-        Tool(
-            name="get_meeting_video",
-            description="Haal video/stream URL op voor een vergadering. Nuttig voor transcriptie of bekijken van opnames.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "meeting_id": {"type": "integer", "description": "Vergadering ID (database ID of Notubiz ID)"}
-                },
-                "required": ["meeting_id"]
+        }
+    ),
+    Tool(
+        name="get_gremia",
+        description="Haal de lijst van gremia (commissies) op.",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="get_statistics",
+        description="Haal statistieken op over de database.",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="get_notubiz_status",
+        description="Bekijk de Notubiz API configuratie en auth status. "
+        "Toont of historische data toegankelijk is.",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="get_coalitie_akkoord",
+        description="Haal coalitieakkoord informatie op met afspraken en voortgang.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "thema": {"type": "string", "description": "Filter op thema (bijv: 'wonen', 'duurzaamheid')"},
+                "status": {"type": "string", "description": "Filter op status (niet_gestart, in_voorbereiding, in_uitvoering, gerealiseerd)"}
             }
-        ),
-        Tool(
-            name="get_media_info",
-            description="Haal media informatie (video/audio) op voor meerdere vergaderingen tegelijk.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Lijst van event/meeting IDs"
-                    }
+        }
+    ),
+    Tool(
+        name="update_coalitie_afspraak",
+        description="Update de status van een coalitie-afspraak of koppel een besluit.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "afspraak_id": {"type": "string", "description": "ID van de afspraak (bijv: 'wonen-001')"},
+                "new_status": {"type": "string", "description": "Nieuwe status"},
+                "link_meeting_id": {"type": "integer", "description": "Meeting ID om te koppelen"}
+            },
+            "required": ["afspraak_id"]
+        }
+    ),
+    Tool(
+        name="search_and_sync",
+        description="Zoek naar een specifiek onderwerp in historische data en synchroniseer alleen relevante vergaderingen en documenten. Efficiënter dan volledige sync voor dossiers zoals 'Paleis Soestdijk' of 'De Speeldoos'.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Zoekterm (bijv: 'Paleis Soestdijk', 'De Speeldoos')"},
+                "start_date": {"type": "string", "description": "Start datum (YYYY-MM-DD)", "default": "2010-01-01"},
+                "end_date": {"type": "string", "description": "Eind datum (YYYY-MM-DD), default vandaag"},
+                "download_documents": {"type": "boolean", "description": "Download documenten en extraheer tekst", "default": True},
+                "index_documents": {"type": "boolean", "description": "Indexeer voor semantic search", "default": True},
+                "limit": {"type": "integer", "description": "Maximum aantal vergaderingen", "default": 100}
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_upcoming_meetings",
+        description="Haal aankomende vergaderingen op (vandaag, morgen, deze week, volgende week). Handig voor vragen als 'wat staat er morgen op de agenda?'",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "period": {
+                    "type": "string",
+                    "description": "Periode: 'today' (vandaag), 'tomorrow' (morgen), 'this_week' (deze week), 'next_week' (volgende week), 'this_month' (deze maand)",
+                    "enum": ["today", "tomorrow", "this_week", "next_week", "this_month"],
+                    "default": "this_week"
                 },
-                "required": ["event_ids"]
-            }
-        ),
-        Tool(
-            name="get_organization_info",
-            description="Haal organisatie informatie op inclusief logo URL en dashboard instellingen.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "include_settings": {"type": "boolean", "description": "Inclusief dashboard/entity settings", "default": False}
-                }
+                "include_agenda": {"type": "boolean", "description": "Inclusief agendapunten", "default": True},
+                "include_documents": {"type": "boolean", "description": "Inclusief documenten", "default": False}
             }
-        ),
-        # ==================== Verkiezingsprogramma Tools ====================
-        Tool(
-            name="list_parties",
-            description="Lijst alle politieke partijen in Baarn (actief en historisch).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "active_only": {"type": "boolean", "description": "Alleen actieve partijen", "default": False}
-                }
+        }
+    ),
+    # ==================== Media/Broadcast Tools ====================
+    Tool(
+        name="get_upcoming_broadcasts",
+        description="Haal aankomende live uitzendingen op. Toont vergaderingen met geplande livestreams.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {"type": "integer", "description": "Maximum aantal resultaten", "default": 10}
             }
-        ),
-        Tool(
-            name="sync_parties",
-            description="Synchroniseer politieke partijen door de gemeente Baarn website te checken voor actuele fracties. Detecteert nieuwe partijen en deactiveert verdwenen partijen.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "initialize_known": {"type": "boolean", "description": "Initialiseer ook bekende historische partijen", "default": True}
+        }
+    ),
+    Tool(
+        name="get_meeting_video",
+        description="Haal video/stream URL op voor een vergadering. Nuttig voor transcriptie of bekijken van opnames.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "meeting_id": {"type": "integer", "description": "Vergadering ID (database ID of Notubiz ID)"}
+            },
+            "required": ["meeting_id"]
+        }
+    ),
+    Tool(
+        name="get_media_info",
+        description="Haal media informatie (video/audio) op voor meerdere vergaderingen tegelijk.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Lijst van event/meeting IDs"
                 }
+            },
+            "required": ["event_ids"]
+        }
+    ),
+    Tool(
+        name="get_organization_info",
+        description="Haal organisatie informatie op inclusief logo URL en dashboard instellingen.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_settings": {"type": "boolean", "description": "Inclusief dashboard/entity settings", "default": False}
             }
-        ),
-        Tool(
-            name="get_party_sync_status",
-            description="Bekijk de huidige status van partij-synchronisatie: aantal actieve/historische partijen.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        Tool(
-            name="search_election_programs",
-            description="Zoek in verkiezingsprogramma's van Baarnse politieke partijen.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Zoekterm"},
-                    "party": {"type": "string", "description": "Filter op partij (naam of afkorting)"},
-                    "year_from": {"type": "integer", "description": "Vanaf verkiezingsjaar"},
-                    "year_to": {"type": "integer", "description": "Tot verkiezingsjaar"},
-                    "limit": {"type": "integer", "description": "Maximum resultaten", "default": 20}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="compare_party_positions",
-            description="Vergelijk standpunten van partijen over een specifiek onderwerp.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {"type": "string", "description": "Onderwerp (bijv: 'woningbouw', 'duurzaamheid', 'verkeer')"},
-                    "parties": {"type": "array", "items": {"type": "string"}, "description": "Partijen om te vergelijken (optioneel, standaard alle)"},
-                    "year": {"type": "integer", "description": "Specifiek verkiezingsjaar (optioneel)"}
-                },
-                "required": ["topic"]
-            }
-        ),
-        Tool(
-            name="get_party_history",
-            description="Bekijk historische ontwikkeling van een partijstandpunt over de jaren.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "party": {"type": "string", "description": "Partij naam of afkorting"},
-                    "topic": {"type": "string", "description": "Onderwerp"}
-                },
-                "required": ["party", "topic"]
+        }
+    ),
+    # ==================== Verkiezingsprogramma Tools ====================
+    Tool(
+        name="list_parties",
+        description="Lijst alle politieke partijen in Baarn (actief en historisch).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "active_only": {"type": "boolean", "description": "Alleen actieve partijen", "default": False}
             }
-        ),
-        # ==================== Document Generatie Tools ====================
-        Tool(
-            name="generate_motie",
-            description="Genereer een motie document in Word formaat conform Notubiz standaard.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "titel": {"type": "string", "description": "Titel van de motie"},
-                    "indieners": {"type": "array", "items": {"type": "string"}, "description": "Namen van de indieners"},
-                    "partijen": {"type": "array", "items": {"type": "string"}, "description": "Partijen van de indieners"},
-                    "constateringen": {"type": "array", "items": {"type": "string"}, "description": "Constaterende dat... punten"},
-                    "overwegingen": {"type": "array", "items": {"type": "string"}, "description": "Overwegende dat... punten"},
-                    "verzoeken": {"type": "array", "items": {"type": "string"}, "description": "Verzoekt het college... punten"},
-                    "vergadering_datum": {"type": "string", "description": "Datum vergadering (YYYY-MM-DD)"},
-                    "agendapunt": {"type": "string", "description": "Agendapunt nummer"},
-                    "toelichting": {"type": "string", "description": "Optionele toelichting"}
-                },
-                "required": ["titel", "indieners", "partijen", "constateringen", "overwegingen", "verzoeken"]
+        }
+    ),
+    Tool(
+        name="sync_parties",
+        description="Synchroniseer politieke partijen door de gemeente Baarn website te checken voor actuele fracties. Detecteert nieuwe partijen en deactiveert verdwenen partijen.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "initialize_known": {"type": "boolean", "description": "Initialiseer ook bekende historische partijen", "default": True}
             }
-        ),
-        Tool(
-            name="generate_amendement",
-            description="Genereer een amendement document in Word formaat conform Notubiz standaard.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "titel": {"type": "string", "description": "Titel van het amendement"},
-                    "indieners": {"type": "array", "items": {"type": "string"}, "description": "Namen van de indieners"},
-                    "partijen": {"type": "array", "items": {"type": "string"}, "description": "Partijen van de indieners"},
-                    "raadsvoorstel_nummer": {"type": "string", "description": "Nummer van het raadsvoorstel"},
-                    "raadsvoorstel_titel": {"type": "string", "description": "Titel van het raadsvoorstel"},
-                    "wijzigingen": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "oorspronkelijk": {"type": "string", "description": "Oorspronkelijke tekst"},
-                                "wordt": {"type": "string", "description": "Nieuwe tekst"}
-                            },
-                            "required": ["oorspronkelijk", "wordt"]
+        }
+    ),
+    Tool(
+        name="get_party_sync_status",
+        description="Bekijk de huidige status van partij-synchronisatie: aantal actieve/historische partijen.",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    Tool(
+        name="search_election_programs",
+        description="Zoek in verkiezingsprogramma's van Baarnse politieke partijen.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Zoekterm"},
+                "party": {"type": "string", "description": "Filter op partij (naam of afkorting)"},
+                "year_from": {"type": "integer", "description": "Vanaf verkiezingsjaar"},
+                "year_to": {"type": "integer", "description": "Tot verkiezingsjaar"},
+                "limit": {"type": "integer", "description": "Maximum resultaten", "default": 20}
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="compare_party_positions",
+        description="Vergelijk standpunten van partijen over een specifiek onderwerp.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {"type": "string", "description": "Onderwerp (bijv: 'woningbouw', 'duurzaamheid', 'verkeer')"},
+                "parties": {"type": "array", "items": {"type": "string"}, "description": "Partijen om te vergelijken (optioneel, standaard alle)"},
+                "year": {"type": "integer", "description": "Specifiek verkiezingsjaar (optioneel)"}
+            },
+            "required": ["topic"]
+        }
+    ),
+    Tool(
+        name="get_party_history",
+        description="Bekijk historische ontwikkeling van een partijstandpunt over de jaren.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "party": {"type": "string", "description": "Partij naam of afkorting"},
+                "topic": {"type": "string", "description": "Onderwerp"}
+            },
+            "required": ["party", "topic"]
+        }
+    ),
+    # ==================== Document Generatie Tools ====================
+    Tool(
+        name="generate_motie",
+        description="Genereer een motie document in Word formaat conform Notubiz standaard.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "titel": {"type": "string", "description": "Titel van de motie"},
+                "indieners": {"type": "array", "items": {"type": "string"}, "description": "Namen van de indieners"},
+                "partijen": {"type": "array", "items": {"type": "string"}, "description": "Partijen van de indieners"},
+                "constateringen": {"type": "array", "items": {"type": "string"}, "description": "Constaterende dat... punten"},
+                "overwegingen": {"type": "array", "items": {"type": "string"}, "description": "Overwegende dat... punten"},
+                "verzoeken": {"type": "array", "items": {"type": "string"}, "description": "Verzoekt het college... punten"},
+                "vergadering_datum": {"type": "string", "description": "Datum vergadering (YYYY-MM-DD)"},
+                "agendapunt": {"type": "string", "description": "Agendapunt nummer"},
+                "toelichting": {"type": "string", "description": "Optionele toelichting"}
+            },
+            "required": ["titel", "indieners", "partijen", "constateringen", "overwegingen", "verzoeken"]
+        }
+    ),
+    Tool(
+        name="generate_amendement",
+        description="Genereer een amendement document in Word formaat conform Notubiz standaard.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "titel": {"type": "string", "description": "Titel van het amendement"},
+                "indieners": {"type": "array", "items": {"type": "string"}, "description": "Namen van de indieners"},
+                "partijen": {"type": "array", "items": {"type": "string"}, "description": "Partijen van de indieners"},
+                "raadsvoorstel_nummer": {"type": "string", "description": "Nummer van het raadsvoorstel"},
+                "raadsvoorstel_titel": {"type": "string", "description": "Titel van het raadsvoorstel"},
+                "wijzigingen": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "oorspronkelijk": {"type": "string", "description": "Oorspronkelijke tekst"},
+                            "wordt": {"type": "string", "description": "Nieuwe tekst"}
                         },
-                        "description": "Lijst van tekstwijzigingen"
+                        "required": ["oorspronkelijk", "wordt"]
                     },
-                    "toelichting": {"type": "string", "description": "Toelichting op de wijzigingen"},
-                    "vergadering_datum": {"type": "string", "description": "Datum vergadering (YYYY-MM-DD)"},
-                    "agendapunt": {"type": "string", "description": "Agendapunt nummer"}
+                    "description": "Lijst van tekstwijzigingen"
                 },
-                "required": ["titel", "indieners", "partijen", "raadsvoorstel_nummer", "raadsvoorstel_titel", "wijzigingen"]
+                "toelichting": {"type": "string", "description": "Toelichting op de wijzigingen"},
+                "vergadering_datum": {"type": "string", "description": "Datum vergadering (YYYY-MM-DD)"},
+                "agendapunt": {"type": "string", "description": "Agendapunt nummer"}
+            },
+            "required": ["titel", "indieners", "partijen", "raadsvoorstel_nummer", "raadsvoorstel_titel", "wijzigingen"]
+        }
+    ),
+    # ==================== Standpunten Tools ====================
+    Tool(
+        name="add_standpunt",
+        description="Voeg een politiek standpunt toe voor een partij of raadslid.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "party_id": {"type": "integer", "description": "Partij ID (of raadslid_id)"},
+                "raadslid_id": {"type": "integer", "description": "Raadslid ID (of party_id)"},
+                "topic": {"type": "string", "description": "Onderwerp (bijv: 'Woningbouw', 'Duurzaamheid')"},
+                "position_summary": {"type": "string", "description": "Korte samenvatting van het standpunt"},
+                "position_text": {"type": "string", "description": "Volledige tekst/toelichting"},
+                "stance": {"type": "string", "enum": ["voor", "tegen", "neutraal", "genuanceerd", "onbekend"], "description": "Positie"},
+                "stance_strength": {"type": "integer", "minimum": 1, "maximum": 5, "description": "Sterkte van het standpunt (1-5)"},
+                "source_type": {"type": "string", "enum": ["verkiezingsprogramma", "motie", "amendement", "debat", "stemming", "interview", "persbericht", "website", "anders"], "description": "Type bron"},
+                "source_document_id": {"type": "integer", "description": "Document ID van de bron"},
+                "source_meeting_id": {"type": "integer", "description": "Vergadering ID van de bron"},
+                "source_quote": {"type": "string", "description": "Exacte quote uit de bron"},
+                "position_date": {"type": "string", "description": "Datum van standpunt (YYYY-MM-DD)"},
+                "subtopic": {"type": "string", "description": "Subonderwerp"},
+                "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags"}
+            },
+            "required": ["topic", "position_summary", "source_type"]
+        }
+    ),
+    Tool(
+        name="search_standpunten",
+        description="Zoek standpunten met filters op partij, raadslid, topic, stance, etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Zoekterm in standpunten"},
+                "party_id": {"type": "integer", "description": "Filter op partij"},
+                "party_name": {"type": "string", "description": "Filter op partijnaam"},
+                "raadslid_id": {"type": "integer", "description": "Filter op raadslid"},
+                "topic": {"type": "string", "description": "Filter op topic"},
+                "stance": {"type": "string", "enum": ["voor", "tegen", "neutraal", "genuanceerd", "onbekend"], "description": "Filter op stance"},
+                "verified_only": {"type": "boolean", "description": "Alleen geverifieerde standpunten", "default": False},
+                "limit": {"type": "integer", "description": "Maximum resultaten", "default": 50}
             }
-        ),
-        # ==================== Standpunten Tools ====================
-        Tool(
-            name="add_standpunt",
-            description="Voeg een politiek standpunt toe voor een partij of raadslid.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "party_id": {"type": "integer", "description": "Partij ID (of raadslid_id)"},
-                    "raadslid_id": {"type": "integer", "description": "Raadslid ID (of party_id)"},
-                    "topic": {"type": "string", "description": "Onderwerp (bijv: 'Woningbouw', 'Duurzaamheid')"},
-                    "position_summary": {"type": "string", "description": "Korte samenvatting van het standpunt"},
-                    "position_text": {"type": "string", "description": "Volledige tekst/toelichting"},
-                    "stance": {"type": "string", "enum": ["voor", "tegen", "neutraal", "genuanceerd", "onbekend"], "description": "Positie"},
-                    "stance_strength": {"type": "integer", "minimum": 1, "maximum": 5, "description": "Sterkte van het standpunt (1-5)"},
-                    "source_type": {"type": "string", "enum": ["verkiezingsprogramma", "motie", "amendement", "debat", "stemming", "interview", "persbericht", "website", "anders"], "description": "Type bron"},
-                    "source_document_id": {"type": "integer", "description": "Document ID van de bron"},
-                    "source_meeting_id": {"type": "integer", "description": "Vergadering ID van de bron"},
-                    "source_quote": {"type": "string", "description": "Exacte quote uit de bron"},
-                    "position_date": {"type": "string", "description": "Datum van standpunt (YYYY-MM-DD)"},
-                    "subtopic": {"type": "string", "description": "Subonderwerp"},
-                    "tags": {"type": "array", "items": {"type": "string"}, "description": "Tags"}
-                },
-                "required": ["topic", "position_summary", "source_type"]
+        }
+    ),
+    Tool(
+        name="compare_standpunten",
+        description="Vergelijk standpunten van verschillende partijen over een specifiek onderwerp.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {"type": "string", "description": "Onderwerp om te vergelijken"},
+                "party_ids": {"type": "array", "items": {"type": "integer"}, "description": "Specifieke partij IDs (optioneel)"},
+                "include_raadsleden": {"type": "boolean", "description": "Ook individuele raadsleden meenemen", "default": False}
+            },
+            "required": ["topic"]
+        }
+    ),
+    Tool(
+        name="get_standpunt_history",
+        description="Bekijk de historische ontwikkeling van standpunten over een topic.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {"type": "string", "description": "Onderwerp"},
+                "party_id": {"type": "integer", "description": "Filter op partij"},
+                "raadslid_id": {"type": "integer", "description": "Filter op raadslid"}
+            },
+            "required": ["topic"]
+        }
+    ),
+    Tool(
+        name="get_party_context",
+        description="Haal context op van een partij voor party-aligned antwoorden. Geeft overzicht van standpunten, stemgedrag, en prioriteiten.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "party_id": {"type": "integer", "description": "Partij ID"},
+                "party_name": {"type": "string", "description": "Partijnaam (alternatief voor ID)"},
+                "topics": {"type": "array", "items": {"type": "string"}, "description": "Specifieke topics (optioneel)"}
             }
-        ),
-        Tool(
-            name="search_standpunten",
-            description="Zoek standpunten met filters op partij, raadslid, topic, stance, etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Zoekterm in standpunten"},
-                    "party_id": {"type": "integer", "description": "Filter op partij"},
-                    "party_name": {"type": "string", "description": "Filter op partijnaam"},
-                    "raadslid_id": {"type": "integer", "description": "Filter op raadslid"},
-                    "topic": {"type": "string", "description": "Filter op topic"},
-                    "stance": {"type": "string", "enum": ["voor", "tegen", "neutraal", "genuanceerd", "onbekend"], "description": "Filter op stance"},
-                    "verified_only": {"type": "boolean", "description": "Alleen geverifieerde standpunten", "default": False},
-                    "limit": {"type": "integer", "description": "Maximum resultaten", "default": 50}
-                }
+        }
+    ),
+    Tool(
+        name="list_raadsleden",
+        description="Lijst alle raadsleden, wethouders en steunfractieleden met optionele filters.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "party_id": {"type": "integer", "description": "Filter op partij"},
+                "active_only": {"type": "boolean", "description": "Alleen actieve leden", "default": True},
+                "include_steunfractie": {"type": "boolean", "description": "Inclusief steunfractieleden", "default": True}
             }
-        ),
-        Tool(
-            name="compare_standpunten",
-            description="Vergelijk standpunten van verschillende partijen over een specifiek onderwerp.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {"type": "string", "description": "Onderwerp om te vergelijken"},
-                    "party_ids": {"type": "array", "items": {"type": "integer"}, "description": "Specifieke partij IDs (optioneel)"},
-                    "include_raadsleden": {"type": "boolean", "description": "Ook individuele raadsleden meenemen", "default": False}
-                },
-                "required": ["topic"]
+        }
+    ),
+    Tool(
+        name="add_raadslid",
+        description="Voeg een raadslid, wethouder of steunfractielid toe aan de database.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Volledige naam"},
+                "party_id": {"type": "integer", "description": "Partij ID"},
+                "email": {"type": "string", "description": "E-mailadres"},
+                "start_date": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
+                "is_wethouder": {"type": "boolean", "description": "Is wethouder", "default": False},
+                "is_fractievoorzitter": {"type": "boolean", "description": "Is fractievoorzitter", "default": False},
+                "is_steunfractielid": {"type": "boolean", "description": "Is steunfractielid (geen stemrecht in raad)", "default": False}
+            },
+            "required": ["name"]
+        }
+    ),
+    Tool(
+        name="verify_standpunt",
+        description="Markeer een standpunt als geverifieerd.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "standpunt_id": {"type": "integer", "description": "ID van het standpunt"},
+                "verified": {"type": "boolean", "description": "Verificatie status", "default": True}
+            },
+            "required": ["standpunt_id"]
+        }
+    ),
+    Tool(
+        name="get_standpunt_topics",
+        description="Haal de lijst van standpunt-topics op.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "parent_id": {"type": "integer", "description": "Filter op parent topic (voor subtopics)"}
             }
-        ),
-        Tool(
-            name="get_standpunt_history",
-            description="Bekijk de historische ontwikkeling van standpunten over een topic.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {"type": "string", "description": "Onderwerp"},
-                    "party_id": {"type": "integer", "description": "Filter op partij"},
-                    "raadslid_id": {"type": "integer", "description": "Filter op raadslid"}
-                },
-                "required": ["topic"]
+        }
+    ),
+    # ==================== Visit Report Tools ====================
+    Tool(
+        name="add_visit_report",
+        description="Voeg een werkbezoek-verslag toe met handmatige upload. "
+        "Geef het bestand als file_path of file_url (voorkeur, geen base64 overhead) of als file_base64.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Titel van het verslag"},
+                "date": {"type": "string", "description": "Datum (YYYY-MM-DD)"},
+                "location": {"type": "string", "description": "Locatie"},
+                "participants": {"type": "array", "items": {"type": "string"}, "description": "Deelnemers"},
+                "organizations": {"type": "array", "items": {"type": "string"}, "description": "Organisaties"},
+                "topics": {"type": "array", "items": {"type": "string"}, "description": "Onderwerpen/tags"},
+                "visit_type": {"type": "string", "description": "Type werkbezoek"},
+                "summary": {"type": "string", "description": "Korte samenvatting"},
+                "status": {"type": "string", "description": "Status (draft/published/archived)"},
+                "source_url": {"type": "string", "description": "Bron URL (optioneel)"},
+                "attachments": {"type": "array", "items": {"type": "string"}, "description": "Bijlagen/IDs (optioneel)"},
+                "filename": {"type": "string", "description": "Bestandsnaam"},
+                "mime_type": {"type": "string", "description": "MIME type"},
+                "file_base64": {"type": "string", "description": "Bestand als base64"},
+                "file_path": {"type": "string", "description": "Pad naar het bestand in de upload map van de server (UPLOAD_DIR)"},
+                "file_url": {"type": "string", "description": "Publieke http(s) URL om het bestand te downloaden"},
+                "file_sha256": {"type": "string", "description": "SHA-256 controle voor file_path/file_url (optioneel)"}
+            },
+            "required": ["title", "filename", "mime_type"]
+        }
+    ),
+    Tool(
+        name="import_visit_reports",
+        description="Maak werkbezoek-verslagen aan op basis van bestaande documenten.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_ids": {"type": "array", "items": {"type": "integer"}, "description": "Document IDs"},
+                "date": {"type": "string", "description": "Datum (YYYY-MM-DD)"},
+                "location": {"type": "string", "description": "Locatie"},
+                "participants": {"type": "array", "items": {"type": "string"}, "description": "Deelnemers"},
+                "organizations": {"type": "array", "items": {"type": "string"}, "description": "Organisaties"},
+                "topics": {"type": "array", "items": {"type": "string"}, "description": "Onderwerpen/tags"},
+                "visit_type": {"type": "string", "description": "Type werkbezoek"},
+                "summary": {"type": "string", "description": "Korte samenvatting"},
+                "status": {"type": "string", "description": "Status (draft/published/archived)"}
+            },
+            "required": ["document_ids"]
+        }
+    ),
+    Tool(
+        name="list_visit_reports",
+        description="Lijst werkbezoek-verslagen met filters.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date_from": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
+                "date_to": {"type": "string", "description": "Eind datum (YYYY-MM-DD)"},
+                "status": {"type": "string", "description": "Status filter"},
+                "visit_type": {"type": "string", "description": "Type filter"},
+                "limit": {"type": "integer", "description": "Maximum resultaten", "default": 50},
+                "offset": {"type": "integer", "description": "Offset", "default": 0}
             }
-        ),
-        Tool(
-            name="get_party_context",
-            description="Haal context op van een partij voor party-aligned antwoorden. Geeft overzicht van standpunten, stemgedrag, en prioriteiten.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "party_id": {"type": "integer", "description": "Partij ID"},
-                    "party_name": {"type": "string", "description": "Partijnaam (alternatief voor ID)"},
-                    "topics": {"type": "array", "items": {"type": "string"}, "description": "Specifieke topics (optioneel)"}
-                }
+        }
+    ),
+    Tool(
+        name="get_visit_report",
+        description="Haal een werkbezoek-verslag op.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "visit_report_id": {"type": "integer", "description": "Verslag ID"}
+            },
+            "required": ["visit_report_id"]
+        }
+    ),
+    Tool(
+        name="search_visit_reports",
+        description="Zoek in werkbezoek-verslagen (incl. gekoppelde document tekst).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Zoekterm"},
+                "limit": {"type": "integer", "description": "Maximum resultaten", "default": 50}
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="update_visit_report",
+        description="Werk metadata van een werkbezoek-verslag bij.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "visit_report_id": {"type": "integer", "description": "Verslag ID"},
+                "title": {"type": "string", "description": "Titel"},
+                "date": {"type": "string", "description": "Datum (YYYY-MM-DD)"},
+                "location": {"type": "string", "description": "Locatie"},
+                "participants": {"type": "array", "items": {"type": "string"}, "description": "Deelnemers"},
+                "organizations": {"type": "array", "items": {"type": "string"}, "description": "Organisaties"},
+                "topics": {"type": "array", "items": {"type": "string"}, "description": "Onderwerpen/tags"},
+                "visit_type": {"type": "string", "description": "Type werkbezoek"},
+                "summary": {"type": "string", "description": "Samenvatting"},
+                "status": {"type": "string", "description": "Status"},
+                "source_url": {"type": "string", "description": "Bron URL"},
+                "attachments": {"type": "array", "items": {"type": "string"}, "description": "Bijlagen"}
+            },
+            "required": ["visit_report_id"]
+        }
+    ),
+    Tool(
+        name="delete_visit_report",
+        description="Archiveer (soft delete) een werkbezoek-verslag.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "visit_report_id": {"type": "integer", "description": "Verslag ID"}
+            },
+            "required": ["visit_report_id"]
+        }
+    ),
+    Tool(
+        name="link_visit_report_to_meeting",
+        description="Koppel een werkbezoek-verslag aan een vergadering.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "visit_report_id": {"type": "integer", "description": "Verslag ID"},
+                "meeting_id": {"type": "integer", "description": "Vergadering ID"}
+            },
+            "required": ["visit_report_id", "meeting_id"]
+        }
+    ),
+    Tool(
+        name="index_visit_reports",
+        description="Indexeer gekoppelde documenten van werkbezoek-verslagen.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "visit_report_ids": {"type": "array", "items": {"type": "integer"}, "description": "Specifieke verslag IDs (optioneel)"}
             }
-        ),
-        Tool(
-            name="list_raadsleden",
-            description="Lijst alle raadsleden, wethouders en steunfractieleden met optionele filters.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "party_id": {"type": "integer", "description": "Filter op partij"},
-                    "active_only": {"type": "boolean", "description": "Alleen actieve leden", "default": True},
-                    "include_steunfractie": {"type": "boolean", "description": "Inclusief steunfractieleden", "default": True}
+        }
+    ),
+    # ==================== Transcriptie Tools ====================
+    Tool(
+        name="transcribe_meeting",
+        description="Transcribeer de video van een vergadering met AI (Whisper). "
+        "Zet gesproken tekst om naar doorzoekbare tekst.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "meeting_id": {"type": "integer", "description": "Database ID van de vergadering"}
+            },
+            "required": ["meeting_id"]
+        }
+    ),
+    Tool(
+        name="transcribe_url",
+        description="Transcribeer video/audio van een URL (YouTube, direct link).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {"type": "string", "description": "Video/audio URL"},
+                "source_type": {
+                    "type": "string",
+                    "enum": ["youtube", "notubiz", "direct"],
+                    "description": "Type bron",
+                    "default": "direct"
                 }
-            }
-        ),
-        Tool(
-            name="add_raadslid",
-            description="Voeg een raadslid, wethouder of steunfractielid toe aan de database.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Volledige naam"},
-                    "party_id": {"type": "integer", "description": "Partij ID"},
-                    "email": {"type": "string", "description": "E-mailadres"},
-                    "start_date": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
-                    "is_wethouder": {"type": "boolean", "description": "Is wethouder", "default": False},
-                    "is_fractievoorzitter": {"type": "boolean", "description": "Is fractievoorzitter", "default": False},
-                    "is_steunfractielid": {"type": "boolean", "description": "Is steunfractielid (geen stemrecht in raad)", "default": False}
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="verify_standpunt",
-            description="Markeer een standpunt als geverifieerd.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "standpunt_id": {"type": "integer", "description": "ID van het standpunt"},
-                    "verified": {"type": "boolean", "description": "Verificatie status", "default": True}
-                },
-                "required": ["standpunt_id"]
-            }
-        ),
-        Tool(
-            name="get_standpunt_topics",
-            description="Haal de lijst van standpunt-topics op.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "parent_id": {"type": "integer", "description": "Filter op parent topic (voor subtopics)"}
+            },
+            "required": ["url"]
+        }
+    ),
+    Tool(
+        name="search_transcriptions",
+        description="Zoek in video/audio transcripties met timestamps. "
+        "Vindt relevante fragmenten en geeft tijdstippen in de video.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Zoekvraag"},
+                "limit": {"type": "integer", "description": "Maximum resultaten", "default": 10}
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_transcription_status",
+        description="Bekijk hoeveel vergaderingen nog getranscribeerd moeten worden.",
+        inputSchema={"type": "object", "properties": {}}
+    ),
+    # ==================== Samenvatting Tools ====================
+    Tool(
+        name="get_document_for_summary",
+        description="Haal document content op voor het maken van een samenvatting. "
+        "Retourneert de tekst die samengevat kan worden, bij lange documenten in delen "
+        "(zie total_chunks; haal volgende delen op met chunk_index).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_id": {"type": "integer", "description": "Document ID"},
+                "chunk_index": {"type": "integer", "minimum": 0, "default": 0, "description": "Welk deel van de tekst (0 = begin)"},
+                "chunk_size": {"type": "integer", "minimum": 1000, "default": 50000, "description": "Aantal tekens per deel"}
+            },
+            "required": ["document_id"]
+        }
+    ),
+    Tool(
+        name="save_document_summary",
+        description="Sla een gegenereerde samenvatting op voor een document.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "document_id": {"type": "integer", "description": "Document ID"},
+                "summary_text": {"type": "string", "description": "De samenvatting"},
+                "summary_type": {
+                    "type": "string",
+                    "enum": ["kort", "normaal", "lang"],
+                    "default": "normaal"
                 }
-            }
-        ),
-        # ==================== Visit Report Tools ====================
-        Tool(
-            name="add_visit_report",
-            description="Voeg een werkbezoek-verslag toe met handmatige upload (base64).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Titel van het verslag"},
-                    "date": {"type": "string", "description": "Datum (YYYY-MM-DD)"},
-                    "location": {"type": "string", "description": "Locatie"},
-                    "participants": {"type": "array", "items": {"type": "string"}, "description": "Deelnemers"},
-                    "organizations": {"type": "array", "items": {"type": "string"}, "description": "Organisaties"},
-                    "topics": {"type": "array", "items": {"type": "string"}, "description": "Onderwerpen/tags"},
-                    "visit_type": {"type": "string", "description": "Type werkbezoek"},
-                    "summary": {"type": "string", "description": "Korte samenvatting"},
-                    "status": {"type": "string", "description": "Status (draft/published/archived)"},
-                    "source_url": {"type": "string", "description": "Bron URL (optioneel)"},
-                    "attachments": {"type": "array", "items": {"type": "string"}, "description": "Bijlagen/IDs (optioneel)"},
-                    "filename": {"type": "string", "description": "Bestandsnaam"},
-                    "mime_type": {"type": "string", "description": "MIME type"},
-                    "file_base64": {"type": "string", "description": "Bestand als base64"}
-                },
-                "required": ["title", "filename", "mime_type", "file_base64"]
-            }
-        ),
-        Tool(
-            name="import_visit_reports",
-            description="Maak werkbezoek-verslagen aan op basis van bestaande documenten.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_ids": {"type": "array", "items": {"type": "integer"}, "description": "Document IDs"},
-                    "date": {"type": "string", "description": "Datum (YYYY-MM-DD)"},
-                    "location": {"type": "string", "description": "Locatie"},
-                    "participants": {"type": "array", "items": {"type": "string"}, "description": "Deelnemers"},
-                    "organizations": {"type": "array", "items": {"type": "string"}, "description": "Organisaties"},
-                    "topics": {"type": "array", "items": {"type": "string"}, "description": "Onderwerpen/tags"},
-                    "visit_type": {"type": "string", "description": "Type werkbezoek"},
-                    "summary": {"type": "string", "description": "Korte samenvatting"},
-                    "status": {"type": "string", "description": "Status (draft/published/archived)"}
-                },
-                "required": ["document_ids"]
-            }
-        ),
-        Tool(
-            name="list_visit_reports",
-            description="Lijst werkbezoek-verslagen met filters.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "date_from": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
-                    "date_to": {"type": "string", "description": "Eind datum (YYYY-MM-DD)"},
-                    "status": {"type": "string", "description": "Status filter"},
-                    "visit_type": {"type": "string", "description": "Type filter"},
-                    "limit": {"type": "integer", "description": "Maximum resultaten", "default": 50},
-                    "offset": {"type": "integer", "description": "Offset", "default": 0}
+            },
+            "required": ["document_id", "summary_text"]
+        }
+    ),
+    Tool(
+        name="get_meeting_for_summary",
+        description="Haal vergadering content op voor het maken van een samenvatting. "
+        "Combineert agenda, documenten en transcriptie.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "meeting_id": {"type": "integer", "description": "Vergadering ID"}
+            },
+            "required": ["meeting_id"]
+        }
+    ),
+    Tool(
+        name="save_meeting_summary",
+        description="Sla een gegenereerde samenvatting op voor een vergadering.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "meeting_id": {"type": "integer", "description": "Vergadering ID"},
+                "summary_text": {"type": "string", "description": "De samenvatting"},
+                "summary_type": {
+                    "type": "string",
+                    "enum": ["kort", "normaal", "lang"],
+                    "default": "normaal"
                 }
-            }
-        ),
-        Tool(
-            name="get_visit_report",
-            description="Haal een werkbezoek-verslag op.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "visit_report_id": {"type": "integer", "description": "Verslag ID"}
-                },
-                "required": ["visit_report_id"]
-            }
-        ),
-        Tool(
-            name="search_visit_reports",
-            description="Zoek in werkbezoek-verslagen (incl. gekoppelde document tekst).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Zoekterm"},
-                    "limit": {"type": "integer", "description": "Maximum resultaten", "default": 50}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="update_visit_report",
-            description="Werk metadata van een werkbezoek-verslag bij.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "visit_report_id": {"type": "integer", "description": "Verslag ID"},
-                    "title": {"type": "string", "description": "Titel"},
-                    "date": {"type": "string", "description": "Datum (YYYY-MM-DD)"},
-                    "location": {"type": "string", "description": "Locatie"},
-                    "participants": {"type": "array", "items": {"type": "string"}, "description": "Deelnemers"},
-                    "organizations": {"type": "array", "items": {"type": "string"}, "description": "Organisaties"},
-                    "topics": {"type": "array", "items": {"type": "string"}, "description": "Onderwerpen/tags"},
-                    "visit_type": {"type": "string", "description": "Type werkbezoek"},
-                    "summary": {"type": "string", "description": "Samenvatting"},
-                    "status": {"type": "string", "description": "Status"},
-                    "source_url": {"type": "string", "description": "Bron URL"},
-                    "attachments": {"type": "array", "items": {"type": "string"}, "description": "Bijlagen"}
-                },
-                "required": ["visit_report_id"]
-            }
-        ),
-        Tool(
-            name="delete_visit_report",
-            description="Archiveer (soft delete) een werkbezoek-verslag.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "visit_report_id": {"type": "integer", "description": "Verslag ID"}
-                },
-                "required": ["visit_report_id"]
-            }
-        ),
-        Tool(
-            name="link_visit_report_to_meeting",
-            description="Koppel een werkbezoek-verslag aan een vergadering.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "visit_report_id": {"type": "integer", "description": "Verslag ID"},
-                    "meeting_id": {"type": "integer", "description": "Vergadering ID"}
-                },
-                "required": ["visit_report_id", "meeting_id"]
-            }
-        ),
-        Tool(
-            name="index_visit_reports",
-            description="Indexeer gekoppelde documenten van werkbezoek-verslagen.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "visit_report_ids": {"type": "array", "items": {"type": "integer"}, "description": "Specifieke verslag IDs (optioneel)"}
+            },
+            "required": ["meeting_id", "summary_text"]
+        }
+    ),
+    # ==================== Dossier Tools ====================
+    Tool(
+        name="create_dossier",
+        description="Maak een automatisch dossier/tijdlijn voor een onderwerp. "
+        "Verzamelt alle relevante vergaderingen, documenten en transcripties.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {"type": "string", "description": "Onderwerp (bijv: 'Paleis Soestdijk')"},
+                "date_from": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
+                "include_transcripts": {
+                    "type": "boolean",
+                    "description": "Ook transcripties doorzoeken",
+                    "default": True
                 }
-            }
-        ),
-        # ==================== Transcriptie Tools ====================
-        Tool(
-            name="transcribe_meeting",
-            description="Transcribeer de video van een vergadering met AI (Whisper). "
-            "Zet gesproken tekst om naar doorzoekbare tekst.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "meeting_id": {"type": "integer", "description": "Database ID van de vergadering"}
-                },
-                "required": ["meeting_id"]
-            }
-        ),
-        Tool(
-            name="transcribe_url",
-            description="Transcribeer video/audio van een URL (YouTube, direct link).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {"type": "string", "description": "Video/audio URL"},
-                    "source_type": {
-                        "type": "string",
-                        "enum": ["youtube", "notubiz", "direct"],
-                        "description": "Type bron",
-                        "default": "direct"
-                    }
-                },
-                "required": ["url"]
-            }
-        ),
-        Tool(
-            name="search_transcriptions",
-            description="Zoek in video/audio transcripties met timestamps. "
-            "Vindt relevante fragmenten en geeft tijdstippen in de video.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Zoekvraag"},
-                    "limit": {"type": "integer", "description": "Maximum resultaten", "default": 10}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_transcription_status",
-            description="Bekijk hoeveel vergaderingen nog getranscribeerd moeten worden.",
-            inputSchema={"type": "object", "properties": {}}
-        ),
-        # ==================== Samenvatting Tools ====================
-        Tool(
-            name="get_document_for_summary",
-            description="Haal document content op voor het maken van een samenvatting. "
-            "Retourneert de tekst die samengevat kan worden.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_id": {"type": "integer", "description": "Document ID"}
-                },
-                "required": ["document_id"]
-            }
-        ),
-        Tool(
-            name="save_document_summary",
-            description="Sla een gegenereerde samenvatting op voor een document.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "document_id": {"type": "integer", "description": "Document ID"},
-                    "summary_text": {"type": "string", "description": "De samenvatting"},
-                    "summary_type": {
-                        "type": "string",
-                        "enum": ["kort", "normaal", "lang"],
-                        "default": "normaal"
-                    }
-                },
-                "required": ["document_id", "summary_text"]
-            }
-        ),
-        Tool(
-            name="get_meeting_for_summary",
-            description="Haal vergadering content op voor het maken van een samenvatting. "
-            "Combineert agenda, documenten en transcriptie.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "meeting_id": {"type": "integer", "description": "Vergadering ID"}
-                },
-                "required": ["meeting_id"]
-            }
-        ),
-        Tool(
-            name="save_meeting_summary",
-            description="Sla een gegenereerde samenvatting op voor een vergadering.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "meeting_id": {"type": "integer", "description": "Vergadering ID"},
-                    "summary_text": {"type": "string", "description": "De samenvatting"},
-                    "summary_type": {
-                        "type": "string",
-                        "enum": ["kort", "normaal", "lang"],
-                        "default": "normaal"
-                    }
-                },
-                "required": ["meeting_id", "summary_text"]
-            }
-        ),
-        # ==================== Dossier Tools ====================
-        Tool(
-            name="create_dossier",
-            description="Maak een automatisch dossier/tijdlijn voor een onderwerp. "
-            "Verzamelt alle relevante vergaderingen, documenten en transcripties.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {"type": "string", "description": "Onderwerp (bijv: 'Paleis Soestdijk')"},
-                    "date_from": {"type": "string", "description": "Start datum (YYYY-MM-DD)"},
-                    "include_transcripts": {
-                        "type": "boolean",
-                        "description": "Ook transcripties doorzoeken",
-                        "default": True
-                    }
-                },
-                "required": ["topic"]
-            }
-        ),
-        Tool(
-            name="get_dossier",
-            description="Haal een dossier op met alle tijdlijn items.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "dossier_id": {"type": "integer", "description": "Dossier ID"}
-                },
-                "required": ["dossier_id"]
-            }
-        ),
-        Tool(
-            name="update_dossier",
-            description="Update een bestaand dossier met nieuwe informatie.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "dossier_id": {"type": "integer", "description": "Dossier ID"}
-                },
-                "required": ["dossier_id"]
-            }
-        ),
-        Tool(
-            name="list_dossiers",
-            description="Lijst alle beschikbare dossiers.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "status": {
-                        "type": "string",
-                        "enum": ["active", "archived"],
-                        "description": "Filter op status"
-                    }
+            },
+            "required": ["topic"]
+        }
+    ),
+    Tool(
+        name="get_dossier",
+        description="Haal een dossier op met alle tijdlijn items.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dossier_id": {"type": "integer", "description": "Dossier ID"}
+            },
+            "required": ["dossier_id"]
+        }
+    ),
+    Tool(
+        name="update_dossier",
+        description="Update een bestaand dossier met nieuwe informatie.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dossier_id": {"type": "integer", "description": "Dossier ID"}
+            },
+            "required": ["dossier_id"]
+        }
+    ),
+    Tool(
+        name="list_dossiers",
+        description="Lijst alle beschikbare dossiers.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "status": {
+                    "type": "string",
+                    "enum": ["active", "archived"],
+                    "description": "Filter op status"
                 }
             }
+        }
+    ),
+    Tool(
+        name="get_dossier_timeline",
+        description="Haal een dossier tijdlijn op als markdown tekst.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dossier_id": {"type": "integer", "description": "Dossier ID"}
+            },
+            "required": ["dossier_id"]
+        }
+    ),
+    Tool(
+        name="batch",
+        description=(
+            "Voer meerdere tool calls in één aanroep uit (gelijktijdig). "
+            "Elk resultaat staat op dezelfde positie als de call; een fout geldt alleen voor die call."
         ),
-        Tool(
-            name="get_dossier_timeline",
-            description="Haal een dossier tijdlijn op als markdown tekst.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "dossier_id": {"type": "integer", "description": "Dossier ID"}
-                },
-                "required": ["dossier_id"]
-            }
-        ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "maxItems": BATCH_MAX_CALLS,
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Naam van de tool"},
+                            "arguments": {"type": "object", "description": "Argumenten voor de tool"}
+                        },
+                        "required": ["name"]
+                    },
+                    "description": "Lijst van tool calls"
+                }
+            },
+            "required": ["calls"]
+        }
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List all available tools (static, so no need to wait for the initial sync)."""
+    return _TOOLS
 
 
 # ==================== Tool Handlers ====================
@@ -1326,831 +1681,1166 @@ async def list_tools() -> list[Tool]:
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls."""
-    await perform_initial_sync()
+    if not _initial_sync_done:
+        await perform_initial_sync()
+
+    logger.info('Tool call: %s', name)
 
-    logger.info(f'Tool call: {name}')
+    # Same read-only call as recently: answer from the cache
+    cache_key = _tool_cache_key(name, arguments)
+    if cache_key is not None:
+        text, generation = _tool_cache_get(cache_key)
+        if text is not None:
+            return [TextContent(type="text", text=text)]
+
+    _progress.set(_progress_reporter())
 
     try:
         result = await handle_tool(name, arguments)
-        return [TextContent(type="text", text=format_response(result))]
+        text = format_response(result)
+        if cache_key is not None:
+            _tool_cache_put(cache_key, text, generation)
+        else:
+            # Any other tool may have written to the database
+            _tool_cache_clear()
+        return [TextContent(type="text", text=text)]
     except Exception as e:
-        logger.error(f'Tool error: {name} - {e}')
+        if cache_key is None:
+            _tool_cache_clear()
+        logger.error('Tool error: %s - %s', name, e)
         return [TextContent(type="text", text=format_response({"error": str(e)}))]
 
 
-async def handle_tool(name: str, args: dict) -> Any:
-    """Route tool calls to handlers."""
-
-    if name == "get_meetings":
-        provider = get_meeting_provider()
-        meetings = provider.get_meetings(
-            limit=args.get('limit', 20),
-            date_from=args.get('date_from'),
-            date_to=args.get('date_to'),
-            search=args.get('search')
-        )
-        return {"count": len(meetings), "meetings": [
-            {"id": m['id'], "title": m['title'], "date": m['date'], "gremium": m.get('gremium_name')}
-            for m in meetings
-        ]}
-
-    elif name == "get_meeting_details":
-        provider = get_meeting_provider()
-        meeting = provider.get_meeting(meeting_id=args['meeting_id'])
-        if not meeting:
-            return {"error": "Meeting not found"}
-        return {
-            "id": meeting['id'],
-            "title": meeting['title'],
-            "date": meeting['date'],
-            "location": meeting.get('location'),
-            "agenda_items": [{"id": i['id'], "title": i['title']} for i in meeting.get('agenda_items', [])],
-            "documents": [
-                {
-                    "id": d['id'],
-                    "title": d['title'],
-                    "url": d.get('url') or (f"https://api.notubiz.nl/document/{d['notubiz_id']}/1" if d.get('notubiz_id') else None),
-                    "has_content": bool(d.get('text_content'))
-                }
-                for d in meeting.get('documents', [])
-            ]
-        }
-
-    elif name == "get_agenda_items":
-        provider = get_meeting_provider()
-        items = provider.get_agenda_items(args['meeting_id'])
-        return {"meeting_id": args['meeting_id'], "count": len(items), "agenda_items": items}
-
-    elif name == "get_document":
-        provider = get_document_provider()
-        doc = provider.get_document(args['document_id'])
-        if not doc:
-            return {"error": "Document not found"}
-        text = doc.get('text_content', '')
-        # Build Notubiz URL if we have a notubiz_id
-        notubiz_url = None
-        if doc.get('notubiz_id'):
-            notubiz_url = f"https://api.notubiz.nl/document/{doc['notubiz_id']}/1"
-        return {
-            "id": doc['id'],
-            "title": doc['title'],
-            "url": doc.get('url') or notubiz_url,
-            "notubiz_url": notubiz_url,
-            "has_text": bool(text),
-            "text_content": text[:10000] if text else None,
-            "truncated": len(text) > 10000 if text else False
-        }
-
-    elif name == "search_documents":
-        provider = get_document_provider()
-        results = provider.search_documents(args['query'], args.get('limit', 20))
-        return {"query": args['query'], "count": len(results), "results": [
+def _tool_get_meetings(args: dict) -> Any:
+    """Haal een lijst van vergaderingen op met optionele filters."""
+    provider = SERVICES.meeting_provider
+    meetings = provider.get_meetings(
+        limit=args.get('limit', 20),
+        date_from=args.get('date_from'),
+        date_to=args.get('date_to'),
+        search=args.get('search')
+    )
+    return {"count": len(meetings), "meetings": [
+        {"id": m['id'], "title": m['title'], "date": m['date'], "gremium": m.get('gremium_name')}
+        for m in meetings
+    ]}
+
+
+def _meeting_details(meeting: dict) -> dict:
+    """Response shape of get_meeting_details for one meeting bundle."""
+    return {
+        "id": meeting['id'],
+        "title": meeting['title'],
+        "date": meeting['date'],
+        "location": meeting.get('location'),
+        "agenda_items": [{"id": i['id'], "title": i['title']} for i in meeting.get('agenda_items', [])],
+        "documents": [
             {
                 "id": d['id'],
                 "title": d['title'],
-                "url": d.get('url') or (f"https://api.notubiz.nl/document/{d['notubiz_id']}/1" if d.get('notubiz_id') else None),
-                "match_type": d.get('match_type', [])
+                "url": d.get('url') or (_NOTUBIZ_DOC_URL(d['notubiz_id']) if d.get('notubiz_id') else None),
+                "has_content": bool(d['has_content'])
             }
-            for d in results
-        ]}
-
-    elif name == "semantic_search":
-        index = get_document_index()
-        results = index.search(args['query'], args.get('limit', 10))
-        if not results:
-            stats = index.get_index_stats()
-            if not stats.get('embeddings_available'):
-                return {"error": "Embeddings niet beschikbaar", "hint": "pip install sentence-transformers torch"}
-            if stats.get('indexed_documents', 0) == 0:
-                return {"error": "Geen documenten geïndexeerd", "hint": "sync_data met index_documents=true"}
+            for d in meeting.get('documents', [])
+        ]
+    }
+
+
+def _tool_get_meeting_details(args: dict) -> Any:
+    """Haal gedetailleerde informatie op over een specifieke vergadering."""
+    provider = SERVICES.meeting_provider
+    meeting = provider.get_meeting_bundle(args['meeting_id'])
+    if not meeting:
+        return {"error": "Meeting not found"}
+    return _meeting_details(meeting)
+
+
+def _tool_get_meetings_bulk(args: dict) -> Any:
+    """Haal details van meerdere vergaderingen in één keer op."""
+    provider = SERVICES.meeting_provider
+    meeting_ids = [_as_int(i, 'meeting_id') for i in args['meeting_ids']]
+    meetings = provider.get_meetings_bulk(meeting_ids)
+    found = {m['id'] for m in meetings}
+    return {
+        "count": len(meetings),
+        "meetings": [_meeting_details(m) for m in meetings],
+        "not_found": [i for i in meeting_ids if i not in found]
+    }
+
+
+def _tool_get_agenda_items(args: dict) -> Any:
+    """Haal agendapunten op voor een specifieke vergadering."""
+    provider = SERVICES.meeting_provider
+    items = provider.get_agenda_items(args['meeting_id'])
+    return {"meeting_id": args['meeting_id'], "count": len(items), "agenda_items": items}
+
+
+def _tool_get_document(args: dict) -> Any:
+    """Haal een specifiek document op met metadata en geëxtraheerde tekst."""
+    provider = SERVICES.doc_provider
+    # Only the first 10000 characters are returned, so only those are read
+    doc = provider.get_document(args['document_id'], text_limit=10000)
+    if not doc:
+        return {"error": "Document not found"}
+    text = doc.get('text_content', '')
+    # Build Notubiz URL if we have a notubiz_id
+    notubiz_url = None
+    if doc.get('notubiz_id'):
+        notubiz_url = _NOTUBIZ_DOC_URL(doc['notubiz_id'])
+    return {
+        "id": doc['id'],
+        "title": doc['title'],
+        "url": doc.get('url') or notubiz_url,
+        "notubiz_url": notubiz_url,
+        "has_text": bool(text),
+        "text_content": text or None,
+        "truncated": (doc.get('text_length') or 0) > 10000
+    }
+
+
+def _tool_search_documents(args: dict) -> Any:
+    """Zoek in documenten op titel en inhoud (keyword search)."""
+    provider = SERVICES.doc_provider
+    # Rows already hold just id, title, url and match_type
+    results = provider.search_document_matches(args['query'], args.get('limit', 20))
+    return {"query": args['query'], "count": len(results), "results": results}
+
+
+def _tool_semantic_search(args: dict) -> Any:
+    """Semantisch zoeken met AI embeddings - vindt documenten op basis van betekenis."""
+    index = SERVICES.doc_index
+    if args.get('hybrid'):
+        results = index.hybrid_search(args['query'], args.get('limit', 10))
         return {"query": args['query'], "count": len(results), "results": [
-            {"document_id": r.document_id, "title": r.document_title, "similarity": round(r.similarity, 3), "excerpt": r.chunk_text[:300]}
+            {"document_id": r.document_id, "title": r.document_title, "score": round(r.score, 4),
+             "similarity": round(r.similarity, 3), "excerpt": r.chunk_text[:300]}
             for r in results
         ]}
+    results = index.search(args['query'], args.get('limit', 10))
+    if not results:
+        stats = index.get_index_stats()
+        if not stats.get('embeddings_available'):
+            return {"error": "Embeddings niet beschikbaar", "hint": "pip install sentence-transformers torch"}
+        if stats.get('indexed_documents', 0) == 0:
+            return {"error": "Geen documenten geïndexeerd", "hint": "sync_data met index_documents=true"}
+    return {"query": args['query'], "count": len(results), "results": [
+        {"document_id": r.document_id, "title": r.document_title, "similarity": round(r.similarity, 3), "excerpt": r.chunk_text[:300]}
+        for r in results
+    ]}
+
+
+def _tool_sync_data(args: dict) -> Any:
+    """Synchroniseer data van Notubiz naar de lokale database."""
+    meeting_provider = SERVICES.meeting_provider
+    doc_provider = SERVICES.doc_provider
+    progress = _progress.get()
+
+    meeting_provider.sync_gremia()
+    meetings, docs = meeting_provider.sync_meetings(
+        date_from=args.get('date_from'),
+        date_to=args.get('date_to')
+    )
+    if progress:
+        progress(f'Synced {meetings} meetings, {docs} documents found')
+
+    result = {"meetings": meetings, "documents_found": docs}
+    index = SERVICES.doc_index if args.get('index_documents') else None
+    indexed = chunks = 0
+
+    def index_downloaded(document_id: int):
+        nonlocal indexed, chunks
+        count = index.index_document(document_id)
+        if count:
+            indexed += 1
+            chunks += count
+
+    if args.get('download_documents'):
+        # Download extracts the text; index each document right away while
+        # the download threads continue with the next ones
+        success, failed = doc_provider.download_pending_documents(
+            progress=progress,
+            on_downloaded=index_downloaded if index else None
+        )
+        doc_provider.extract_all_text()
+        result["documents_downloaded"] = success
+
+    if index:
+        # Documents downloaded earlier but not yet indexed
+        rest_docs, rest_chunks = index.index_all_documents()
+        indexed += rest_docs
+        chunks += rest_chunks
+        result["documents_indexed"] = indexed
+        if progress:
+            progress(f'Indexed {indexed} documents, {chunks} chunks')
+
+    # Nieuwe data: statistieken opnieuw tellen
+    _invalidate_statistics()
+    return result
+
+
+def _tool_add_annotation(args: dict) -> Any:
+    """Voeg een annotatie/notitie toe."""
+    db = SERVICES.db
+    aid = db.add_annotation(
+        content=args['content'],
+        document_id=args.get('document_id'),
+        meeting_id=args.get('meeting_id'),
+        title=args.get('title'),
+        tags=args.get('tags')
+    )
+    return {"success": True, "annotation_id": aid}
+
+
+def _tool_get_annotations(args: dict) -> Any:
+    """Haal annotaties op."""
+    db = SERVICES.db
+    return {"annotations": db.get_annotations(
+        document_id=args.get('document_id'),
+        meeting_id=args.get('meeting_id'),
+        search=args.get('search')
+    )}
+
+
+def _tool_get_gremia(args: dict) -> Any:
+    """Haal de lijst van gremia (commissies) op."""
+    provider = SERVICES.meeting_provider
+    gremia = provider.get_gremia()
+    return {"count": len(gremia), "gremia": [{"id": g['id'], "name": g['name']} for g in gremia]}
+
+
+def _tool_get_statistics(args: dict) -> Any:
+    """Haal statistieken op over de database."""
+    index = SERVICES.doc_index
+    return {
+        "database": _get_statistics_cached(),
+        "index": index.get_index_stats(),
+        "municipality": Config.MUNICIPALITY_NAME
+    }
+
+
+def _tool_get_notubiz_status(args: dict) -> Any:
+    """Bekijk de Notubiz API configuratie en auth status."""
+    client = SERVICES.notubiz
+    return client.get_auth_status()
+
+
+def _tool_get_coalitie_akkoord(args: dict) -> Any:
+    """Haal coalitieakkoord informatie op met afspraken en voortgang."""
+    tracker = SERVICES.coalitie
+    summary = tracker.get_akkoord_summary()
+    afspraken = tracker.get_afspraken(
+        thema=args.get('thema'),
+        status=args.get('status')
+    )
+    return {
+        "summary": summary,
+        "afspraken": [
+            {
+                "id": a.get('id'),
+                "thema": a.get('thema'),
+                "tekst": a.get('tekst'),
+                "status": a.get('status'),
+                "prioriteit": a.get('prioriteit'),
+                "gerelateerde_besluiten": len(a.get('gerelateerde_besluiten', []))
+            }
+            for a in afspraken
+        ],
+        "count": len(afspraken)
+    }
 
-    elif name == "sync_data":
-        meeting_provider = get_meeting_provider()
-        doc_provider = get_document_provider()
 
-        meeting_provider.sync_gremia()
-        meetings, docs = meeting_provider.sync_meetings(
-            date_from=args.get('date_from'),
-            date_to=args.get('date_to')
-        )
+def _tool_update_coalitie_afspraak(args: dict) -> Any:
+    """Update de status van een coalitie-afspraak of koppel een besluit."""
+    tracker = SERVICES.coalitie
+    result = {"afspraak_id": args['afspraak_id'], "success": False}
 
-        result = {"meetings": meetings, "documents_found": docs}
+    if args.get('new_status'):
+        if tracker.update_afspraak_status(args['afspraak_id'], args['new_status']):
+            result["status_updated"] = args['new_status']
+            result["success"] = True
 
-        if args.get('download_documents'):
-            success, failed = doc_provider.download_pending_documents()
-            doc_provider.extract_all_text()
-            result["documents_downloaded"] = success
+    if args.get('link_meeting_id'):
+        if tracker.link_besluit(args['afspraak_id'], args['link_meeting_id']):
+            result["meeting_linked"] = args['link_meeting_id']
+            result["success"] = True
 
-        if args.get('index_documents'):
-            index = get_document_index()
-            indexed, chunks = index.index_all_documents()
-            result["documents_indexed"] = indexed
+    return result
 
-        return result
 
-    elif name == "add_annotation":
-        db = get_database()
-        aid = db.add_annotation(
-            content=args['content'],
-            document_id=args.get('document_id'),
-            meeting_id=args.get('meeting_id'),
-            title=args.get('title'),
-            tags=args.get('tags')
-        )
-        return {"success": True, "annotation_id": aid}
-
-    elif name == "get_annotations":
-        db = get_database()
-        return {"annotations": db.get_annotations(
-            document_id=args.get('document_id'),
-            meeting_id=args.get('meeting_id'),
-            search=args.get('search')
-        )}
-
-    elif name == "get_gremia":
-        provider = get_meeting_provider()
-        gremia = provider.get_gremia()
-        return {"count": len(gremia), "gremia": [{"id": g['id'], "name": g['name']} for g in gremia]}
-
-    elif name == "get_statistics":
-        db = get_database()
-        index = get_document_index()
-        return {
-            "database": db.get_statistics(),
-            "index": index.get_index_stats(),
-            "municipality": Config.MUNICIPALITY_NAME
-        }
+def _tool_search_and_sync(args: dict) -> Any:
+    """Zoek naar een specifiek onderwerp in historische data en synchroniseer alleen relevante vergaderingen en documenten."""
+    provider = SERVICES.search_sync
+    result = provider.search_and_sync(
+        query=args['query'],
+        start_date=args.get('start_date', '2010-01-01'),
+        end_date=args.get('end_date'),
+        download_docs=args.get('download_documents', True),
+        index_docs=args.get('index_documents', True),
+        limit=args.get('limit', 100),
+        progress=_progress.get()
+    )
+    return result
 
-    elif name == "get_notubiz_status":
-        client = get_notubiz_client()
-        return client.get_auth_status()
 
-    elif name == "get_coalitie_akkoord":
-        tracker = get_coalitie_tracker()
-        summary = tracker.get_akkoord_summary()
-        afspraken = tracker.get_afspraken(
-            thema=args.get('thema'),
-            status=args.get('status')
-        )
-        return {
-            "summary": summary,
-            "afspraken": [
-                {
-                    "id": a.get('id'),
-                    "thema": a.get('thema'),
-                    "tekst": a.get('tekst'),
-                    "status": a.get('status'),
-                    "prioriteit": a.get('prioriteit'),
-                    "gerelateerde_besluiten": len(a.get('gerelateerde_besluiten', []))
-                }
-                for a in afspraken
-            ],
-            "count": len(afspraken)
-        }
+def _day_range(day: date, label: str) -> tuple[str, str, str]:
+    return day.isoformat(), day.isoformat(), f"{label} ({day.strftime('%d-%m-%Y')})"
 
-    elif name == "update_coalitie_afspraak":
-        tracker = get_coalitie_tracker()
-        result = {"afspraak_id": args['afspraak_id'], "success": False}
-
-        if args.get('new_status'):
-            if tracker.update_afspraak_status(args['afspraak_id'], args['new_status']):
-                result["status_updated"] = args['new_status']
-                result["success"] = True
-
-        if args.get('link_meeting_id'):
-            if tracker.link_besluit(args['afspraak_id'], args['link_meeting_id']):
-                result["meeting_linked"] = args['link_meeting_id']
-                result["success"] = True
-
-        return result
-
-    elif name == "search_and_sync":
-        provider = get_search_sync_provider()
-        result = provider.search_and_sync(
-            query=args['query'],
-            start_date=args.get('start_date', '2010-01-01'),
-            end_date=args.get('end_date'),
-            download_docs=args.get('download_documents', True),
-            index_docs=args.get('index_documents', True),
-            limit=args.get('limit', 100)
-        )
-        return result
-
-    elif name == "get_upcoming_meetings":
-        from datetime import datetime, timedelta
-
-        period = args.get('period', 'this_week')
-        include_agenda = args.get('include_agenda', True)
-        include_documents = args.get('include_documents', False)
-
-        today = date.today()
-
-        # Calculate date range based on period
-        if period == 'today':
-            date_from = date_to = today.isoformat()
-            period_label = f"vandaag ({today.strftime('%d-%m-%Y')})"
-        elif period == 'tomorrow':
-            tomorrow = today + timedelta(days=1)
-            date_from = date_to = tomorrow.isoformat()
-            period_label = f"morgen ({tomorrow.strftime('%d-%m-%Y')})"
-        elif period == 'this_week':
-            # Start of week (Monday)
-            start = today - timedelta(days=today.weekday())
-            end = start + timedelta(days=6)
-            date_from = start.isoformat()
-            date_to = end.isoformat()
-            period_label = f"deze week ({start.strftime('%d-%m')} t/m {end.strftime('%d-%m-%Y')})"
-        elif period == 'next_week':
-            start = today - timedelta(days=today.weekday()) + timedelta(weeks=1)
-            end = start + timedelta(days=6)
-            date_from = start.isoformat()
-            date_to = end.isoformat()
-            period_label = f"volgende week ({start.strftime('%d-%m')} t/m {end.strftime('%d-%m-%Y')})"
-        elif period == 'this_month':
-            start = today.replace(day=1)
-            # End of month
-            if today.month == 12:
-                end = today.replace(year=today.year+1, month=1, day=1) - timedelta(days=1)
-            else:
-                end = today.replace(month=today.month+1, day=1) - timedelta(days=1)
-            date_from = start.isoformat()
-            date_to = end.isoformat()
-            period_label = f"deze maand ({today.strftime('%B %Y')})"
-        else:
-            date_from = date_to = today.isoformat()
-            period_label = "vandaag"
-
-        provider = get_meeting_provider()
-        meetings = provider.get_meetings(
-            limit=50,
-            date_from=date_from,
-            date_to=date_to
-        )
 
-        result_meetings = []
-        for m in meetings:
-            meeting_data = {
-                "id": m['id'],
-                "title": m['title'],
-                "date": m['date'],
-                "gremium": m.get('gremium_name'),
-                "location": m.get('location')
-            }
+def _week_range(start: date, label: str) -> tuple[str, str, str]:
+    end = start + timedelta(days=6)
+    return start.isoformat(), end.isoformat(), f"{label} ({start.strftime('%d-%m')} t/m {end.strftime('%d-%m-%Y')})"
 
-            if include_agenda:
-                items = provider.get_agenda_items(m['id'])
-                meeting_data['agenda_items'] = [
-                    {"id": i['id'], "title": i['title']}
-                    for i in items
-                ]
-
-            if include_documents:
-                full_meeting = provider.get_meeting(meeting_id=m['id'])
-                if full_meeting:
-                    meeting_data['documents'] = [
-                        {
-                            "id": d['id'],
-                            "title": d['title'],
-                            "url": d.get('url') or (f"https://api.notubiz.nl/document/{d['notubiz_id']}/1" if d.get('notubiz_id') else None)
-                        }
-                        for d in full_meeting.get('documents', [])
-                    ]
-
-            result_meetings.append(meeting_data)
-
-        return {
-            "period": period_label,
-            "date_range": {"from": date_from, "to": date_to},
-            "count": len(result_meetings),
-            "meetings": result_meetings
-        }
 
-    # ==================== Media/Broadcast Handlers ====================
-
-    elif name == "get_upcoming_broadcasts":
-        from providers.notubiz_client import get_notubiz_client
-        client = get_notubiz_client()
-        limit = args.get('limit', 10)
-
-        broadcasts = client.get_upcoming_broadcasts(limit=limit)
-
-        result = []
-        for event in broadcasts:
-            result.append({
-                'id': event.get('id'),
-                'title': event.get('title') or event.get('name'),
-                'date': event.get('start_date') or event.get('date'),
-                'gremium': event.get('gremium', {}).get('name') if isinstance(event.get('gremium'), dict) else None,
-                'has_broadcast': True
-            })
-
-        return {
-            "count": len(result),
-            "upcoming_broadcasts": result,
-            "note": "Vergaderingen met geplande live uitzendingen"
+def _month_range(today: date) -> tuple[str, str, str]:
+    start = today.replace(day=1)
+    # End of month: day before the first of the next month
+    if today.month == 12:
+        end = today.replace(year=today.year + 1, month=1, day=1) - timedelta(days=1)
+    else:
+        end = today.replace(month=today.month + 1, day=1) - timedelta(days=1)
+    return start.isoformat(), end.isoformat(), f"deze maand ({today.strftime('%B %Y')})"
+
+
+# period -> (date_from, date_to, label) for get_upcoming_meetings
+_PERIOD_RANGES: dict[str, Callable[[date], tuple[str, str, str]]] = {
+    'today': lambda t: _day_range(t, 'vandaag'),
+    'tomorrow': lambda t: _day_range(t + timedelta(days=1), 'morgen'),
+    'this_week': lambda t: _week_range(t - timedelta(days=t.weekday()), 'deze week'),
+    'next_week': lambda t: _week_range(t - timedelta(days=t.weekday()) + timedelta(weeks=1), 'volgende week'),
+    'this_month': _month_range,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _period_range(period: str, day: int) -> tuple[str, str, str]:
+    """Date range and label of an upcoming-meetings period, for day ordinal `day`."""
+    today = date.fromordinal(day)
+    fn = _PERIOD_RANGES.get(period)
+    if fn is None:
+        return today.isoformat(), today.isoformat(), "vandaag"
+    return fn(today)
+
+
+def _tool_get_upcoming_meetings(args: dict) -> Any:
+    """Haal aankomende vergaderingen op (vandaag, morgen, deze week, volgende week)."""
+    period = args.get('period', 'this_week')
+    include_agenda = args.get('include_agenda', True)
+    include_documents = args.get('include_documents', False)
+
+    date_from, date_to, period_label = _period_range(period, date.today().toordinal())
+
+    provider = SERVICES.meeting_provider
+    meetings = provider.get_meetings(
+        limit=50,
+        date_from=date_from,
+        date_to=date_to
+    )
+
+    # Agenda and documents of all meetings in one round of IN queries
+    bundles = {}
+    if meetings and (include_agenda or include_documents):
+        bundles = {b['id']: b for b in provider.get_meetings_bulk([m['id'] for m in meetings])}
+
+    result_meetings = []
+    for m in meetings:
+        meeting_data = {
+            "id": m['id'],
+            "title": m['title'],
+            "date": m['date'],
+            "gremium": m.get('gremium_name'),
+            "location": m.get('location')
         }
+        bundle = bundles.get(m['id'], {})
 
-    elif name == "get_meeting_video":
-        from providers.notubiz_client import get_notubiz_client
-        client = get_notubiz_client()
-        provider = get_meeting_provider()
-
-        meeting_id = args.get('meeting_id')
-
-        # Get meeting from database to find Notubiz ID
-        meeting = provider.get_meeting(meeting_id)
-        if not meeting:
-            return {"error": f"Vergadering {meeting_id} niet gevonden"}
-
-        notubiz_id = meeting.get('notubiz_id') or str(meeting_id)
-
-        # Try to get video URL from database first
-        video_url = meeting.get('video_url')
-        if not video_url:
-            # Try to fetch from Notubiz API
-            video_url = client.get_video_url_for_meeting(notubiz_id)
-
-        return {
-            "meeting_id": meeting_id,
-            "title": meeting.get('title'),
-            "date": meeting.get('date'),
-            "video_url": video_url,
-            "has_video": video_url is not None,
-            "note": "Video URL kan direct afgespeeld worden of gebruikt voor transcriptie"
-        }
+        if include_agenda:
+            meeting_data['agenda_items'] = bundle.get('agenda_items', [])
+
+        if include_documents and bundle:
+            meeting_data['documents'] = [
+                {
+                    "id": d['id'],
+                    "title": d['title'],
+                    "url": d.get('url') or (_NOTUBIZ_DOC_URL(d['notubiz_id']) if d.get('notubiz_id') else None)
+                }
+                for d in bundle['documents']
+            ]
 
-    elif name == "get_media_info":
-        from providers.notubiz_client import get_notubiz_client
-        client = get_notubiz_client()
+        result_meetings.append(meeting_data)
 
-        event_ids = args.get('event_ids', [])
-        if not event_ids:
-            return {"error": "Geen event_ids opgegeven"}
+    return {
+        "period": period_label,
+        "date_range": {"from": date_from, "to": date_to},
+        "count": len(result_meetings),
+        "meetings": result_meetings
+    }
 
-        media_list = client.get_media(event_ids)
 
-        return {
-            "count": len(media_list),
-            "media": media_list,
-            "requested_events": len(event_ids)
-        }
+# ==================== Media/Broadcast Handlers ====================
 
-    elif name == "get_organization_info":
-        from providers.notubiz_client import get_notubiz_client
-        client = get_notubiz_client()
+def _tool_get_upcoming_broadcasts(args: dict) -> Any:
+    """Haal aankomende live uitzendingen op."""
+    client = SERVICES.notubiz
+    limit = args.get('limit', 10)
 
-        include_settings = args.get('include_settings', False)
+    broadcasts = client.get_upcoming_broadcasts(limit=limit)
 
-        org_details = client.get_organization_details()
-        org_id = client.get_organization_id()
+    result = []
+    for event in broadcasts:
+        result.append({
+            'id': event.get('id'),
+            'title': event.get('title') or event.get('name'),
+            'date': event.get('start_date') or event.get('date'),
+            'gremium': event.get('gremium', {}).get('name') if isinstance(event.get('gremium'), dict) else None,
+            'has_broadcast': True
+        })
 
-        result = {
-            "organization": org_details,
-            "organization_id": org_id,
-            "logo_url": client.get_organization_image_url('organisationLogo', size='200x200'),
-            "header_url": client.get_organization_image_url('dashboardheader', size='2000x320')
-        }
+    return {
+        "count": len(result),
+        "upcoming_broadcasts": result,
+        "note": "Vergaderingen met geplande live uitzendingen"
+    }
 
-        if include_settings:
-            result["dashboard_settings"] = client.get_dashboard_settings()
-            result["entity_settings"] = client.get_entity_type_settings(entity_types=['events'])
 
-        return result
+def _tool_get_meeting_video(args: dict) -> Any:
+    """Haal video/stream URL op voor een vergadering."""
+    client = SERVICES.notubiz
+    provider = SERVICES.meeting_provider
 
-    # ==================== Verkiezingsprogramma Handlers ====================
+    meeting_id = args.get('meeting_id')
 
-    elif name == "list_parties":
-        provider = get_election_program_provider()
-        # Initialize parties if not done yet
-        provider.initialize_parties()
-        parties = provider.get_parties(active_only=args.get('active_only', False))
-        return {
-            "count": len(parties),
-            "parties": [
-                {
-                    "id": p['id'],
-                    "name": p['name'],
-                    "abbreviation": p.get('abbreviation'),
-                    "active": bool(p.get('active')),
-                    "website": p.get('website_url'),
-                    "color": p.get('color')
-                }
-                for p in parties
-            ]
-        }
+    # Get meeting from database to find Notubiz ID
+    meeting = provider.get_meeting(meeting_id)
+    if not meeting:
+        return {"error": f"Vergadering {meeting_id} niet gevonden"}
 
-    elif name == "sync_parties":
-        provider = get_election_program_provider()
-        # Initialize known parties first if requested
-        if args.get('initialize_known', True):
-            provider.initialize_parties()
-        # Check for updates from web
-        result = provider.check_and_update_parties_from_web()
-        return result
-
-    elif name == "get_party_sync_status":
-        provider = get_election_program_provider()
-        return provider.get_party_sync_status()
-
-    elif name == "search_election_programs":
-        provider = get_election_program_provider()
-        results = provider.search_programs(
-            query=args['query'],
-            party=args.get('party'),
-            year_from=args.get('year_from'),
-            year_to=args.get('year_to'),
-            limit=args.get('limit', 20)
-        )
-        return {
-            "query": args['query'],
-            "count": len(results),
-            "results": [
-                {
-                    "program_id": r.get('id'),
-                    "party": r.get('party_name'),
-                    "abbreviation": r.get('abbreviation'),
-                    "year": r.get('election_year'),
-                    "snippet": r.get('snippet', '')[:500]
-                }
-                for r in results
-            ]
-        }
+    notubiz_id = meeting.get('notubiz_id') or str(meeting_id)
 
-    elif name == "compare_party_positions":
-        provider = get_election_program_provider()
-        result = provider.compare_positions(
-            topic=args['topic'],
-            parties=args.get('parties'),
-            year=args.get('year')
-        )
-        return result
+    # Try to get video URL from database first
+    video_url = meeting.get('video_url')
+    if not video_url:
+        # Try to fetch from Notubiz API
+        video_url = client.get_video_url_for_meeting(notubiz_id)
 
-    elif name == "get_party_history":
-        provider = get_election_program_provider()
-        history = provider.get_party_position_history(
-            party=args['party'],
-            topic=args['topic']
-        )
-        return {
-            "party": args['party'],
-            "topic": args['topic'],
-            "positions": history
-        }
+    return {
+        "meeting_id": meeting_id,
+        "title": meeting.get('title'),
+        "date": meeting.get('date'),
+        "video_url": video_url,
+        "has_video": video_url is not None,
+        "note": "Video URL kan direct afgespeeld worden of gebruikt voor transcriptie"
+    }
 
-    # ==================== Document Generatie Handlers ====================
-
-    elif name == "generate_motie":
-        generator = get_document_generator()
-        result = generator.generate_motie(
-            titel=args['titel'],
-            indieners=args['indieners'],
-            partijen=args['partijen'],
-            constateringen=args['constateringen'],
-            overwegingen=args['overwegingen'],
-            verzoeken=args['verzoeken'],
-            vergadering_datum=args.get('vergadering_datum'),
-            agendapunt=args.get('agendapunt'),
-            toelichting=args.get('toelichting')
-        )
-        return result
-
-    elif name == "generate_amendement":
-        generator = get_document_generator()
-        result = generator.generate_amendement(
-            titel=args['titel'],
-            indieners=args['indieners'],
-            partijen=args['partijen'],
-            raadsvoorstel_nummer=args['raadsvoorstel_nummer'],
-            raadsvoorstel_titel=args['raadsvoorstel_titel'],
-            wijzigingen=args['wijzigingen'],
-            toelichting=args.get('toelichting'),
-            vergadering_datum=args.get('vergadering_datum'),
-            agendapunt=args.get('agendapunt')
-        )
-        return result
-
-    # ==================== Standpunten Handlers ====================
-
-    elif name == "add_standpunt":
-        provider = get_standpunt_provider()
-        result = provider.add_standpunt(
-            party_id=args.get('party_id'),
-            raadslid_id=args.get('raadslid_id'),
-            topic=args['topic'],
-            position_summary=args['position_summary'],
-            position_text=args.get('position_text'),
-            stance=args.get('stance', 'onbekend'),
-            stance_strength=args.get('stance_strength'),
-            source_type=args['source_type'],
-            source_document_id=args.get('source_document_id'),
-            source_meeting_id=args.get('source_meeting_id'),
-            source_quote=args.get('source_quote'),
-            position_date=args.get('position_date'),
-            subtopic=args.get('subtopic'),
-            tags=args.get('tags')
-        )
-        return result
-
-    elif name == "search_standpunten":
-        provider = get_standpunt_provider()
-        results = provider.search_standpunten(
-            query=args.get('query'),
-            party_id=args.get('party_id'),
-            party_name=args.get('party_name'),
-            raadslid_id=args.get('raadslid_id'),
-            topic=args.get('topic'),
-            stance=args.get('stance'),
-            verified_only=args.get('verified_only', False),
-            limit=args.get('limit', 50)
-        )
-        return {
-            "count": len(results),
-            "standpunten": results
-        }
 
-    elif name == "compare_standpunten":
-        provider = get_standpunt_provider()
-        result = provider.compare_standpunten(
-            topic=args['topic'],
-            party_ids=args.get('party_ids'),
-            include_raadsleden=args.get('include_raadsleden', False)
-        )
-        return result
-
-    elif name == "get_standpunt_history":
-        provider = get_standpunt_provider()
-        history = provider.get_standpunt_history(
-            topic=args['topic'],
-            party_id=args.get('party_id'),
-            raadslid_id=args.get('raadslid_id')
-        )
-        return {
-            "topic": args['topic'],
-            "history": history
-        }
+def _tool_get_media_info(args: dict) -> Any:
+    """Haal media informatie (video/audio) op voor meerdere vergaderingen tegelijk."""
+    client = SERVICES.notubiz
 
-    elif name == "get_party_context":
-        provider = get_standpunt_provider()
-        context = provider.get_party_context(
-            party_id=args.get('party_id'),
-            party_name=args.get('party_name'),
-            topics=args.get('topics')
-        )
-        return context
+    event_ids = args.get('event_ids', [])
+    if not event_ids:
+        return {"error": "Geen event_ids opgegeven"}
 
-    elif name == "list_raadsleden":
-        provider = get_standpunt_provider()
-        raadsleden = provider.get_raadsleden(
-            party_id=args.get('party_id'),
-            active_only=args.get('active_only', True)
-        )
-        return {
-            "count": len(raadsleden),
-            "raadsleden": raadsleden
-        }
+    media_list = client.get_media(event_ids)
 
-    elif name == "add_raadslid":
-        provider = get_standpunt_provider()
-        result = provider.add_raadslid(
-            name=args['name'],
-            party_id=args.get('party_id'),
-            email=args.get('email'),
-            start_date=args.get('start_date'),
-            is_wethouder=args.get('is_wethouder', False),
-            is_fractievoorzitter=args.get('is_fractievoorzitter', False),
-            is_steunfractielid=args.get('is_steunfractielid', False)
-        )
-        return result
+    return {
+        "count": len(media_list),
+        "media": media_list,
+        "requested_events": len(event_ids)
+    }
 
-    elif name == "verify_standpunt":
-        provider = get_standpunt_provider()
-        result = provider.verify_standpunt(
-            standpunt_id=args['standpunt_id'],
-            verified=args.get('verified', True)
-        )
-        return result
-
-    elif name == "get_standpunt_topics":
-        provider = get_standpunt_provider()
-        topics = provider.get_topics(parent_id=args.get('parent_id'))
-        return {
-            "count": len(topics),
-            "topics": topics
-        }
 
-    elif name == "add_visit_report":
-        provider = get_visit_report_provider()
-        report_id = provider.add_manual_visit_report(
-            title=args['title'],
-            file_base64=args['file_base64'],
-            filename=args['filename'],
-            mime_type=args['mime_type'],
-            date=args.get('date'),
-            location=args.get('location'),
-            participants=args.get('participants'),
-            organizations=args.get('organizations'),
-            topics=args.get('topics'),
-            visit_type=args.get('visit_type'),
-            summary=args.get('summary'),
-            status=args.get('status'),
-            source_url=args.get('source_url'),
-            attachments=args.get('attachments')
-        )
-        return {"success": True, "visit_report_id": report_id}
-
-    elif name == "import_visit_reports":
-        provider = get_visit_report_provider()
-        created, skipped = provider.import_visit_reports_from_documents(
-            document_ids=args['document_ids'],
-            date=args.get('date'),
-            location=args.get('location'),
-            participants=args.get('participants'),
-            organizations=args.get('organizations'),
-            topics=args.get('topics'),
-            visit_type=args.get('visit_type'),
-            summary=args.get('summary'),
-            status=args.get('status')
-        )
-        return {"created": created, "skipped": skipped}
-
-    elif name == "list_visit_reports":
-        provider = get_visit_report_provider()
-        reports = provider.list_visit_reports(
-            date_from=args.get('date_from'),
-            date_to=args.get('date_to'),
-            status=args.get('status'),
-            visit_type=args.get('visit_type'),
-            limit=args.get('limit', 50),
-            offset=args.get('offset', 0)
-        )
-        return {"count": len(reports), "visit_reports": reports}
-
-    elif name == "get_visit_report":
-        provider = get_visit_report_provider()
-        report = provider.get_visit_report(args['visit_report_id'])
-        return report or {"error": "Visit report not found"}
-
-    elif name == "search_visit_reports":
-        provider = get_visit_report_provider()
-        results = provider.search_visit_reports(args['query'], limit=args.get('limit', 50))
-        return {"query": args['query'], "count": len(results), "results": results}
-
-    elif name == "update_visit_report":
-        provider = get_visit_report_provider()
-        success = provider.update_visit_report(
-            args['visit_report_id'],
-            title=args.get('title'),
-            date=args.get('date'),
-            location=args.get('location'),
-            participants=args.get('participants'),
-            organizations=args.get('organizations'),
-            topics=args.get('topics'),
-            visit_type=args.get('visit_type'),
-            summary=args.get('summary'),
-            status=args.get('status'),
-            source_url=args.get('source_url'),
-            attachments=args.get('attachments')
-        )
-        return {"success": success}
-
-    elif name == "delete_visit_report":
-        provider = get_visit_report_provider()
-        success = provider.delete_visit_report(args['visit_report_id'])
-        return {"success": success}
-
-    elif name == "link_visit_report_to_meeting":
-        provider = get_visit_report_provider()
-        success = provider.link_to_meeting(args['visit_report_id'], args['meeting_id'])
-        return {"success": success}
-
-    elif name == "index_visit_reports":
-        provider = get_visit_report_provider()
-        count = provider.index_visit_reports(args.get('visit_report_ids'))
-        return {"indexed_chunks": count}
-
-    # ==================== Transcriptie Handlers ====================
-
-    elif name == "transcribe_meeting":
-        from providers.transcription_provider import get_transcription_provider
-        provider = get_transcription_provider()
-        return provider.transcribe_meeting(args['meeting_id'])
-
-    elif name == "transcribe_url":
-        from providers.transcription_provider import get_transcription_provider
-        provider = get_transcription_provider()
-        return provider.transcribe_url(
-            args['url'],
-            source_type=args.get('source_type', 'direct')
-        )
+def _tool_get_organization_info(args: dict) -> Any:
+    """Haal organisatie informatie op inclusief logo URL en dashboard instellingen."""
+    client = SERVICES.notubiz
 
-    elif name == "search_transcriptions":
-        from providers.transcription_provider import get_transcription_provider
-        provider = get_transcription_provider()
-        results = provider.search_transcriptions(
-            args['query'],
-            limit=args.get('limit', 10)
-        )
-        return {
-            "count": len(results),
-            "results": results
-        }
+    include_settings = args.get('include_settings', False)
 
-    elif name == "get_transcription_status":
-        from providers.transcription_provider import get_transcription_provider
-        provider = get_transcription_provider()
-        pending = provider.get_pending_transcriptions_count()
-        return {
-            "pending_transcriptions": pending,
-            "whisper_model": provider.model_size
-        }
+    org_details = client.get_organization_details()
+    org_id = client.get_organization_id()
 
-    # ==================== Samenvatting Handlers ====================
+    result = {
+        "organization": org_details,
+        "organization_id": org_id,
+        "logo_url": client.get_organization_image_url('organisationLogo', size='200x200'),
+        "header_url": client.get_organization_image_url('dashboardheader', size='2000x320')
+    }
 
-    elif name == "get_document_for_summary":
-        from providers.summary_provider import get_summary_provider
-        provider = get_summary_provider()
-        return provider.get_document_for_summary(args['document_id'])
+    if include_settings:
+        result["dashboard_settings"] = client.get_dashboard_settings()
+        result["entity_settings"] = client.get_entity_type_settings(entity_types=['events'])
 
-    elif name == "save_document_summary":
-        from providers.summary_provider import get_summary_provider
-        provider = get_summary_provider()
-        return provider.save_document_summary(
-            args['document_id'],
-            args['summary_text'],
-            summary_type=args.get('summary_type', 'normaal')
-        )
+    return result
 
-    elif name == "get_meeting_for_summary":
-        from providers.summary_provider import get_summary_provider
-        provider = get_summary_provider()
-        return provider.get_meeting_for_summary(args['meeting_id'])
-
-    elif name == "save_meeting_summary":
-        from providers.summary_provider import get_summary_provider
-        provider = get_summary_provider()
-        return provider.save_meeting_summary(
-            args['meeting_id'],
-            args['summary_text'],
-            summary_type=args.get('summary_type', 'normaal')
-        )
 
-    # ==================== Dossier Handlers ====================
+# ==================== Verkiezingsprogramma Handlers ====================
 
-    elif name == "create_dossier":
-        from providers.dossier_provider import get_dossier_provider
-        provider = get_dossier_provider()
-        return provider.create_dossier(
-            args['topic'],
-            date_from=args.get('date_from'),
-            include_transcripts=args.get('include_transcripts', True)
-        )
+def _tool_list_parties(args: dict) -> Any:
+    """Lijst alle politieke partijen in Baarn (actief en historisch)."""
+    provider = SERVICES.election
+    # Initialize parties if not done yet
+    provider.initialize_parties()
+    parties = provider.get_parties(active_only=args.get('active_only', False))
+    return {
+        "count": len(parties),
+        "parties": [
+            {
+                "id": p['id'],
+                "name": p['name'],
+                "abbreviation": p.get('abbreviation'),
+                "active": bool(p.get('active')),
+                "website": p.get('website_url'),
+                "color": p.get('color')
+            }
+            for p in parties
+        ]
+    }
 
-    elif name == "get_dossier":
-        from providers.dossier_provider import get_dossier_provider
-        provider = get_dossier_provider()
-        return provider.get_dossier(args['dossier_id'])
-
-    elif name == "update_dossier":
-        from providers.dossier_provider import get_dossier_provider
-        provider = get_dossier_provider()
-        return provider.update_dossier(args['dossier_id'])
-
-    elif name == "list_dossiers":
-        from providers.dossier_provider import get_dossier_provider
-        provider = get_dossier_provider()
-        dossiers = provider.list_dossiers(status=args.get('status'))
-        return {
-            "count": len(dossiers),
-            "dossiers": dossiers
-        }
 
-    elif name == "get_dossier_timeline":
-        from providers.dossier_provider import get_dossier_provider
-        provider = get_dossier_provider()
-        return {
-            "markdown": provider.get_dossier_timeline_markdown(args['dossier_id'])
-        }
+def _tool_sync_parties(args: dict) -> Any:
+    """Synchroniseer politieke partijen door de gemeente Baarn website te checken voor actuele fracties."""
+    provider = SERVICES.election
+    # Initialize known parties first if requested
+    if args.get('initialize_known', True):
+        provider.initialize_parties()
+    # Check for updates from web
+    result = provider.check_and_update_parties_from_web()
+    return result
+
+
+def _tool_get_party_sync_status(args: dict) -> Any:
+    """Bekijk de huidige status van partij-synchronisatie: aantal actieve/historische partijen."""
+    provider = SERVICES.election
+    return provider.get_party_sync_status()
+
+
+def _tool_search_election_programs(args: dict) -> Any:
+    """Zoek in verkiezingsprogramma's van Baarnse politieke partijen."""
+    provider = SERVICES.election
+    results = provider.search_programs(
+        query=args['query'],
+        party=args.get('party'),
+        year_from=args.get('year_from'),
+        year_to=args.get('year_to'),
+        limit=args.get('limit', 20)
+    )
+    return {
+        "query": args['query'],
+        "count": len(results),
+        "results": [
+            {
+                "program_id": r.get('id'),
+                "party": r.get('party_name'),
+                "abbreviation": r.get('abbreviation'),
+                "year": r.get('election_year'),
+                "snippet": r.get('snippet', '')[:500]
+            }
+            for r in results
+        ]
+    }
+
+
+def _tool_compare_party_positions(args: dict) -> Any:
+    """Vergelijk standpunten van partijen over een specifiek onderwerp."""
+    provider = SERVICES.election
+    result = provider.compare_positions(
+        topic=args['topic'],
+        parties=args.get('parties'),
+        year=args.get('year')
+    )
+    return result
+
+
+def _tool_get_party_history(args: dict) -> Any:
+    """Bekijk historische ontwikkeling van een partijstandpunt over de jaren."""
+    provider = SERVICES.election
+    history = provider.get_party_position_history(
+        party=args['party'],
+        topic=args['topic']
+    )
+    return {
+        "party": args['party'],
+        "topic": args['topic'],
+        "positions": history
+    }
+
+
+# ==================== Document Generatie Handlers ====================
+
+def _tool_generate_motie(args: dict) -> Any:
+    """Genereer een motie document in Word formaat conform Notubiz standaard."""
+    generator = SERVICES.doc_gen
+    result = generator.generate_motie(
+        titel=args['titel'],
+        indieners=args['indieners'],
+        partijen=args['partijen'],
+        constateringen=args['constateringen'],
+        overwegingen=args['overwegingen'],
+        verzoeken=args['verzoeken'],
+        vergadering_datum=args.get('vergadering_datum'),
+        agendapunt=args.get('agendapunt'),
+        toelichting=args.get('toelichting')
+    )
+    return result
+
+
+def _tool_generate_amendement(args: dict) -> Any:
+    """Genereer een amendement document in Word formaat conform Notubiz standaard."""
+    generator = SERVICES.doc_gen
+    result = generator.generate_amendement(
+        titel=args['titel'],
+        indieners=args['indieners'],
+        partijen=args['partijen'],
+        raadsvoorstel_nummer=args['raadsvoorstel_nummer'],
+        raadsvoorstel_titel=args['raadsvoorstel_titel'],
+        wijzigingen=args['wijzigingen'],
+        toelichting=args.get('toelichting'),
+        vergadering_datum=args.get('vergadering_datum'),
+        agendapunt=args.get('agendapunt')
+    )
+    return result
+
+
+# ==================== Standpunten Handlers ====================
+
+def _tool_add_standpunt(args: dict) -> Any:
+    """Voeg een politiek standpunt toe voor een partij of raadslid."""
+    provider = SERVICES.standpunt
+    result = provider.add_standpunt(
+        party_id=args.get('party_id'),
+        raadslid_id=args.get('raadslid_id'),
+        topic=args['topic'],
+        position_summary=args['position_summary'],
+        position_text=args.get('position_text'),
+        stance=args.get('stance', 'onbekend'),
+        stance_strength=args.get('stance_strength'),
+        source_type=args['source_type'],
+        source_document_id=args.get('source_document_id'),
+        source_meeting_id=args.get('source_meeting_id'),
+        source_quote=args.get('source_quote'),
+        position_date=args.get('position_date'),
+        subtopic=args.get('subtopic'),
+        tags=args.get('tags')
+    )
+    return result
+
+
+def _tool_search_standpunten(args: dict) -> Any:
+    """Zoek standpunten met filters op partij, raadslid, topic, stance, etc."""
+    provider = SERVICES.standpunt
+    results = provider.search_standpunten(
+        query=args.get('query'),
+        party_id=args.get('party_id'),
+        party_name=args.get('party_name'),
+        raadslid_id=args.get('raadslid_id'),
+        topic=args.get('topic'),
+        stance=args.get('stance'),
+        verified_only=args.get('verified_only', False),
+        limit=args.get('limit', 50)
+    )
+    return {
+        "count": len(results),
+        "standpunten": results
+    }
+
+
+def _tool_compare_standpunten(args: dict) -> Any:
+    """Vergelijk standpunten van verschillende partijen over een specifiek onderwerp."""
+    provider = SERVICES.standpunt
+    result = provider.compare_standpunten(
+        topic=args['topic'],
+        party_ids=args.get('party_ids'),
+        include_raadsleden=args.get('include_raadsleden', False)
+    )
+    return result
+
+
+def _tool_get_standpunt_history(args: dict) -> Any:
+    """Bekijk de historische ontwikkeling van standpunten over een topic."""
+    provider = SERVICES.standpunt
+    history = provider.get_standpunt_history(
+        topic=args['topic'],
+        party_id=args.get('party_id'),
+        raadslid_id=args.get('raadslid_id')
+    )
+    return {
+        "topic": args['topic'],
+        "history": history
+    }
+
+
+def _tool_get_party_context(args: dict) -> Any:
+    """Haal context op van een partij voor party-aligned antwoorden."""
+    provider = SERVICES.standpunt
+    context = provider.get_party_context(
+        party_id=args.get('party_id'),
+        party_name=args.get('party_name'),
+        topics=args.get('topics')
+    )
+    return context
+
+
+def _tool_list_raadsleden(args: dict) -> Any:
+    """Lijst alle raadsleden, wethouders en steunfractieleden met optionele filters."""
+    provider = SERVICES.standpunt
+    raadsleden = provider.get_raadsleden(
+        party_id=args.get('party_id'),
+        active_only=args.get('active_only', True)
+    )
+    return {
+        "count": len(raadsleden),
+        "raadsleden": raadsleden
+    }
+
+
+def _tool_add_raadslid(args: dict) -> Any:
+    """Voeg een raadslid, wethouder of steunfractielid toe aan de database."""
+    provider = SERVICES.standpunt
+    result = provider.add_raadslid(
+        name=args['name'],
+        party_id=args.get('party_id'),
+        email=args.get('email'),
+        start_date=args.get('start_date'),
+        is_wethouder=args.get('is_wethouder', False),
+        is_fractievoorzitter=args.get('is_fractievoorzitter', False),
+        is_steunfractielid=args.get('is_steunfractielid', False)
+    )
+    return result
+
+
+def _tool_verify_standpunt(args: dict) -> Any:
+    """Markeer een standpunt als geverifieerd."""
+    provider = SERVICES.standpunt
+    result = provider.verify_standpunt(
+        standpunt_id=args['standpunt_id'],
+        verified=args.get('verified', True)
+    )
+    return result
+
+
+def _tool_get_standpunt_topics(args: dict) -> Any:
+    """Haal de lijst van standpunt-topics op."""
+    provider = SERVICES.standpunt
+    topics = provider.get_topics(parent_id=args.get('parent_id'))
+    return {
+        "count": len(topics),
+        "topics": topics
+    }
+
+
+def _tool_add_visit_report(args: dict) -> Any:
+    """Voeg een werkbezoek-verslag toe met handmatige upload (pad, URL of base64)."""
+    provider = SERVICES.visit
+    file_bytes = None
+    if not args.get('file_base64'):
+        # Read the file directly: no base64 text in the request to decode
+        file_bytes = SERVICES.doc_provider.read_upload(
+            file_path=args.get('file_path'),
+            file_url=args.get('file_url'),
+            sha256=args.get('file_sha256')
+        )
+    report_id = provider.add_manual_visit_report(
+        title=args['title'],
+        file_base64=args.get('file_base64'),
+        file_bytes=file_bytes,
+        filename=args['filename'],
+        mime_type=args['mime_type'],
+        date=args.get('date'),
+        location=args.get('location'),
+        participants=args.get('participants'),
+        organizations=args.get('organizations'),
+        topics=args.get('topics'),
+        visit_type=args.get('visit_type'),
+        summary=args.get('summary'),
+        status=args.get('status'),
+        source_url=args.get('source_url'),
+        attachments=args.get('attachments')
+    )
+    return {"success": True, "visit_report_id": report_id}
+
+
+def _tool_import_visit_reports(args: dict) -> Any:
+    """Maak werkbezoek-verslagen aan op basis van bestaande documenten."""
+    provider = SERVICES.visit
+    created, skipped = provider.import_visit_reports_from_documents(
+        document_ids=args['document_ids'],
+        date=args.get('date'),
+        location=args.get('location'),
+        participants=args.get('participants'),
+        organizations=args.get('organizations'),
+        topics=args.get('topics'),
+        visit_type=args.get('visit_type'),
+        summary=args.get('summary'),
+        status=args.get('status')
+    )
+    return {"created": created, "skipped": skipped}
+
+
+def _tool_list_visit_reports(args: dict) -> Any:
+    """Lijst werkbezoek-verslagen met filters."""
+    provider = SERVICES.visit
+    reports = provider.list_visit_reports(
+        date_from=args.get('date_from'),
+        date_to=args.get('date_to'),
+        status=args.get('status'),
+        visit_type=args.get('visit_type'),
+        limit=args.get('limit', 50),
+        offset=args.get('offset', 0)
+    )
+    return {"count": len(reports), "visit_reports": reports}
+
+
+def _tool_get_visit_report(args: dict) -> Any:
+    """Haal een werkbezoek-verslag op."""
+    provider = SERVICES.visit
+    report = provider.get_visit_report(args['visit_report_id'])
+    return report or {"error": "Visit report not found"}
+
+
+def _tool_search_visit_reports(args: dict) -> Any:
+    """Zoek in werkbezoek-verslagen (incl. gekoppelde document tekst)."""
+    provider = SERVICES.visit
+    results = provider.search_visit_reports(args['query'], limit=args.get('limit', 50))
+    return {"query": args['query'], "count": len(results), "results": results}
+
+
+def _tool_update_visit_report(args: dict) -> Any:
+    """Werk metadata van een werkbezoek-verslag bij."""
+    provider = SERVICES.visit
+    success = provider.update_visit_report(
+        args['visit_report_id'],
+        title=args.get('title'),
+        date=args.get('date'),
+        location=args.get('location'),
+        participants=args.get('participants'),
+        organizations=args.get('organizations'),
+        topics=args.get('topics'),
+        visit_type=args.get('visit_type'),
+        summary=args.get('summary'),
+        status=args.get('status'),
+        source_url=args.get('source_url'),
+        attachments=args.get('attachments')
+    )
+    return {"success": success}
+
+
+def _tool_delete_visit_report(args: dict) -> Any:
+    """Archiveer (soft delete) een werkbezoek-verslag."""
+    provider = SERVICES.visit
+    success = provider.delete_visit_report(args['visit_report_id'])
+    return {"success": success}
+
+
+def _tool_link_visit_report_to_meeting(args: dict) -> Any:
+    """Koppel een werkbezoek-verslag aan een vergadering."""
+    provider = SERVICES.visit
+    success = provider.link_to_meeting(args['visit_report_id'], args['meeting_id'])
+    return {"success": success}
+
+
+def _tool_index_visit_reports(args: dict) -> Any:
+    """Indexeer gekoppelde documenten van werkbezoek-verslagen."""
+    provider = SERVICES.visit
+    count = provider.index_visit_reports(args.get('visit_report_ids'))
+    return {"indexed_chunks": count}
+
+
+# ==================== Transcriptie Handlers ====================
+
+@functools.cache
+def _transcription_provider():
+    """Transcription provider, imported on first use (its module imports whisper)."""
+    from providers.transcription_provider import get_transcription_provider
+    return get_transcription_provider()
+
+
+def _tool_transcribe_meeting(args: dict) -> Any:
+    """Transcribeer de video van een vergadering met AI (Whisper)."""
+    provider = _transcription_provider()
+    return provider.transcribe_meeting(args['meeting_id'], progress=_progress.get())
+
+
+def _tool_transcribe_url(args: dict) -> Any:
+    """Transcribeer video/audio van een URL (YouTube, direct link)."""
+    provider = _transcription_provider()
+    return provider.transcribe_url(
+        args['url'],
+        source_type=args.get('source_type', 'direct')
+    )
+
+
+def _tool_search_transcriptions(args: dict) -> Any:
+    """Zoek in video/audio transcripties met timestamps."""
+    provider = _transcription_provider()
+    results = provider.search_transcriptions(
+        args['query'],
+        limit=args.get('limit', 10)
+    )
+    return {
+        "count": len(results),
+        "results": results
+    }
+
+
+def _tool_get_transcription_status(args: dict) -> Any:
+    """Bekijk hoeveel vergaderingen nog getranscribeerd moeten worden."""
+    provider = _transcription_provider()
+    pending = provider.get_pending_transcriptions_count()
+    return {
+        "pending_transcriptions": pending,
+        "whisper_model": provider.model_size
+    }
+
+
+# ==================== Samenvatting Handlers ====================
+
+def _tool_get_document_for_summary(args: dict) -> Any:
+    """Haal document content op voor het maken van een samenvatting."""
+    provider = SERVICES.summary
+    return provider.get_document_for_summary(
+        args['document_id'],
+        chunk_index=args.get('chunk_index', 0),
+        chunk_size=args.get('chunk_size', 50000)
+    )
+
+
+def _tool_save_document_summary(args: dict) -> Any:
+    """Sla een gegenereerde samenvatting op voor een document."""
+    provider = SERVICES.summary
+    return provider.save_document_summary(
+        args['document_id'],
+        args['summary_text'],
+        summary_type=args.get('summary_type', 'normaal')
+    )
+
+
+def _tool_get_meeting_for_summary(args: dict) -> Any:
+    """Haal vergadering content op voor het maken van een samenvatting."""
+    provider = SERVICES.summary
+    return provider.get_meeting_for_summary(args['meeting_id'])
+
+
+def _tool_save_meeting_summary(args: dict) -> Any:
+    """Sla een gegenereerde samenvatting op voor een vergadering."""
+    provider = SERVICES.summary
+    return provider.save_meeting_summary(
+        args['meeting_id'],
+        args['summary_text'],
+        summary_type=args.get('summary_type', 'normaal')
+    )
+
+
+# ==================== Dossier Handlers ====================
+
+def _tool_create_dossier(args: dict) -> Any:
+    """Maak een automatisch dossier/tijdlijn voor een onderwerp."""
+    provider = SERVICES.dossier
+    return provider.create_dossier(
+        args['topic'],
+        date_from=args.get('date_from'),
+        include_transcripts=args.get('include_transcripts', True)
+    )
+
+
+def _tool_get_dossier(args: dict) -> Any:
+    """Haal een dossier op met alle tijdlijn items."""
+    provider = SERVICES.dossier
+    return provider.get_dossier(args['dossier_id'])
+
+
+def _tool_update_dossier(args: dict) -> Any:
+    """Update een bestaand dossier met nieuwe informatie."""
+    provider = SERVICES.dossier
+    return provider.update_dossier(args['dossier_id'])
+
+
+def _tool_list_dossiers(args: dict) -> Any:
+    """Lijst alle beschikbare dossiers."""
+    provider = SERVICES.dossier
+    dossiers = provider.list_dossiers(status=args.get('status'))
+    return {
+        "count": len(dossiers),
+        "dossiers": dossiers
+    }
+
+
+def _tool_get_dossier_timeline(args: dict) -> Any:
+    """Haal een dossier tijdlijn op als markdown tekst."""
+    provider = SERVICES.dossier
+    return {
+        "markdown": provider.get_dossier_timeline_markdown(args['dossier_id'])
+    }
+
+
+# Tool naam -> (synchrone) handler; dispatch is een enkele dict lookup
+_TOOL_HANDLERS = {
+    "get_meetings": _tool_get_meetings,
+    "get_meeting_details": _tool_get_meeting_details,
+    "get_meetings_bulk": _tool_get_meetings_bulk,
+    "get_agenda_items": _tool_get_agenda_items,
+    "get_document": _tool_get_document,
+    "search_documents": _tool_search_documents,
+    "semantic_search": _tool_semantic_search,
+    "sync_data": _tool_sync_data,
+    "add_annotation": _tool_add_annotation,
+    "get_annotations": _tool_get_annotations,
+    "get_gremia": _tool_get_gremia,
+    "get_statistics": _tool_get_statistics,
+    "get_notubiz_status": _tool_get_notubiz_status,
+    "get_coalitie_akkoord": _tool_get_coalitie_akkoord,
+    "update_coalitie_afspraak": _tool_update_coalitie_afspraak,
+    "search_and_sync": _tool_search_and_sync,
+    "get_upcoming_meetings": _tool_get_upcoming_meetings,
+    "get_upcoming_broadcasts": _tool_get_upcoming_broadcasts,
+    "get_meeting_video": _tool_get_meeting_video,
+    "get_media_info": _tool_get_media_info,
+    "get_organization_info": _tool_get_organization_info,
+    "list_parties": _tool_list_parties,
+    "sync_parties": _tool_sync_parties,
+    "get_party_sync_status": _tool_get_party_sync_status,
+    "search_election_programs": _tool_search_election_programs,
+    "compare_party_positions": _tool_compare_party_positions,
+    "get_party_history": _tool_get_party_history,
+    "generate_motie": _tool_generate_motie,
+    "generate_amendement": _tool_generate_amendement,
+    "add_standpunt": _tool_add_standpunt,
+    "search_standpunten": _tool_search_standpunten,
+    "compare_standpunten": _tool_compare_standpunten,
+    "get_standpunt_history": _tool_get_standpunt_history,
+    "get_party_context": _tool_get_party_context,
+    "list_raadsleden": _tool_list_raadsleden,
+    "add_raadslid": _tool_add_raadslid,
+    "verify_standpunt": _tool_verify_standpunt,
+    "get_standpunt_topics": _tool_get_standpunt_topics,
+    "add_visit_report": _tool_add_visit_report,
+    "import_visit_reports": _tool_import_visit_reports,
+    "list_visit_reports": _tool_list_visit_reports,
+    "get_visit_report": _tool_get_visit_report,
+    "search_visit_reports": _tool_search_visit_reports,
+    "update_visit_report": _tool_update_visit_report,
+    "delete_visit_report": _tool_delete_visit_report,
+    "link_visit_report_to_meeting": _tool_link_visit_report_to_meeting,
+    "index_visit_reports": _tool_index_visit_reports,
+    "transcribe_meeting": _tool_transcribe_meeting,
+    "transcribe_url": _tool_transcribe_url,
+    "search_transcriptions": _tool_search_transcriptions,
+    "get_transcription_status": _tool_get_transcription_status,
+    "get_document_for_summary": _tool_get_document_for_summary,
+    "save_document_summary": _tool_save_document_summary,
+    "get_meeting_for_summary": _tool_get_meeting_for_summary,
+    "save_meeting_summary": _tool_save_meeting_summary,
+    "create_dossier": _tool_create_dossier,
+    "get_dossier": _tool_get_dossier,
+    "update_dossier": _tool_update_dossier,
+    "list_dossiers": _tool_list_dossiers,
+    "get_dossier_timeline": _tool_get_dossier_timeline,
+}
 
-    else:
+
+async def handle_tool(name: str, args: dict) -> Any:
+    """Route tool calls to handlers."""
+    if name == "batch":
+        return await _handle_batch(args or {})
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return await _run_blocking(handler, args or {})
+
+
+async def _handle_batch(args: dict) -> Any:
+    """Run several tool calls concurrently; a failing call only fails its own entry."""
+    calls = args.get('calls') or []
+    if len(calls) > BATCH_MAX_CALLS:
+        raise ValueError(f"A batch holds at most {BATCH_MAX_CALLS} calls")
+
+    async def run(call: dict) -> Any:
+        if not isinstance(call, dict):
+            raise ValueError("Each batch call must be an object with 'name' and 'arguments'")
+        name = call.get('name')
+        if name == "batch":
+            raise ValueError("Nested batch calls are not supported")
+        return await handle_tool(name, call.get('arguments') or {})
+
+    results = await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+    entries = []
+    for call, result in zip(calls, results):
+        name = call.get('name') if isinstance(call, dict) else None
+        if isinstance(result, Exception):
+            entries.append({"name": name, "error": str(result)})
+        else:
+            entries.append({"name": name, "result": result})
+    return {"count": len(entries), "results": entries}
 
 
 # ==================== Main ====================
 
+class _BatchedStdout:
+    """
+    Async stdout for stdio_server() that coalesces outgoing messages.
+
+    The SDK writer calls write() + flush() per message. write() only
+    buffers and flush() starts a single flusher task, so messages queued
+    while a write is in progress go out together in the next write call
+    instead of costing two thread hops and a syscall each. A failed
+    write (e.g. the client went away) is raised from the next write(),
+    flush() or aclose() call.
+    """
+
+    def __init__(self, raw=None):
+        self._raw = raw or sys.stdout.buffer
+        self._pending: list[bytes] = []
+        self._flusher: asyncio.Task | None = None
+
+    def _raise_failed(self):
+        flusher = self._flusher
+        if flusher is not None and flusher.done():
+            self._flusher = None
+            if not flusher.cancelled() and flusher.exception() is not None:
+                raise flusher.exception()
+
+    async def write(self, data: str):
+        self._raise_failed()
+        self._pending.append(data.encode('utf-8'))
+
+    async def flush(self):
+        self._raise_failed()
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_pending())
+
+    async def _flush_pending(self):
+        while self._pending:
+            data = b''.join(self._pending)
+            self._pending.clear()
+            await asyncio.to_thread(self._write_all, data)
+
+    def _write_all(self, data: bytes):
+        self._raw.write(data)
+        self._raw.flush()
+
+    async def aclose(self):
+        """Write whatever is still buffered."""
+        if self._flusher is not None:
+            flusher, self._flusher = self._flusher, None
+            await flusher
+        await self._flush_pending()
+
+
 async def main():
     """Run the MCP server."""
     logger.info(f'Starting {Config.SERVER_NAME} v{Config.SERVER_VERSION}')
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    # Start the initial sync right away so the handshake and listings don't wait for it
+    sync_task = asyncio.create_task(_background_initial_sync())
+
+    stdout = _BatchedStdout()
+    try:
+        async with stdio_server(stdout=stdout) as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+        await stdout.aclose()
+    finally:
+        sync_task.cancel()
 
 
 if __name__ == "__main__":
@@ -13,13 +13,17 @@ Storage modes:
 """
 
 import base64
+import hashlib
 import io
+import ipaddress
 import os
 import requests
+import socket
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urlparse, unquote
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse, unquote
 
 from core.config import Config
 from core.database import Database, get_database
@@ -244,12 +248,22 @@ class DocumentProvider:
             except Exception:
                 pass
 
-    def download_pending_documents(self, limit: int = None) -> Tuple[int, int]:
+    def download_pending_documents(
+        self,
+        limit: int = None,
+        workers: int = None,
+        progress: Callable[[str], None] = None,
+        on_downloaded: Callable[[int], None] = None
+    ) -> Tuple[int, int]:
         """
         Download alle pending documents.
 
         Args:
             limit: Maximum number of documents to download
+            workers: Parallel downloads (default: Config.DOWNLOAD_WORKERS)
+            progress: Optional callback, called with a message after each document
+            on_downloaded: Optional callback, called with the document ID of each
+                successful download while the remaining downloads continue
 
         Returns:
             Tuple of (successful, failed) downloads
@@ -257,16 +271,32 @@ class DocumentProvider:
         pending = self.db.get_documents_pending_download()
         if limit:
             pending = pending[:limit]
+        workers = max(1, workers or Config.DOWNLOAD_WORKERS)
 
-        with LogContext(logger, 'download_pending', count=len(pending)):
+        with LogContext(logger, 'download_pending', count=len(pending), workers=workers):
+            doc_ids = [doc['id'] for doc in pending]
             success = 0
             failed = 0
 
-            for doc in pending:
-                if self.download_document(doc['id']):
+            def record(doc_id: int, ok: bool):
+                nonlocal success, failed
+                if ok:
                     success += 1
+                    if on_downloaded:
+                        on_downloaded(doc_id)
                 else:
                     failed += 1
+                if progress:
+                    progress(f'Downloaded {success + failed}/{len(doc_ids)} documents')
+
+            if workers > 1 and len(doc_ids) > 1:
+                # Downloads wait on the network: overlap them in threads
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='download') as executor:
+                    for doc_id, ok in zip(doc_ids, executor.map(self.download_document, doc_ids)):
+                        record(doc_id, ok)
+            else:
+                for doc_id in doc_ids:
+                    record(doc_id, self.download_document(doc_id))
 
             logger.info(f'Downloaded {success}/{len(pending)} documents')
             return success, failed
@@ -280,7 +310,23 @@ class DocumentProvider:
         source_url: str = None
     ) -> int:
         """Create a document from base64 file data and extract content."""
-        file_bytes = base64.b64decode(file_base64)
+        return self.create_document_from_bytes(
+            title=title,
+            filename=filename,
+            mime_type=mime_type,
+            file_bytes=base64.b64decode(file_base64),
+            source_url=source_url
+        )
+
+    def create_document_from_bytes(
+        self,
+        title: str,
+        filename: str,
+        mime_type: str,
+        file_bytes: bytes,
+        source_url: str = None
+    ) -> int:
+        """Create a document from raw file data and extract content."""
         if len(file_bytes) > self.max_file_size_bytes:
             raise ValueError('File too large for DB storage')
 
@@ -317,6 +363,77 @@ class DocumentProvider:
         self.db.update_document_status(document_id, 'stored')
         return document_id
 
+    def read_upload(self, file_path: str = None, file_url: str = None, sha256: str = None) -> bytes:
+        """
+        Read an uploaded file from the upload directory or a URL (instead of base64 data).
+
+        Args:
+            file_path: Path of a file inside Config.UPLOAD_DIR (absolute or relative to it)
+            file_url: Public http(s) URL to download the file from
+            sha256: Optional hex digest the file must match
+
+        Returns:
+            The file contents
+
+        Raises:
+            ValueError: Path outside the upload directory, URL not allowed,
+                file too large or sha256 mismatch
+        """
+        if file_path:
+            path = self._resolve_upload_path(file_path)
+            if path.stat().st_size > self.max_file_size_bytes:
+                raise ValueError('File too large for DB storage')
+            file_bytes = path.read_bytes()
+        elif file_url:
+            file_bytes = self._download_upload(file_url)
+        else:
+            raise ValueError('Either file_path or file_url is required')
+
+        if sha256 and hashlib.sha256(file_bytes).hexdigest() != sha256.lower():
+            raise ValueError('File does not match sha256')
+        return file_bytes
+
+    def _resolve_upload_path(self, file_path: str) -> Path:
+        """Resolve file_path (following symlinks) and require it to stay inside the upload directory."""
+        upload_dir = Config.UPLOAD_DIR.resolve()
+        path = (upload_dir / file_path).resolve()
+        if not path.is_relative_to(upload_dir) or not path.is_file():
+            raise ValueError(f'file_path must name a file in {upload_dir}')
+        return path
+
+    def _check_public_url(self, url: str):
+        """Reject URLs that are not http(s) or whose host resolves to a non-public address."""
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+            raise ValueError('file_url must be an http(s) URL')
+        try:
+            infos = socket.getaddrinfo(parsed.hostname, parsed.port or None, proto=socket.IPPROTO_TCP)
+        except socket.gaierror as e:
+            raise ValueError(f'file_url host cannot be resolved: {e}')
+        for info in infos:
+            address = ipaddress.ip_address(info[4][0].split('%')[0])
+            if not address.is_global:
+                raise ValueError('file_url must point to a public host')
+
+    def _download_upload(self, url: str, max_redirects: int = 5) -> bytes:
+        """Download a public http(s) URL, checking every redirect target as well."""
+        for _ in range(max_redirects + 1):
+            self._check_public_url(url)
+            response = requests.get(url, timeout=60, stream=True, allow_redirects=False)
+            if response.is_redirect:
+                url = urljoin(url, response.headers['Location'])
+                response.close()
+                continue
+            response.raise_for_status()
+            buffer = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                buffer += chunk
+                if len(buffer) > self.max_file_size_bytes:
+                    response.close()
+                    raise ValueError('File too large for DB storage')
+            return bytes(buffer)
+        raise ValueError('file_url redirects too often')
+
     def download_document(self, document_id: int) -> bool:
         """
         Download a single document, extract text, optionally delete PDF.
@@ -798,9 +915,12 @@ class DocumentProvider:
 
         return stats
 
-    def get_document(self, document_id: int) -> Optional[Dict]:
-        """Get document with content."""
-        doc = self.db.get_document(document_id)
+    def get_document(self, document_id: int, text_limit: int = None) -> Optional[Dict]:
+        """Get document with content (text cut off at text_limit characters if given)."""
+        if text_limit is not None:
+            doc = self.db.get_document_excerpt(document_id, text_limit)
+        else:
+            doc = self.db.get_document(document_id)
         if not doc:
             return None
 
@@ -857,6 +977,21 @@ class DocumentProvider:
 
         return docs
 
+    def search_document_matches(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        Search documents like search_documents, returning only id, title,
+        url and match_type (the text itself is not loaded).
+        """
+        docs = self.db.search_document_matches(query, limit=limit)
+        query_lower = query.lower()
+        for doc in docs:
+            doc['match_type'] = []
+            if query_lower in (doc.get('title') or '').lower():
+                doc['match_type'].append('title')
+            if doc.pop('content_match'):
+                doc['match_type'].append('content')
+        return docs
+
     def get_document_content(self, document_id: int) -> Optional[str]:
         """Get extracted text content of a document."""
         doc = self.db.get_document(document_id)
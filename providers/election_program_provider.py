@@ -414,8 +414,8 @@ class ElectionProgramProvider:
         if not party_obj:
             return []
 
-        # Zoek in alle programma's van deze partij
-        programs = self.db.get_election_programs(party_id=party_obj['id'])
+        # Alleen programma's van deze partij waarin het onderwerp voorkomt
+        programs = self.db.get_election_programs(party_id=party_obj['id'], search=topic)
 
         history = []
         for program in programs:
@@ -395,6 +395,14 @@ class MeetingProvider:
 
         return meeting
 
+    def get_meeting_bundle(self, meeting_id: int) -> Optional[Dict]:
+        """Get a meeting with agenda item titles and document list (no texts, no annotations)."""
+        return self.db.get_meeting_bundle(meeting_id)
+
+    def get_meetings_bulk(self, meeting_ids: List[int]) -> List[Dict]:
+        """Get several meetings like get_meeting_bundle, in the order of meeting_ids."""
+        return self.db.get_meeting_bundles(meeting_ids)
+
     def get_agenda_items(self, meeting_id: int) -> List[Dict]:
         """Get agenda items for a meeting."""
         return self.db.get_agenda_items(meeting_id)
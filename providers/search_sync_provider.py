@@ -9,7 +9,7 @@ Dit is efficiënter dan een volledige sync wanneer je zoekt naar specifieke doss
 
 from datetime import date
 import requests
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from core.config import Config
 from core.database import get_database
@@ -43,7 +43,8 @@ class SearchSyncProvider:
         end_date: str = None,
         download_docs: bool = True,
         index_docs: bool = True,
-        limit: int = 100
+        limit: int = 100,
+        progress: Callable[[str], None] = None
     ) -> Dict:
         """
         Zoek naar een onderwerp en synchroniseer relevante vergaderingen.
@@ -55,6 +56,7 @@ class SearchSyncProvider:
             download_docs: Download documenten en extraheer tekst
             index_docs: Indexeer documenten voor semantic search
             limit: Maximum aantal vergaderingen om te syncen
+            progress: Optionele callback met een voortgangsbericht per stap
 
         Returns:
             Dict met resultaten:
@@ -97,6 +99,8 @@ class SearchSyncProvider:
                     date_to=end_date
                 )
             logger.info(f'Found {len(all_events)} total events')
+            if progress:
+                progress(f'Fetched {len(all_events)} events')
 
             # Step 2: Filter events matching the query
             query_lower = query.lower()
@@ -139,7 +143,7 @@ class SearchSyncProvider:
                 results['meetings_found'] = len(matching_events)
 
             # Step 3: Sync matching meetings
-            for event in matching_events:
+            for i, event in enumerate(matching_events, 1):
                 try:
                     meeting_id = self._sync_single_meeting(event)
                     if meeting_id:
@@ -147,6 +151,8 @@ class SearchSyncProvider:
                 except Exception as e:
                     logger.error(f'Error syncing meeting: {e}')
                     results['errors'].append(str(e))
+                if progress:
+                    progress(f'Synced {i}/{len(matching_events)} meetings')
 
             # Step 3b: Web search documents (raadsinformatie.nl) and store in DB
             raadsinfo = self._search_raadsinformatie_documents(query, limit=limit)
@@ -160,7 +166,7 @@ class SearchSyncProvider:
             )
             if download_docs and download_needed:
                 logger.info('Downloading documents for synced meetings...')
-                success, failed = self.doc_provider.download_pending_documents()
+                success, failed = self.doc_provider.download_pending_documents(progress=progress)
                 results['documents_downloaded'] = success
 
                 # Extract text
@@ -177,6 +183,8 @@ class SearchSyncProvider:
                     index = get_document_index()
                     indexed, chunks = index.index_all_documents()
                     results['documents_indexed'] = indexed
+                    if progress:
+                        progress(f'Indexed {indexed} documents, {chunks} chunks')
                 except Exception as e:
                     logger.error(f'Indexing error: {e}')
                     results['errors'].append(f'Indexing: {str(e)}')
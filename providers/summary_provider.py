@@ -17,6 +17,9 @@ from shared.logging_config import get_logger, LogContext
 
 logger = get_logger('summary-provider')
 
+# Aantal tekens document tekst per get_document_for_summary aanroep
+SUMMARY_CHUNK_SIZE = 50000
+
 
 class SummaryProvider:
     """
@@ -33,32 +36,51 @@ class SummaryProvider:
         self.db = db or get_database()
         logger.info('SummaryProvider initialized')
 
-    def get_document_for_summary(self, document_id: int) -> Dict:
+    def get_document_for_summary(
+        self,
+        document_id: int,
+        chunk_index: int = 0,
+        chunk_size: int = SUMMARY_CHUNK_SIZE
+    ) -> Dict:
         """
         Haal document content op voor samenvatting.
 
+        Lange teksten worden in delen van chunk_size tekens opgehaald;
+        alleen het gevraagde deel wordt uit de database gelezen.
+
         Args:
             document_id: Document ID
+            chunk_index: Welk deel van de tekst (0 = begin)
+            chunk_size: Aantal tekens per deel
 
         Returns:
             Dict met document info en tekst voor samenvatting
         """
-        doc = self.db.get_document(document_id)
+        chunk_size = max(1, chunk_size)
+        doc = self.db.get_document_excerpt(
+            document_id, chunk_size, text_offset=max(0, chunk_index) * chunk_size
+        )
         if not doc:
             return {'error': f'Document {document_id} niet gevonden'}
 
-        text_content = doc.get('text_content', '')
-        if not text_content:
+        text_length = doc.get('text_length') or 0
+        if not text_length:
             return {'error': f'Document {document_id} heeft geen tekst content'}
 
+        total_chunks = -(-text_length // chunk_size)
+        if not 0 <= chunk_index < total_chunks:
+            return {'error': f'chunk_index {chunk_index} buiten bereik (0-{total_chunks - 1})'}
+
         # Check for existing summary
         existing = self.db.get_summary('document', document_id)
 
         return {
             'document_id': document_id,
             'title': doc.get('title', ''),
-            'text_content': text_content,
-            'text_length': len(text_content),
+            'text_content': doc.get('text_content', ''),
+            'text_length': text_length,
+            'chunk_index': chunk_index,
+            'total_chunks': total_chunks,
             'existing_summary': existing.get('summary_text') if existing else None,
             'meeting_id': doc.get('meeting_id')
         }
@@ -10,7 +10,7 @@ import os
 import tempfile
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from core.config import Config
@@ -167,12 +167,13 @@ class TranscriptionProvider:
             'duration': result.get('segments', [{}])[-1].get('end', 0) if result.get('segments') else 0
         }
 
-    def transcribe_meeting(self, meeting_id: int) -> Dict:
+    def transcribe_meeting(self, meeting_id: int, progress: Callable[[str], None] = None) -> Dict:
         """
         Transcribeer de video van een vergadering.
 
         Args:
             meeting_id: Database ID van de vergadering
+            progress: Optional callback, called with a message at each stage
 
         Returns:
             Dict met transcriptie resultaat
@@ -208,6 +209,8 @@ class TranscriptionProvider:
 
         with LogContext(logger, 'transcribe_meeting', meeting_id=meeting_id):
             try:
+                if progress:
+                    progress(f'Downloading and transcribing video of meeting {meeting_id}')
                 # Bepaal source type
                 if 'youtube.com' in video_url or 'youtu.be' in video_url:
                     result = self.transcribe_youtube(video_url)
@@ -233,6 +236,8 @@ class TranscriptionProvider:
                 )
 
                 # Index embeddings voor semantic search
+                if progress:
+                    progress(f'Transcribed {int(result.get("duration", 0))} seconds, indexing transcript')
                 self._index_transcription(transcription_id, result['text'], result.get('segments', []))
 
                 return {
@@ -412,20 +417,22 @@ class TranscriptionProvider:
                 return self.db.search_transcriptions(query, limit)
 
             index = get_document_index()
-            query_embedding = index._get_embedding(query)
+            query_embedding = index.embed_query(query)
 
             # Get all transcription embeddings
             embeddings = self.db.get_all_transcription_embeddings()
             if not embeddings:
                 return []
 
-            # Calculate similarities
-            results = []
-            for emb_data in embeddings:
-                doc_embedding = index._bytes_to_embedding(emb_data['embedding'])
-                similarity = index._cosine_similarity(query_embedding, doc_embedding)
+            # One matrix-vector product; rows are normalized here because
+            # segments indexed before normalized encoding are stored as-is
+            matrix = np.stack([index._bytes_to_embedding(e['embedding']) for e in embeddings])
+            norms = np.linalg.norm(matrix, axis=1)
+            norms[norms == 0] = 1.0
+            similarities = (matrix @ query_embedding) / norms
 
-                results.append({
+            results = [
+                {
                     'transcription_id': emb_data['transcription_id'],
                     'meeting_id': emb_data['meeting_id'],
                     'meeting_title': emb_data.get('meeting_title', ''),
@@ -433,8 +440,10 @@ class TranscriptionProvider:
                     'chunk_text': emb_data['chunk_text'],
                     'timestamp_start': emb_data.get('timestamp_start'),
                     'timestamp_end': emb_data.get('timestamp_end'),
-                    'similarity': similarity
-                })
+                    'similarity': float(similarity)
+                }
+                for emb_data, similarity in zip(embeddings, similarities)
+            ]
 
             # Sort by similarity
             results.sort(key=lambda x: x['similarity'], reverse=True)
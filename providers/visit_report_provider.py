@@ -4,6 +4,7 @@
 Visit Report provider for werkbezoeken en vergelijkbare verslagen.
 """
 
+import base64
 import sqlite3
 from typing import Dict, List, Optional, Tuple
 
@@ -26,17 +27,20 @@ class VisitReportProvider:
     def add_manual_visit_report(
         self,
         title: str,
-        file_base64: str,
+        file_base64: Optional[str],
         filename: str,
         mime_type: str,
+        file_bytes: bytes = None,
         **metadata
     ) -> int:
-        """Create a manual visit report with an uploaded file."""
-        document_id = self.document_provider.create_document_from_base64(
+        """Create a manual visit report with an uploaded file (raw bytes or base64)."""
+        if file_bytes is None:
+            file_bytes = base64.b64decode(file_base64)
+        document_id = self.document_provider.create_document_from_bytes(
             title=title,
             filename=filename,
             mime_type=mime_type,
-            file_base64=file_base64,
+            file_bytes=file_bytes,
             source_url=metadata.get('source_url')
         )
         return self.db.add_visit_report(